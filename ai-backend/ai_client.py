@@ -5,9 +5,17 @@ Supports Google AI (Gemini) as primary, Cerebras as optional fallback
 
 import os
 from typing import Optional, Dict, Any, List
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import json
 
+# Try to import httpx (pooled keep-alive connections for async calls)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
 # Try to import Google Generative AI (Gemini)
 try:
     import google.generativeai as genai
@@ -25,6 +33,63 @@ except ImportError:
     GenerativeModel = None
 
 
+def _mock_response(text: str):
+    """Wrap generated text in an OpenAI-compatible response object"""
+    class MockChoice:
+        def __init__(self, text):
+            self.message = MockMessage(text)
+    
+    class MockMessage:
+        def __init__(self, text):
+            self.content = text
+    
+    class MockResponse:
+        def __init__(self, text):
+            self.choices = [MockChoice(text)]
+    
+    return MockResponse(text)
+
+
+def _mock_chunk(text: str):
+    """Wrap a streamed text delta in an OpenAI-compatible chunk object"""
+    class MockDelta:
+        def __init__(self, text):
+            self.content = text
+    
+    class MockChunkChoice:
+        def __init__(self, text):
+            self.delta = MockDelta(text)
+    
+    class MockChunk:
+        def __init__(self, text):
+            self.choices = [MockChunkChoice(text)]
+    
+    return MockChunk(text)
+
+
+def _generation_config(temperature: float, max_tokens: int, response_format: Optional[Dict] = None) -> Dict:
+    """Gemini generation config; OpenAI-style JSON mode maps to a JSON response MIME type"""
+    config = {
+        "temperature": temperature,
+        "max_output_tokens": max_tokens,
+    }
+    if response_format and response_format.get("type") in ("json_object", "json_schema"):
+        config["response_mime_type"] = "application/json"
+    return config
+
+
+async def _mock_stream(response):
+    """Convert a Gemini streaming response into OpenAI-compatible chunks"""
+    async for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            # Chunk without text parts (e.g. a final safety/finish-reason chunk)
+            continue
+        if text:
+            yield _mock_chunk(text)
+
+
 class UnifiedAIClient:
     """
     Unified AI client that supports:
@@ -36,6 +101,7 @@ class UnifiedAIClient:
         self.provider = None
         self.google_client = None
         self.cerebras_client = None
+        self.cerebras_async_client = None
         self.model_name = None
         self._initialize()
     
@@ -79,6 +145,11 @@ class UnifiedAIClient:
                     api_key=cerebras_api_key,
                     base_url="https://api.cerebras.ai/v1"
                 )
+                self.cerebras_async_client = AsyncOpenAI(
+                    api_key=cerebras_api_key,
+                    base_url="https://api.cerebras.ai/v1",
+                    http_client=self._create_async_http_client()
+                )
                 self.provider = "cerebras"
                 self.model_name = "llama3.1-8b"
                 print("✅ Using Cerebras AI as fallback AI provider")
@@ -94,17 +165,33 @@ class UnifiedAIClient:
             "- CEREBRAS_API_KEY (optional, for Cerebras fallback)"
         )
     
+    def _create_async_http_client(self):
+        """
+        Shared async HTTP client with keep-alive pooling (HTTP/2 when h2 is installed)
+        so concurrent calls reuse connections instead of paying a TLS handshake each
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+        
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        try:
+            return httpx.AsyncClient(http2=True, limits=limits, timeout=30)
+        except ImportError:
+            # http2=True needs the h2 package
+            return httpx.AsyncClient(limits=limits, timeout=30)
+    
     def chat_completions_create(
         self,
         model: Optional[str] = None,
         messages: List[Dict[str, str]] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        response_format: Optional[Dict] = None,
         **kwargs
     ) -> Any:
         """
         Unified interface for chat completions
-        Compatible with OpenAI API format
+        Compatible with OpenAI API format, including response_format JSON mode
         """
         if messages is None:
             messages = []
@@ -112,15 +199,15 @@ class UnifiedAIClient:
         model = model or self.model_name
         
         if self.provider == "google":
-            return self._google_chat_completion(messages, temperature, max_tokens, model)
+            return self._google_chat_completion(messages, temperature, max_tokens, model, response_format)
         elif self.provider == "vertex":
-            return self._vertex_chat_completion(messages, temperature, max_tokens, model)
+            return self._vertex_chat_completion(messages, temperature, max_tokens, model, response_format)
         elif self.provider == "cerebras":
-            return self._cerebras_chat_completion(messages, temperature, max_tokens, model)
+            return self._cerebras_chat_completion(messages, temperature, max_tokens, model, response_format)
         else:
             raise ValueError(f"Unknown AI provider: {self.provider}")
     
-    def _google_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str):
+    def _google_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str, response_format: Optional[Dict] = None):
         """Google AI (Gemini) chat completion"""
         # Convert messages to Gemini format
         system_instruction = None
@@ -138,10 +225,7 @@ class UnifiedAIClient:
                 conversation_history.append({"role": "model", "parts": [content]})
         
         # Configure generation parameters
-        generation_config = {
-            "temperature": temperature,
-            "max_output_tokens": max_tokens,
-        }
+        generation_config = _generation_config(temperature, max_tokens, response_format)
         
         # Create model
         gemini_model = genai.GenerativeModel(
@@ -164,21 +248,9 @@ class UnifiedAIClient:
         response_text = response.text if hasattr(response, 'text') else str(response)
         
         # Convert to OpenAI-compatible format
-        class MockChoice:
-            def __init__(self, text):
-                self.message = MockMessage(text)
-        
-        class MockMessage:
-            def __init__(self, text):
-                self.content = text
-        
-        class MockResponse:
-            def __init__(self, text):
-                self.choices = [MockChoice(text)]
-        
-        return MockResponse(response_text)
+        return _mock_response(response_text)
     
-    def _vertex_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str):
+    def _vertex_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str, response_format: Optional[Dict] = None):
         """Vertex AI (Gemini) chat completion"""
         # Similar to Google AI but using Vertex AI SDK
         system_instruction = None
@@ -198,10 +270,7 @@ class UnifiedAIClient:
         # Use Vertex AI GenerativeModel
         vertex_model = GenerativeModel(model_name=model)
         
-        generation_config = {
-            "temperature": temperature,
-            "max_output_tokens": max_tokens,
-        }
+        generation_config = _generation_config(temperature, max_tokens, response_format)
         
         response = vertex_model.generate_content(
             prompt,
@@ -210,28 +279,143 @@ class UnifiedAIClient:
         )
         
         # Convert to OpenAI-compatible format
-        class MockChoice:
-            def __init__(self, text):
-                self.message = MockMessage(text)
-        
-        class MockMessage:
-            def __init__(self, text):
-                self.content = text
-        
-        class MockResponse:
-            def __init__(self, text):
-                self.choices = [MockChoice(text)]
-        
-        return MockResponse(response.text)
+        return _mock_response(response.text)
     
-    def _cerebras_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str):
+    def _cerebras_chat_completion(self, messages: List[Dict], temperature: float, max_tokens: int, model: str, response_format: Optional[Dict] = None):
         """Cerebras AI chat completion (OpenAI-compatible)"""
+        extra = {"response_format": response_format} if response_format else {}
         return self.cerebras_client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            **extra
+        )
+    
+    async def achat_completions_create(
+        self,
+        model: Optional[str] = None,
+        messages: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        stream: bool = False,
+        response_format: Optional[Dict] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Async version of chat_completions_create
+        Awaits the provider SDK directly instead of blocking a worker thread.
+        With stream=True, returns an async iterator of chunks whose
+        choices[0].delta.content holds the next piece of text.
+        """
+        if messages is None:
+            messages = []
+        
+        model = model or self.model_name
+        
+        if self.provider == "google":
+            return await self._google_chat_completion_async(messages, temperature, max_tokens, model, stream, response_format)
+        elif self.provider == "vertex":
+            return await self._vertex_chat_completion_async(messages, temperature, max_tokens, model, stream, response_format)
+        elif self.provider == "cerebras":
+            extra = {"response_format": response_format} if response_format else {}
+            return await self.cerebras_async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=stream,
+                **extra
+            )
+        else:
+            raise ValueError(f"Unknown AI provider: {self.provider}")
+    
+    async def _google_chat_completion_async(self, messages: List[Dict], temperature: float, max_tokens: int, model: str, stream: bool = False, response_format: Optional[Dict] = None):
+        """Google AI (Gemini) chat completion using the SDK's async methods"""
+        system_instruction = None
+        conversation_history = []
+        
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            
+            if role == "system":
+                system_instruction = content
+            elif role == "user":
+                conversation_history.append({"role": "user", "parts": [content]})
+            elif role == "assistant":
+                conversation_history.append({"role": "model", "parts": [content]})
+        
+        gemini_model = genai.GenerativeModel(
+            model_name=model,
+            generation_config=_generation_config(temperature, max_tokens, response_format),
+            system_instruction=system_instruction if system_instruction else None
+        )
+        
+        if len(conversation_history) > 1:
+            chat = gemini_model.start_chat(history=conversation_history[:-1])
+            response = await chat.send_message_async(conversation_history[-1]["parts"][0], stream=stream)
+        else:
+            prompt = conversation_history[0]["parts"][0] if conversation_history else ""
+            response = await gemini_model.generate_content_async(prompt, stream=stream)
+        
+        if stream:
+            return _mock_stream(response)
+        
+        response_text = response.text if hasattr(response, 'text') else str(response)
+        return _mock_response(response_text)
+    
+    async def _vertex_chat_completion_async(self, messages: List[Dict], temperature: float, max_tokens: int, model: str, stream: bool = False, response_format: Optional[Dict] = None):
+        """Vertex AI (Gemini) chat completion using the SDK's async methods"""
+        system_instruction = None
+        user_messages = []
+        
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            
+            if role == "system":
+                system_instruction = content
+            elif role == "user":
+                user_messages.append(content)
+        
+        vertex_model = GenerativeModel(model_name=model)
+        response = await vertex_model.generate_content_async(
+            "\n\n".join(user_messages),
+            generation_config=_generation_config(temperature, max_tokens, response_format),
+            system_instruction=system_instruction,
+            stream=stream
         )
+        
+        if stream:
+            return _mock_stream(response)
+        
+        return _mock_response(response.text)
+    
+    async def aclose(self):
+        """Close pooled async connections"""
+        if self.cerebras_async_client is not None:
+            await self.cerebras_async_client.close()
+    
+    @property
+    def aio(self):
+        """OpenAI-compatible async chat interface (client.aio.chat.completions.create)"""
+        class AsyncCompletions:
+            def __init__(self, client):
+                self.client = client
+            
+            async def create(self, **kwargs):
+                return await self.client.achat_completions_create(**kwargs)
+        
+        class AsyncChatInterface:
+            def __init__(self, client):
+                self.completions = AsyncCompletions(client)
+        
+        class AsyncInterface:
+            def __init__(self, client):
+                self.chat = AsyncChatInterface(client)
+        
+        return AsyncInterface(self)
     
     @property
     def chat(self):
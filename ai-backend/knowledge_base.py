@@ -66,26 +66,46 @@ class EducationalKnowledgeBase:
         Returns:
             List of relevant documents with metadata
         """
-        # Generate query embedding
-        query_embedding = self.embedding_model.encode([query])[0].tolist()
+        return self.search_batch([query], n_results=n_results)[0]
+    
+    def search_batch(self, queries: List[str], n_results: int = 3) -> List[List[Dict]]:
+        """
+        Search for several queries at once: all queries are embedded in one
+        model call and looked up in one collection query.
+        
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            
+        Returns:
+            One list of relevant documents per query, in query order
+        """
+        if not queries:
+            return []
+        
+        # Generate query embeddings (one batched forward pass)
+        query_embeddings = self.embedding_model.encode(queries).tolist()
         
         # Search
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results
         )
         
         # Format results
-        documents = []
-        if results['documents'] and results['documents'][0]:
-            for i in range(len(results['documents'][0])):
-                documents.append({
-                    'content': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
-                    'distance': results['distances'][0][i] if results['distances'] else None
-                })
+        all_documents = []
+        for q in range(len(queries)):
+            documents = []
+            if results['documents'] and results['documents'][q]:
+                for i in range(len(results['documents'][q])):
+                    documents.append({
+                        'content': results['documents'][q][i],
+                        'metadata': results['metadatas'][q][i] if results['metadatas'] else {},
+                        'distance': results['distances'][q][i] if results['distances'] else None
+                    })
+            all_documents.append(documents)
         
-        return documents
+        return all_documents
 
 # Initialize knowledge base
 knowledge_base = EducationalKnowledgeBase()
@@ -1,13 +1,16 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
+from functools import lru_cache
 import json
 import asyncio
+import zlib
 from openai import OpenAI
 from datetime import datetime
 import os
+import sys
 from dotenv import load_dotenv
 
 # Load environment variables FIRST (before any imports that need them)
@@ -97,6 +100,9 @@ except ImportError as e:
     resume_optimizer = None
     print(f"⚠️  Resume Optimizer not available: {e}")
 
+# Shared decoder for pulling JSON out of LLM responses
+json_decoder = json.JSONDecoder()
+
 # Initialize FastAPI
 app = FastAPI(title="Student AI Platform API", version="1.0.0")
 
@@ -109,6 +115,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("shutdown")
+async def close_ai_client():
+    """Release pooled LLM connections"""
+    await ai_client.aclose()
+
+
+@app.on_event("shutdown")
+async def close_scraper_session():
+    """Release the internship scraper's pooled connections (if it was ever used)"""
+    scraper_module = sys.modules.get("scraper")
+    if scraper_module is not None and hasattr(scraper_module, "close_async_session"):
+        await scraper_module.close_async_session()
+
+
+@app.on_event("shutdown")
+async def shutdown_interview_system():
+    """Stop background TTS workers"""
+    if interview_system:
+        interview_system.shutdown()
+
 # Pydantic Models
 class LearningPathRequest(BaseModel):
     interests: List[str]
@@ -475,7 +502,7 @@ async def test_scrape():
         from scraper import InternshipScraper
         
         scraper = InternshipScraper()
-        results = scraper.scrape_indeed("software engineer", "Remote", 5)
+        results = await scraper.scrape_indeed_async("software engineer", "Remote", 5)
         
         return {
             "success": True,
@@ -638,39 +665,28 @@ async def scrape_internships(request: ScrapeInternshipRequest):
             print(f"📝 Original Query: '{request.query}', Location: '{request.location}'")
             print(f"📝 Optimized Query: '{optimized_query}', Location: '{optimized_location}'")
             
+            # Indeed fetches on aiohttp; the other scrapers are blocking, so they run in worker
+            # threads - either way all requested sources are scraped at the same time
+            source_tasks = {}
             if 'indeed' in sources:
-                print("🌐 Scraping Indeed...")
-                indeed_results = scraper.scrape_indeed(optimized_query, optimized_location, max_per_source)
-                print(f"✅ Indeed: {len(indeed_results)} results")
-                if indeed_results:
-                    print(f"   Sample: {indeed_results[0].get('title', 'N/A')} at {indeed_results[0].get('company', 'N/A')}")
-                all_internships.extend(indeed_results)
-            
+                source_tasks['Indeed'] = scraper.scrape_indeed_async(optimized_query, optimized_location, max_per_source)
             if 'linkedin' in sources:
-                print("🌐 Scraping LinkedIn...")
-                linkedin_results = scraper.scrape_linkedin(optimized_query, optimized_location, max_per_source)
-                print(f"✅ LinkedIn: {len(linkedin_results)} results")
-                all_internships.extend(linkedin_results)
-            
+                source_tasks['LinkedIn'] = asyncio.to_thread(scraper.scrape_linkedin, optimized_query, optimized_location, max_per_source)
             if 'glassdoor' in sources:
-                print("🌐 Scraping Glassdoor...")
-                glassdoor_results = scraper.scrape_glassdoor(optimized_query, optimized_location, max_per_source)
-                print(f"✅ Glassdoor: {len(glassdoor_results)} results")
-                all_internships.extend(glassdoor_results)
-            
+                source_tasks['Glassdoor'] = asyncio.to_thread(scraper.scrape_glassdoor, optimized_query, optimized_location, max_per_source)
             if 'internships.com' in sources:
-                print("🌐 Scraping Internships.com...")
-                internships_com_results = scraper.scrape_internships_com(optimized_query, optimized_location, max_per_source)
-                print(f"✅ Internships.com: {len(internships_com_results)} results")
-                all_internships.extend(internships_com_results)
-            
+                source_tasks['Internships.com'] = asyncio.to_thread(scraper.scrape_internships_com, optimized_query, optimized_location, max_per_source)
             if 'skill_india' in sources or 'skillindiadigital' in sources:
-                print("🌐 Scraping Skill India Digital...")
-                skill_india_results = scraper.scrape_skill_india(optimized_query, optimized_location, max_per_source)
-                print(f"✅ Skill India Digital: {len(skill_india_results)} results")
-                if skill_india_results:
-                    print(f"   Sample: {skill_india_results[0].get('title', 'N/A')} at {skill_india_results[0].get('company', 'N/A')}")
-                all_internships.extend(skill_india_results)
+                source_tasks['Skill India Digital'] = asyncio.to_thread(scraper.scrape_skill_india, optimized_query, optimized_location, max_per_source)
+            
+            print(f"🌐 Scraping {', '.join(source_tasks)} concurrently...")
+            source_results = await asyncio.gather(*source_tasks.values())
+            
+            for source_name, results in zip(source_tasks, source_results):
+                print(f"✅ {source_name}: {len(results)} results")
+                if results:
+                    print(f"   Sample: {results[0].get('title', 'N/A')} at {results[0].get('company', 'N/A')}")
+                all_internships.extend(results)
             
             print(f"📊 Total scraped: {len(all_internships)} internships")
             
@@ -757,8 +773,20 @@ async def scrape_internships(request: ScrapeInternshipRequest):
         raise HTTPException(status_code=500, detail=f"Error scraping internships: {str(e)}")
 
 
+async def gzip_event_stream(events):
+    """
+    Gzip an SSE stream incrementally.
+    Each event is sync-flushed so progress frames still reach the client immediately,
+    while the large final 'complete' frame is sent compressed.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    async for event in events:
+        yield compressor.compress(event.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
 @app.post("/api/internships/scrape/stream")
-async def scrape_internships_stream(request: ScrapeInternshipRequest):
+async def scrape_internships_stream(request: ScrapeInternshipRequest, http_request: Request):
     """
     Stream scraping progress with Server-Sent Events (SSE) for real-time UI updates
     """
@@ -803,7 +831,8 @@ async def scrape_internships_stream(request: ScrapeInternshipRequest):
                     sources = list(sources) + ['skill_india']
             
             max_per_source = max(10, request.max_results // max(len(sources), 1)) if sources else request.max_results
-            all_internships = []
+            seen = set()
+            unique_internships = []
             
             total_sources = len(sources)
             progress_per_source = 70 / total_sources  # 70% for scraping, 20% already used, 10% for final processing
@@ -816,87 +845,83 @@ async def scrape_internships_stream(request: ScrapeInternshipRequest):
                 yield f"data: {json.dumps({'type': 'scraping', 'source': source, 'source_name': source_name, 'message': f'Scraping {source_name}...', 'progress': int(current_progress)})}\n\n"
                 
                 try:
+                    # Blocking scrapers run in a worker thread so the event loop keeps serving other requests
                     if source == 'indeed':
-                        results = scraper.scrape_indeed(optimized_query, optimized_location, max_per_source)
+                        results = await scraper.scrape_indeed_async(optimized_query, optimized_location, max_per_source)
                     elif source == 'linkedin':
-                        results = scraper.scrape_linkedin(optimized_query, optimized_location, max_per_source)
+                        results = await asyncio.to_thread(scraper.scrape_linkedin, optimized_query, optimized_location, max_per_source)
                     elif source == 'glassdoor':
-                        results = scraper.scrape_glassdoor(optimized_query, optimized_location, max_per_source)
+                        results = await asyncio.to_thread(scraper.scrape_glassdoor, optimized_query, optimized_location, max_per_source)
                     elif source == 'internships.com':
-                        results = scraper.scrape_internships_com(optimized_query, optimized_location, max_per_source)
+                        results = await asyncio.to_thread(scraper.scrape_internships_com, optimized_query, optimized_location, max_per_source)
                     elif source in ['skill_india', 'skillindiadigital']:
-                        results = scraper.scrape_skill_india(optimized_query, optimized_location, max_per_source)
+                        results = await asyncio.to_thread(scraper.scrape_skill_india, optimized_query, optimized_location, max_per_source)
                     else:
                         results = []
                     
-                    all_internships.extend(results)
+                    # Deduplicate as each source completes so we can stop once enough results are in
+                    for internship in results:
+                        key = (internship['title'].lower(), internship['company'].lower())
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        formatted = {
+                            'title': internship['title'],
+                            'company': internship['company'],
+                            'description': internship.get('description', f"Internship opportunity for {request.query} at {internship['company']}"),
+                            'location': internship['location'],
+                            'type': 'Internship',
+                            'duration': '3-6 months',
+                            'requiredSkills': [request.query] if request.query else [],
+                            'benefits': ['Mentorship', 'Networking', 'Real-world experience'],
+                            'applicationTips': f"Apply via {internship['source']} or company website",
+                            'matchScore': 80 if internship['source'] != 'Sample' else 70,
+                            'url': internship.get('url', ''),
+                            'source': internship['source'],
+                            'scraped_at': internship.get('scraped_at', datetime.now().isoformat())
+                        }
+                        unique_internships.append(formatted)
+                        if len(unique_internships) >= request.max_results:
+                            break
+                    
                     yield f"data: {json.dumps({'type': 'source_complete', 'source': source, 'source_name': source_name, 'count': len(results), 'progress': int(current_progress + progress_per_source)})}\n\n"
                 except Exception as e:
                     yield f"data: {json.dumps({'type': 'source_error', 'source': source, 'source_name': source_name, 'error': str(e), 'progress': int(current_progress + progress_per_source)})}\n\n"
                 
+                # Early exit - skip remaining sources once max_results unique internships are collected
+                if len(unique_internships) >= request.max_results:
+                    print(f"✅ Reached {request.max_results} unique internships after {source_name}, skipping remaining sources")
+                    break
+                
                 await asyncio.sleep(0.1)
             
             # Process results
             yield f"data: {json.dumps({'type': 'status', 'message': 'Processing and deduplicating results...', 'progress': 90})}\n\n"
             
-            # Remove duplicates
-            seen = set()
-            unique_internships = []
-            for internship in all_internships:
-                key = (internship['title'].lower(), internship['company'].lower())
-                if key not in seen:
-                    seen.add(key)
-                    formatted = {
-                        'title': internship['title'],
-                        'company': internship['company'],
-                        'description': internship.get('description', f"Internship opportunity for {request.query} at {internship['company']}"),
-                        'location': internship['location'],
-                        'type': 'Internship',
-                        'duration': '3-6 months',
-                        'requiredSkills': [request.query] if request.query else [],
-                        'benefits': ['Mentorship', 'Networking', 'Real-world experience'],
-                        'applicationTips': f"Apply via {internship['source']} or company website",
-                        'matchScore': 80 if internship['source'] != 'Sample' else 70,
-                        'url': internship.get('url', ''),
-                        'source': internship['source'],
-                        'scraped_at': internship.get('scraped_at', datetime.now().isoformat())
-                    }
-                    unique_internships.append(formatted)
-            
             # Send final results
             yield f"data: {json.dumps({'type': 'complete', 'total': len(unique_internships), 'opportunities': unique_internships, 'progress': 100})}\n\n"
             
         except Exception as e:
             yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
     
+    # Compress the stream when the client supports it - the final results frame is large JSON
+    if 'gzip' in http_request.headers.get('accept-encoding', '').lower():
+        return StreamingResponse(
+            gzip_event_stream(generate()),
+            media_type="text/event-stream",
+            headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+        )
+    
     return StreamingResponse(generate(), media_type="text/event-stream")
 
 
 # AI Career Guidance Chatbot
-@app.post("/api/ai/chat", response_model=ChatResponse)
-async def chat(request: ChatMessage):
-    """
-    AI-powered career guidance chatbot (with RAG enhancement)
-    """
-    try:
-        # Build context if provided
-        context_str = ""
-        if request.context:
-            context_str = f"""
-**Student Context:**
-- Education Level: {request.context.get('educationLevel', 'Not specified')}
-- Career Goal: {request.context.get('careerGoal', 'Not specified')}
-- Current Skills: {', '.join(request.context.get('skills', []))}
-- Interests: {', '.join(request.context.get('interests', []))}
-"""
-
-        prompt = f"""
+CHAT_PROMPT_HEADER = """
 You are an expert career counselor and mentor for students. Provide helpful, encouraging, and practical advice.
 
-{context_str}
+"""
 
-**Student Question:**
-{request.message}
+CHAT_PROMPT_INSTRUCTIONS = """
 
 **Instructions:**
 1. Provide a clear, supportive response (2-3 paragraphs)
@@ -907,6 +932,43 @@ You are an expert career counselor and mentor for students. Provide helpful, enc
 Keep your response conversational and supportive. Format your response as plain text (not JSON).
 """
 
+
+@lru_cache(maxsize=1024)
+def build_chat_context(education_level: str, career_goal: str, skills: tuple, interests: tuple) -> str:
+    """Build the student context block for the chat prompt (cached per student profile)"""
+    return f"""
+**Student Context:**
+- Education Level: {education_level}
+- Career Goal: {career_goal}
+- Current Skills: {', '.join(skills)}
+- Interests: {', '.join(interests)}
+"""
+
+
+@app.post("/api/ai/chat", response_model=ChatResponse)
+async def chat(request: ChatMessage):
+    """
+    AI-powered career guidance chatbot (with RAG enhancement)
+    """
+    try:
+        # Build context if provided
+        context_str = ""
+        if request.context:
+            context_str = build_chat_context(
+                request.context.get('educationLevel', 'Not specified'),
+                request.context.get('careerGoal', 'Not specified'),
+                tuple(request.context.get('skills', [])),
+                tuple(request.context.get('interests', []))
+            )
+
+        prompt = "".join((
+            CHAT_PROMPT_HEADER,
+            context_str,
+            "\n\n**Student Question:**\n",
+            request.message,
+            CHAT_PROMPT_INSTRUCTIONS
+        ))
+
         # Enhance with RAG if available
         if RAG_ENABLED:
             prompt = augment_prompt_with_knowledge(request.message, prompt)
@@ -945,17 +1007,14 @@ Return as a JSON array: ["question1", "question2", "question3"]
         
         suggestions_text = suggestions_response.choices[0].message.content.strip()
         
-        # Parse suggestions
-        if suggestions_text.startswith("```json"):
-            suggestions_text = suggestions_text[7:]
-        if suggestions_text.startswith("```"):
-            suggestions_text = suggestions_text[3:]
-        if suggestions_text.endswith("```"):
-            suggestions_text = suggestions_text[:-3]
-        
-        suggestions_text = suggestions_text.strip()
-        
-        suggestions = json.loads(suggestions_text)
+        # Parse suggestions - decode the first JSON array in place, ignoring code fences or extra prose
+        suggestions = []
+        array_start = suggestions_text.find('[')
+        if array_start != -1:
+            try:
+                suggestions, _ = json_decoder.raw_decode(suggestions_text, array_start)
+            except json.JSONDecodeError:
+                suggestions = []
         
         # Log interaction for training if RAG enabled
         if RAG_ENABLED:
@@ -1218,6 +1277,7 @@ class InterviewStartRequest(BaseModel):
     interview_type: str = "technical"  # technical, behavioral, hr
     difficulty: str = "medium"  # easy, medium, hard
     resume_data: Optional[str] = None  # Base64 encoded file data for web uploads
+    realtime_feedback: bool = True  # False = evaluate all answers in one batched call at the end
 
 
 class InterviewAnswerRequest(BaseModel):
@@ -1272,12 +1332,13 @@ async def start_interview(request: InterviewStartRequest):
             raise HTTPException(status_code=400, detail="Either resume_path or resume_data must be provided")
         
         # Use the same ResumeAnalyzer.parse_resume method as resume optimizer
-        result = interview_system.start_interview(
+        result = await interview_system.start_interview(
             resume_path=resume_path,
             resume_type=resume_type,
             user_id=request.user_id,
             interview_type=request.interview_type,
-            difficulty=request.difficulty
+            difficulty=request.difficulty,
+            realtime_feedback=request.realtime_feedback
         )
         
         # Clean up temp file if it was created from base64 data
@@ -1309,7 +1370,7 @@ async def submit_answer(request: InterviewAnswerRequest):
         raise HTTPException(status_code=503, detail="Interview system not available")
     
     try:
-        result = interview_system.submit_answer(
+        result = await interview_system.submit_answer(
             session_id=request.session_id,
             answer=request.answer
         )
@@ -1328,8 +1389,10 @@ async def get_interview_audio(session_id: str, question_index: int):
     """
     🔊 Get Audio File for Interview Question
     
-    Returns the audio file (MP3) of the AI asking the question.
-    This enables voice-based interview experience.
+    Returns the audio file (MP3, or Opus/WebM when TTS_AUDIO_FORMAT=opus) of the
+    AI asking the question. This enables voice-based interview experience.
+    MP3 audio that has not been synthesized yet is streamed from TTS as it is
+    generated, so playback can start before the whole file exists.
     """
     if not INTERVIEW_ENABLED or not interview_system:
         raise HTTPException(status_code=503, detail="Interview system not available")
@@ -1337,15 +1400,30 @@ async def get_interview_audio(session_id: str, question_index: int):
     try:
         from fastapi.responses import FileResponse
         
-        audio_path = interview_system.get_audio_file(session_id, question_index)
+        audio_path = await interview_system.get_audio_file(session_id, question_index)
         
         if not audio_path or not os.path.exists(audio_path):
-            raise HTTPException(status_code=404, detail="Audio file not found")
+            question_text = await interview_system.get_question_text(session_id, question_index)
+            if not question_text:
+                raise HTTPException(status_code=404, detail="Audio file not found")
+            
+            if interview_system.audio_format == "mp3":
+                # Cache miss - stream straight from TTS (cached on disk as it streams)
+                return StreamingResponse(
+                    interview_system.stream_question_audio(question_text),
+                    media_type="audio/mpeg"
+                )
+            
+            # Opus needs a full transcode before it can be served
+            audio_path = await interview_system.render_question_audio(question_text, session_id, question_index)
+            if not audio_path:
+                raise HTTPException(status_code=404, detail="Audio file not found")
         
+        is_webm = audio_path.endswith(".webm")
         return FileResponse(
             audio_path,
-            media_type="audio/mpeg",
-            filename=f"question_{question_index}.mp3"
+            media_type="audio/webm" if is_webm else "audio/mpeg",
+            filename=f"question_{question_index}.{'webm' if is_webm else 'mp3'}"
         )
     
     except HTTPException:
@@ -1369,7 +1447,7 @@ async def get_interview_session(session_id: str):
         raise HTTPException(status_code=503, detail="Interview system not available")
     
     try:
-        session = interview_system.get_session(session_id)
+        session = await interview_system.get_session(session_id)
         
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
@@ -1549,7 +1627,7 @@ async def analyze_resume(request: ResumeAnalysisRequest):
         raise HTTPException(status_code=503, detail="Resume Optimizer not available")
     
     try:
-        result = resume_optimizer.analyze_resume(
+        result = await resume_optimizer.analyze_resume_async(
             resume_text=request.resume_text,
             resume_summary=request.resume_summary
         )
@@ -1564,7 +1642,7 @@ async def tailor_resume(request: ResumeTailorRequest):
         raise HTTPException(status_code=503, detail="Resume Optimizer not available")
     
     try:
-        result = resume_optimizer.tailor_resume_for_job(
+        result = await resume_optimizer.tailor_resume_for_job_async(
             resume_summary=request.resume_summary,
             job_title=request.job_title,
             job_description=request.job_description,
@@ -1581,7 +1659,7 @@ async def generate_bullet_points(request: BulletPointsRequest):
         raise HTTPException(status_code=503, detail="Resume Optimizer not available")
     
     try:
-        result = resume_optimizer.generate_resume_bullet_points(
+        result = await resume_optimizer.generate_resume_bullet_points_async(
             job_title=request.job_title,
             responsibilities=request.responsibilities,
             achievements=request.achievements
@@ -5,12 +5,197 @@ Generates interview questions and conducts voice-based interviews
 
 import os
 import json
-from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import contextlib
+import shutil
+import subprocess
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from statistics import fmean
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
 from datetime import datetime
-from openai import OpenAI
+from openai import OpenAI, RateLimitError
 from gtts import gTTS
 from resume_analyzer import ResumeAnalyzer
+from session_store import create_session_store
 import tempfile
+from io import BytesIO
+
+# Persistent LLM response cache (optional)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    diskcache = None
+
+# Faster JSON parsing for LLM responses (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Client-side LLM rate limiting and retry-with-backoff (optional)
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+    AsyncLimiter = None
+
+try:
+    from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+    TENACITY_AVAILABLE = True
+except ImportError:
+    TENACITY_AVAILABLE = False
+
+# Gemini reports rate limiting as ResourceExhausted (HTTP 429)
+try:
+    from google.api_core.exceptions import ResourceExhausted
+    RATE_LIMIT_ERRORS = (RateLimitError, ResourceExhausted)
+except ImportError:
+    RATE_LIMIT_ERRORS = (RateLimitError,)
+
+LLM_CACHE_TTL = 7 * 24 * 3600  # Cached questions/evaluations expire after a week
+
+
+# Identical on every call so provider-side prompt caching can reuse it
+_SYSTEM_QGEN = """You are an expert technical interviewer. Always respond with valid JSON only.
+
+Generate the requested number (Count) of interview questions based on the candidate's resume summary,
+interview type and difficulty given in the user message.
+
+Generate questions in this exact JSON format:
+[
+  {
+    "question": "Question text here",
+    "type": "technical|behavioral|situational",
+    "topic": "specific topic",
+    "expected_points": ["point1", "point2", "point3"]
+  }
+]
+
+For technical interviews, focus on:
+- Core programming concepts related to their skills
+- System design (if experienced)
+- Data structures and algorithms
+- Problem-solving approach
+
+For behavioral interviews, focus on:
+- Past experiences
+- Teamwork and collaboration
+- Handling challenges
+- Leadership skills
+
+Make questions realistic and relevant to their background. Return ONLY valid JSON array."""
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+_json_decoder = json.JSONDecoder()
+
+
+def _extract_json(text: str, opening: str):
+    """
+    Parse the first JSON array/object in an LLM response
+    
+    Handles markdown fences and surrounding prose: decoding starts at the first
+    opening bracket that begins a valid value and stops at its matching close, so
+    stray brackets after the JSON are ignored.
+    
+    Args:
+        text: Raw response text
+        opening: '[' for an array, '{' for an object
+    
+    Returns:
+        Parsed JSON value
+    """
+    if text.startswith(opening):
+        try:
+            return _json_loads(text)  # Bare JSON - fast path
+        except ValueError:
+            pass
+    
+    start = text.find(opening)
+    while start != -1:
+        try:
+            return _json_decoder.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            start = text.find(opening, start + 1)
+    
+    raise ValueError(f"No JSON value starting with '{opening}' found in response")
+
+
+def _slim_resume_data(resume_data: Dict) -> Dict:
+    """Keep only the resume fields interviews read, not the raw text (sessions may live in Redis)"""
+    extracted_info = resume_data.get('extracted_info', {})
+    return {
+        'extracted_info': {
+            key: extracted_info.get(key) for key in ('name', 'skills', 'experience', 'education')
+        }
+    }
+
+
+def _prompt_key(prompt: str) -> str:
+    """Cache key for an LLM prompt"""
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+@lru_cache(maxsize=512)
+def _tts_cache_key(text: str, lang: str) -> str:
+    """Content hash used to name cached TTS audio files"""
+    return hashlib.sha256(f"{lang}|{text}".encode()).hexdigest()[:16]
+
+
+class _StreamingArrayScanner:
+    """
+    Pulls complete top-level objects out of a JSON array while it is still streaming,
+    by tracking bracket depth (ignoring brackets inside strings)
+    """
+    
+    def __init__(self):
+        self.text = ''
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = None
+    
+    def feed(self, delta: str) -> List[str]:
+        """Add streamed text and return any objects completed by it"""
+        completed = []
+        start = len(self.text)
+        self.text += delta
+        
+        for i in range(start, len(self.text)):
+            ch = self.text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                if ch == '{' and self._depth == 1:
+                    self._object_start = i
+                self._depth += 1
+            elif ch in ']}':
+                self._depth -= 1
+                if ch == '}' and self._depth == 1 and self._object_start is not None:
+                    completed.append(self.text[self._object_start:i + 1])
+                    self._object_start = None
+        
+        return completed
 
 
 class MockInterviewer:
@@ -28,18 +213,57 @@ class MockInterviewer:
         self.model = getattr(ai_client, 'model_name', 'gemini-2.5-flash')
         self.resume_analyzer = ResumeAnalyzer()
         
-        # Interview session storage
-        self.sessions = {}
+        # Interview session storage (bounded in-memory, or Redis when REDIS_URL is set)
+        self.sessions = create_session_store()
         self.audio_dir = "interview_audio"
         os.makedirs(self.audio_dir, exist_ok=True)
+        
+        # Content-addressed TTS cache shared across sessions (identical questions are synthesized once)
+        self.tts_cache_dir = os.path.join(self.audio_dir, "tts_cache")
+        os.makedirs(self.tts_cache_dir, exist_ok=True)
+        self._tts_cached_paths = set()  # Paths known to exist, skips the filesystem check for hot phrases
+        self.audio_format = self._select_audio_format()
+        # Cap on concurrent gTTS requests (kept low to respect rate limits), shared by the pool jobs and
+        # the streaming route, which runs in Starlette's thread pool rather than ours
+        tts_workers = int(os.getenv("TTS_WORKERS", 4))
+        self._tts_slots = threading.BoundedSemaphore(tts_workers)
+        # Dedicated threads for gTTS so synthesis doesn't compete with other blocking work on the default executor
+        self._tts_pool = ThreadPoolExecutor(
+            max_workers=tts_workers,
+            thread_name_prefix="tts"
+        )
+        
+        # Disk cache for generated questions and evaluations (identical prompts skip the LLM)
+        self._llm_cache = None
+        if DISKCACHE_AVAILABLE:
+            self._llm_cache = diskcache.Cache(os.path.join(self.audio_dir, "llm_cache"), size_limit=2**30)
+        self._inflight: Dict[str, asyncio.Future] = {}  # Prompt hash -> in-progress LLM call
+        
+        # Stay under the provider's requests-per-minute quota instead of falling back on 429s
+        self._llm_limiter = None
+        if AIOLIMITER_AVAILABLE:
+            self._llm_limiter = AsyncLimiter(max_rate=int(os.getenv("LLM_RPM", 500)), time_period=60)
+    
+    def _select_audio_format(self) -> str:
+        """
+        MP3 by default; Opus/WebM (3-5x smaller) when TTS_AUDIO_FORMAT=opus and ffmpeg is installed.
+        Opus is opt-in because iOS/macOS players can't play WebM.
+        """
+        requested = os.getenv("TTS_AUDIO_FORMAT", "mp3").lower()
+        if requested == "opus":
+            if shutil.which("ffmpeg"):
+                return "opus"
+            print("⚠️  TTS_AUDIO_FORMAT=opus needs ffmpeg on PATH - falling back to MP3")
+        return "mp3"
     
-    def start_interview(
+    async def start_interview(
         self,
         resume_path: str,
         resume_type: str,
         user_id: str,
         interview_type: str = "technical",  # technical, behavioral, hr
-        difficulty: str = "medium"  # easy, medium, hard
+        difficulty: str = "medium",  # easy, medium, hard
+        realtime_feedback: bool = True
     ) -> Dict:
         """
         Start a new mock interview session
@@ -50,33 +274,47 @@ class MockInterviewer:
             user_id: User identifier
             interview_type: Type of interview
             difficulty: Difficulty level
+            realtime_feedback: Evaluate each answer as it is submitted. When False, all
+                answers are evaluated in a single batched LLM call at the end.
         
         Returns:
             Dictionary with session info and first question
         """
-        # Parse resume
-        resume_data = self.resume_analyzer.parse_resume(resume_path, resume_type)
+        # Parse resume (blocking PDF/DOCX parsing runs in a worker thread)
+        resume_data = await asyncio.to_thread(self.resume_analyzer.parse_resume, resume_path, resume_type)
+        
+        session_id = f"interview_{user_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        
+        # Start speech synthesis for each question as soon as it has streamed in
+        tts_tasks: Dict[str, asyncio.Task] = {}
+        
+        def on_question(index: int, question: Dict):
+            text = question.get('question')
+            if text and text not in tts_tasks:
+                tts_tasks[text] = asyncio.create_task(self._text_to_speech(text, session_id, index))
         
         # Generate interview questions
-        questions = self._generate_questions(
+        questions = await self._generate_questions(
             resume_data,
             interview_type,
-            difficulty
+            difficulty,
+            on_question=on_question
         )
         
         # Create session
-        session_id = f"interview_{user_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
-        self.sessions[session_id] = {
+        session = {
             'session_id': session_id,
             'user_id': user_id,
-            'resume_data': resume_data,
+            'resume_data': _slim_resume_data(resume_data),
             'interview_type': interview_type,
             'difficulty': difficulty,
             'questions': questions,
             'current_question_index': 0,
             'answers': [],
             'feedback': [],
+            'audio_paths': [],
+            'realtime_feedback': realtime_feedback,
             'started_at': datetime.now().isoformat(),
             'status': 'in_progress'
         }
@@ -84,12 +322,16 @@ class MockInterviewer:
         # Get first question
         first_question = questions[0]
         
-        # Generate voice for first question
-        audio_path = self._text_to_speech(
-            first_question['question'],
-            session_id,
-            0
+        # Generate voice for all questions up front, concurrently, so answers never wait on TTS
+        # (reusing synthesis already started while the questions were streaming)
+        audio_paths = await asyncio.gather(
+            *[tts_tasks.get(q['question']) or self._text_to_speech(q['question'], session_id, i)
+              for i, q in enumerate(questions)],
+            return_exceptions=True
         )
+        session['audio_paths'] = [path if isinstance(path, str) else None for path in audio_paths]
+        
+        await self.sessions.set(session_id, session)
         
         return {
             'success': True,
@@ -109,11 +351,12 @@ class MockInterviewer:
             }
         }
     
-    def _generate_questions(
+    async def _generate_questions(
         self,
         resume_data: Dict,
         interview_type: str,
-        difficulty: str
+        difficulty: str,
+        on_question: Optional[Callable[[int, Dict], None]] = None
     ) -> List[Dict]:
         """
         Generate interview questions based on resume
@@ -122,6 +365,8 @@ class MockInterviewer:
             resume_data: Parsed resume data
             interview_type: Type of interview
             difficulty: Difficulty level
+            on_question: Called with (index, question) as each question finishes
+                streaming, so work like TTS can overlap with generation
         
         Returns:
             List of question dictionaries
@@ -131,73 +376,143 @@ class MockInterviewer:
         experience = extracted_info.get('experience', [])
         education = extracted_info.get('education', [])
         
-        # Create prompt for question generation
-        prompt = f"""You are an expert technical interviewer. Generate {5 if interview_type == 'technical' else 4} interview questions based on the candidate's resume.
-
-Resume Summary:
-- Skills: {', '.join(skills[:10]) if skills else 'General'}
-- Experience: {', '.join([exp.get('title', 'Fresher') for exp in experience[:3]])}
-- Education: {', '.join(education[:2]) if education else 'Not specified'}
-
-Interview Type: {interview_type}
-Difficulty: {difficulty}
-
-Generate questions in this exact JSON format:
-[
-  {{
-    "question": "Question text here",
-    "type": "technical|behavioral|situational",
-    "topic": "specific topic",
-    "expected_points": ["point1", "point2", "point3"]
-  }}
-]
-
-For technical interviews, focus on:
-- Core programming concepts related to their skills
-- System design (if experienced)
-- Data structures and algorithms
-- Problem-solving approach
-
-For behavioral interviews, focus on:
-- Past experiences
-- Teamwork and collaboration
-- Handling challenges
-- Leadership skills
-
-Make questions realistic and relevant to their background. Return ONLY valid JSON array."""
+        # Only the candidate details vary - the instructions live in the shared system prompt
+        skills_str = ', '.join(skills[:10]) if skills else 'General'
+        exp_str = ', '.join([exp.get('title', 'Fresher') for exp in experience[:3]])
+        edu_str = ', '.join(education[:2]) if education else 'Not specified'
+        count = 5 if interview_type == 'technical' else 4
+        prompt = (
+            f"Skills: {skills_str}\nExperience: {exp_str}\nEducation: {edu_str}\n"
+            f"Type: {interview_type}\nDifficulty: {difficulty}\nCount: {count}"
+        )
 
+        cache_key = _prompt_key(_SYSTEM_QGEN + prompt)
+        if self._llm_cache is not None:
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert interviewer. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            questions_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response
-            json_start = questions_text.find('[')
-            json_end = questions_text.rfind(']') + 1
-            if json_start != -1 and json_end > json_start:
-                questions_text = questions_text[json_start:json_end]
-            
-            questions = json.loads(questions_text)
-            
-            # Add IDs to questions
-            for i, q in enumerate(questions):
-                q['id'] = f"q_{i}"
-            
-            return questions
-            
+            # Identical concurrent requests share one LLM call
+            return await self._single_flight(cache_key, lambda: self._request_questions(prompt, cache_key, on_question))
         except Exception as e:
             print(f"Error generating questions: {e}")
             # Return default questions as fallback
             return self._get_default_questions(interview_type, skills)
     
+    async def _chat_completion(self, **kwargs):
+        """
+        Run an LLM chat completion without blocking the event loop
+        
+        Calls are rate limited, and rate-limit errors are retried with
+        exponential backoff before callers fall back to default content.
+        """
+        if not TENACITY_AVAILABLE:
+            return await self._rate_limited_completion(**kwargs)
+        
+        async for attempt in AsyncRetrying(
+            wait=wait_exponential_jitter(initial=1, max=30),
+            retry=retry_if_exception_type(RATE_LIMIT_ERRORS),
+            stop=stop_after_attempt(5),
+            reraise=True
+        ):
+            with attempt:
+                return await self._rate_limited_completion(**kwargs)
+    
+    async def _rate_limited_completion(self, **kwargs):
+        """Single LLM call, gated by the requests-per-minute limiter"""
+        async with (self._llm_limiter or contextlib.nullcontext()):
+            return await self._call_llm(**kwargs)
+    
+    async def _call_llm(self, **kwargs):
+        """Dispatch to the async client interface when available"""
+        if hasattr(self.client, 'aio'):
+            return await self.client.aio.chat.completions.create(**kwargs)
+        # Plain synchronous clients run in a worker thread
+        return await asyncio.to_thread(self.client.chat.completions.create, **kwargs)
+    
+    async def _single_flight(self, key: str, make_call: Callable[[], Awaitable]):
+        """
+        Run make_call once per key, letting concurrent callers await the same result
+        
+        Args:
+            key: Deduplication key (prompt hash, or audio path for speech synthesis)
+            make_call: Factory returning the coroutine to run
+        
+        Returns:
+            Result of the shared call
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        task = asyncio.ensure_future(make_call())
+        self._inflight[key] = task
+        try:
+            # Shield so one caller disconnecting doesn't cancel the call for everyone else
+            return await asyncio.shield(task)
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def _request_questions(
+        self,
+        prompt: str,
+        cache_key: str,
+        on_question: Optional[Callable[[int, Dict], None]] = None
+    ) -> List[Dict]:
+        """Ask the LLM for interview questions and cache the parsed result"""
+        request = dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_QGEN},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=1200
+        )
+        
+        if on_question is not None and hasattr(self.client, 'aio'):
+            questions_text = await self._stream_questions(request, on_question)
+        else:
+            response = await self._chat_completion(**request)
+            questions_text = response.choices[0].message.content.strip()
+        
+        questions = _extract_json(questions_text, '[')
+        
+        # Add IDs to questions
+        for i, q in enumerate(questions):
+            q['id'] = f"q_{i}"
+        
+        if self._llm_cache is not None:
+            self._llm_cache.set(cache_key, questions, expire=LLM_CACHE_TTL)
+        
+        return questions
+    
+    async def _stream_questions(self, request: Dict, on_question: Callable[[int, Dict], None]) -> str:
+        """
+        Stream the question-generation completion, reporting each question as soon
+        as its closing brace arrives
+        
+        Returns:
+            The full response text
+        """
+        stream = await self._chat_completion(**request, stream=True)
+        scanner = _StreamingArrayScanner()
+        index = 0
+        
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            for question_text in scanner.feed(delta):
+                try:
+                    on_question(index, _json_loads(question_text))
+                except ValueError:
+                    pass  # Malformed object - the full parse below decides what to keep
+                index += 1
+        
+        return scanner.text.strip()
+    
     def _get_default_questions(self, interview_type: str, skills: List[str]) -> List[Dict]:
         """Fallback default questions"""
         if interview_type == "technical":
@@ -270,7 +585,7 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
                 }
             ]
     
-    def submit_answer(
+    async def submit_answer(
         self,
         session_id: str,
         answer: str
@@ -285,19 +600,21 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
         Returns:
             Dictionary with feedback and next question (if any)
         """
-        if session_id not in self.sessions:
+        session = await self.sessions.get(session_id)
+        if session is None:
             return {'success': False, 'error': 'Session not found'}
         
-        session = self.sessions[session_id]
         current_index = session['current_question_index']
         current_question = session['questions'][current_index]
         
-        # Evaluate answer
-        feedback = self._evaluate_answer(
-            current_question,
-            answer,
-            session['resume_data']
-        )
+        # Evaluate answer now for real-time feedback, otherwise defer to one batched call at the end
+        feedback = None
+        if session.get('realtime_feedback', True):
+            feedback = await self._evaluate_answer(
+                current_question,
+                answer,
+                session['resume_data']
+            )
         
         # Store answer and feedback
         session['answers'].append({
@@ -305,7 +622,8 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
             'answer': answer,
             'timestamp': datetime.now().isoformat()
         })
-        session['feedback'].append(feedback)
+        if feedback is not None:
+            session['feedback'].append(feedback)
         
         # Move to next question
         session['current_question_index'] += 1
@@ -316,8 +634,17 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
             session['status'] = 'completed'
             session['completed_at'] = datetime.now().isoformat()
             
+            # Evaluate all deferred answers in a single LLM call
+            if len(session['feedback']) < len(session['answers']):
+                session['feedback'] = await self._evaluate_answers_batch([
+                    (question, entry['answer'])
+                    for question, entry in zip(session['questions'], session['answers'])
+                ])
+                feedback = session['feedback'][-1]
+            
             # Generate final report
             report = self._generate_report(session)
+            await self.sessions.set(session_id, session)
             
             return {
                 'success': True,
@@ -326,15 +653,9 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
                 'final_report': report
             }
         
-        # Get next question
+        # Get next question (audio was generated when the session started)
         next_question = session['questions'][next_index]
-        
-        # Generate voice for next question
-        audio_path = self._text_to_speech(
-            next_question['question'],
-            session_id,
-            next_index
-        )
+        await self.sessions.set(session_id, session)
         
         return {
             'success': True,
@@ -352,7 +673,7 @@ Make questions realistic and relevant to their background. Return ONLY valid JSO
             }
         }
     
-    def _evaluate_answer(
+    async def _evaluate_answer(
         self,
         question: Dict,
         answer: str,
@@ -395,39 +716,119 @@ Score from 0-10 where:
 
 Return ONLY valid JSON."""
 
+        # Boilerplate answers ("I don't know") repeat across sessions
+        cache_key = _prompt_key(prompt)
+        if self._llm_cache is not None:
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            response = self.client.chat.completions.create(
+            response = await self._chat_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert interviewer. Always respond with valid JSON only."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=800
+                max_tokens=400,  # ~150-token schema plus headroom for Gemini 2.5 thinking tokens
+                response_format={"type": "json_object"}
             )
             
             feedback_text = response.choices[0].message.content.strip()
             
-            # Extract JSON
-            json_start = feedback_text.find('{')
-            json_end = feedback_text.rfind('}') + 1
-            if json_start != -1 and json_end > json_start:
-                feedback_text = feedback_text[json_start:json_end]
-            
-            feedback = json.loads(feedback_text)
+            feedback = _extract_json(feedback_text, '{')
             feedback['question_type'] = question['type']
             
+            if self._llm_cache is not None:
+                self._llm_cache.set(cache_key, feedback, expire=LLM_CACHE_TTL)
+            
             return feedback
             
         except Exception as e:
             print(f"Error evaluating answer: {e}")
-            return {
-                'score': 5.0,
-                'strengths': ["Answer provided"],
-                'areas_for_improvement': ["Could provide more detail"],
-                'feedback': "Thank you for your answer. Consider providing more specific examples.",
-                'question_type': question['type']
-            }
+            return self._default_feedback(question)
+    
+    async def _evaluate_answers_batch(self, questions_and_answers: List[tuple]) -> List[Dict]:
+        """
+        Evaluate several answers with a single LLM call
+        
+        Args:
+            questions_and_answers: List of (question dict, answer text) pairs
+        
+        Returns:
+            List of feedback dictionaries, in the same order as the input
+        """
+        count = len(questions_and_answers)
+        if count == 0:
+            return []
+        
+        blocks = "\n\n".join(
+            f"""Q{i}: {question['question']}
+Type: {question['type']}
+Expected Points: {', '.join(question.get('expected_points', []))}
+A{i}: {answer}"""
+            for i, (question, answer) in enumerate(questions_and_answers, 1)
+        )
+        
+        prompt = f"""You are an expert interviewer evaluating a candidate's answers.
+
+Evaluate each of the following {count} answers. Return a JSON array of {count} feedback objects in the same order.
+
+{blocks}
+
+Each feedback object must use this exact JSON format:
+{{
+  "score": 7.5,
+  "strengths": ["point1", "point2"],
+  "areas_for_improvement": ["point1", "point2"],
+  "feedback": "Brief constructive feedback (2-3 sentences)",
+  "follow_up_suggestion": "Optional follow-up question or suggestion"
+}}
+
+Score from 0-10 where:
+- 0-3: Poor answer, missing key points
+- 4-6: Average answer, covers basics
+- 7-8: Good answer, covers most points well
+- 9-10: Excellent answer, comprehensive and insightful
+
+Return ONLY valid JSON array."""
+
+        try:
+            response = await self._chat_completion(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are an expert interviewer. Always respond with valid JSON only."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=min(400 * count, 4000)
+            )
+            
+            feedback_text = response.choices[0].message.content.strip()
+            
+            feedback_list = _extract_json(feedback_text, '[')
+            if len(feedback_list) != count:
+                raise ValueError(f"Expected {count} evaluations, got {len(feedback_list)}")
+            
+            for (question, _), feedback in zip(questions_and_answers, feedback_list):
+                feedback['question_type'] = question['type']
+            
+            return feedback_list
+            
+        except Exception as e:
+            print(f"Error batch evaluating answers: {e}")
+            return [self._default_feedback(question) for question, _ in questions_and_answers]
+    
+    def _default_feedback(self, question: Dict) -> Dict:
+        """Fallback feedback when AI evaluation fails"""
+        return {
+            'score': 5.0,
+            'strengths': ["Answer provided"],
+            'areas_for_improvement': ["Could provide more detail"],
+            'feedback': "Thank you for your answer. Consider providing more specific examples.",
+            'question_type': question['type']
+        }
     
     def _generate_report(self, session: Dict) -> Dict:
         """
@@ -441,22 +842,26 @@ Return ONLY valid JSON."""
         """
         feedback_list = session['feedback']
         
-        # Calculate scores
-        scores = [f.get('score', 0) for f in feedback_list]
-        average_score = sum(scores) / len(scores) if scores else 0
-        
-        # Group by question type
-        technical_scores = [f.get('score', 0) for f in feedback_list if f.get('question_type') == 'technical']
-        behavioral_scores = [f.get('score', 0) for f in feedback_list if f.get('question_type') == 'behavioral']
-        
-        # Collect all strengths and improvements
+        # Single pass: scores (overall and by question type), strengths and improvements
+        scores = []
+        technical_scores = []
+        behavioral_scores = []
         all_strengths = []
         all_improvements = []
         
         for f in feedback_list:
+            score = f.get('score', 0)
+            scores.append(score)
+            question_type = f.get('question_type')
+            if question_type == 'technical':
+                technical_scores.append(score)
+            elif question_type == 'behavioral':
+                behavioral_scores.append(score)
             all_strengths.extend(f.get('strengths', []))
             all_improvements.extend(f.get('areas_for_improvement', []))
         
+        average_score = fmean(scores) if scores else 0
+        
         # Overall assessment
         if average_score >= 8:
             overall = "Excellent"
@@ -473,12 +878,13 @@ Return ONLY valid JSON."""
             'overall_score': round(average_score, 2),
             'overall_assessment': overall,
             'scores_by_category': {
-                'technical': round(sum(technical_scores) / len(technical_scores), 2) if technical_scores else None,
-                'behavioral': round(sum(behavioral_scores) / len(behavioral_scores), 2) if behavioral_scores else None
+                'technical': round(fmean(technical_scores), 2) if technical_scores else None,
+                'behavioral': round(fmean(behavioral_scores), 2) if behavioral_scores else None
             },
             'total_questions': len(session['questions']),
-            'strengths': list(set(all_strengths))[:5],
-            'areas_for_improvement': list(set(all_improvements))[:5],
+            # Most frequent first, so recurring themes lead the report (ties keep answer order)
+            'strengths': [item for item, _ in Counter(all_strengths).most_common(5)],
+            'areas_for_improvement': [item for item, _ in Counter(all_improvements).most_common(5)],
             'duration_minutes': self._calculate_duration(session),
             'recommendations': self._generate_recommendations(average_score, all_improvements)
         }
@@ -505,10 +911,13 @@ Return ONLY valid JSON."""
             recommendations.append("Provide more specific examples from your experience")
             recommendations.append("Work on structuring your answers using the STAR method")
         
-        if any('technical' in imp.lower() for imp in improvements):
+        # Lowercase once, then search the joined text for each keyword
+        improvements_text = "\n".join(improvements).lower()
+        
+        if 'technical' in improvements_text:
             recommendations.append("Review core technical concepts in your skill areas")
         
-        if any('example' in imp.lower() for imp in improvements):
+        if 'example' in improvements_text:
             recommendations.append("Prepare specific examples for common interview questions")
         
         if not recommendations:
@@ -517,35 +926,140 @@ Return ONLY valid JSON."""
         
         return recommendations[:5]
     
-    def _text_to_speech(self, text: str, session_id: str, question_index: int) -> str:
+    async def _text_to_speech(self, text: str, session_id: str, question_index: int, lang: str = 'en') -> Optional[str]:
         """
         Convert text to speech using Google TTS
         
+        Audio is cached by content hash, so gTTS is only called the first time a
+        given question text is spoken.
+        
         Args:
             text: Text to convert
             session_id: Session identifier
             question_index: Question index
+            lang: Speech language
         
         Returns:
             Path to generated audio file
         """
         try:
-            # Generate speech
-            tts = gTTS(text=text, lang='en', slow=False)
+            audio_path = self._tts_cache_path(text, lang)
+            
+            if self._is_tts_cached(audio_path):
+                return audio_path
             
-            # Save audio file
-            audio_filename = f"{session_id}_q{question_index}.mp3"
-            audio_path = os.path.join(self.audio_dir, audio_filename)
-            tts.save(audio_path)
+            # Cache miss - generate speech (once, however many sessions ask for the same question at the same time)
+            await self._single_flight(audio_path, lambda: self._synthesize(text, lang, audio_path))
+            self._tts_cached_paths.add(audio_path)
             
             return audio_path
             
         except Exception as e:
-            print(f"Error generating speech: {e}")
+            print(f"Error generating speech for {session_id} q{question_index}: {e}")
             return None
     
-    def get_audio_file(self, session_id: str, question_index: int) -> Optional[str]:
+    async def _synthesize(self, text: str, lang: str, audio_path: str):
+        """Write speech for text to audio_path on the TTS pool"""
+        tts = gTTS(text=text, lang=lang, slow=False)
+        save = self._save_opus if self.audio_format == "opus" else self._save_mp3
+        await asyncio.get_running_loop().run_in_executor(self._tts_pool, self._run_tts_job, save, tts, audio_path)
+    
+    def _run_tts_job(self, save: Callable[[gTTS, str], None], tts: gTTS, audio_path: str):
+        """Run a pool save while holding one of the TTS_WORKERS gTTS slots"""
+        with self._tts_slots:
+            save(tts, audio_path)
+    
+    def _save_mp3(self, tts: gTTS, audio_path: str):
+        """Save gTTS MP3 audio via a temp file, so other sessions never see a half-written cache file"""
+        fd, partial_path = tempfile.mkstemp(suffix='.part', dir=self.tts_cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as partial_file:
+                tts.write_to_fp(partial_file)
+            os.replace(partial_path, audio_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+    
+    def _save_opus(self, tts: gTTS, audio_path: str):
+        """Pipe gTTS MP3 bytes through ffmpeg into a 24kbps Opus/WebM file"""
+        mp3_buffer = BytesIO()
+        tts.write_to_fp(mp3_buffer)
+        
+        # Transcode into a temp file first so a half-written file is never served
+        fd, partial_path = tempfile.mkstemp(suffix='.part', dir=self.tts_cache_dir)
+        os.close(fd)
+        try:
+            subprocess.run(
+                ['ffmpeg', '-loglevel', 'error', '-y', '-i', 'pipe:0',
+                 '-c:a', 'libopus', '-b:a', '24k', '-f', 'webm', partial_path],
+                input=mp3_buffer.getvalue(),
+                check=True
+            )
+            os.replace(partial_path, audio_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+    
+    def _tts_cache_path(self, text: str, lang: str = 'en', audio_format: Optional[str] = None) -> str:
+        """Path of the content-hash cache file for a piece of speech"""
+        extension = "webm" if (audio_format or self.audio_format) == "opus" else "mp3"
+        return os.path.join(self.tts_cache_dir, f"{_tts_cache_key(text, lang)}.{extension}")
+    
+    def _is_tts_cached(self, audio_path: str) -> bool:
+        """Check whether speech audio has already been written to the cache"""
+        if audio_path in self._tts_cached_paths or os.path.exists(audio_path):
+            self._tts_cached_paths.add(audio_path)
+            return True
+        return False
+    
+    def _tts_stream(self, text: str, lang: str = 'en') -> Iterator[bytes]:
+        """
+        Stream MP3 speech audio chunks straight from gTTS
+        
+        Chunks are written to a temporary file as they are yielded and moved into
+        the TTS cache once the stream completes, so the next request for the same
+        text is served from disk.
+        
+        Args:
+            text: Text to convert
+            lang: Speech language
+        
+        Yields:
+            MP3 audio chunks
+        """
+        audio_path = self._tts_cache_path(text, lang, audio_format="mp3")
+        tts = gTTS(text=text, lang=lang, slow=False)
+        fd, partial_path = tempfile.mkstemp(suffix='.part', dir=self.tts_cache_dir)
+        
+        try:
+            with os.fdopen(fd, 'wb') as cache_file, self._tts_slots:
+                for chunk in tts.stream():
+                    cache_file.write(chunk)
+                    yield chunk
+            os.replace(partial_path, audio_path)
+            self._tts_cached_paths.add(audio_path)
+        finally:
+            # Client disconnected or gTTS failed - never leave a truncated file behind
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+    
+    async def get_audio_file(self, session_id: str, question_index: int) -> Optional[str]:
         """Get path to audio file for a question"""
+        session = await self.sessions.get(session_id)
+        if session:
+            audio_paths = session.get('audio_paths', [])
+            audio_path = audio_paths[question_index] if 0 <= question_index < len(audio_paths) else None
+            if audio_path and os.path.exists(audio_path):
+                return audio_path
+            
+            # Audio synthesized later (e.g. streamed by the audio route) lives in the content cache
+            questions = session.get('questions', [])
+            if 0 <= question_index < len(questions):
+                cached_path = self._tts_cache_path(questions[question_index]['question'])
+                if self._is_tts_cached(cached_path):
+                    return cached_path
+        
+        # Legacy per-session file naming
         audio_filename = f"{session_id}_q{question_index}.mp3"
         audio_path = os.path.join(self.audio_dir, audio_filename)
         
@@ -553,7 +1067,30 @@ Return ONLY valid JSON."""
             return audio_path
         return None
     
-    def get_session(self, session_id: str) -> Optional[Dict]:
+    async def get_question_text(self, session_id: str, question_index: int) -> Optional[str]:
+        """Get the text of a question so its audio can be streamed on demand"""
+        session = await self.sessions.get(session_id)
+        if not session:
+            return None
+        
+        questions = session.get('questions', [])
+        if 0 <= question_index < len(questions):
+            return questions[question_index]['question']
+        return None
+    
+    def stream_question_audio(self, text: str) -> Iterator[bytes]:
+        """Stream MP3 audio for a question that has no cached audio yet (cached on disk as it streams)"""
+        return self._tts_stream(text)
+    
+    async def render_question_audio(self, text: str, session_id: str, question_index: int) -> Optional[str]:
+        """Synthesize a question's audio in the configured format (MP3 or Opus/WebM) and return its path"""
+        return await self._text_to_speech(text, session_id, question_index)
+    
+    async def get_session(self, session_id: str) -> Optional[Dict]:
         """Get session data"""
-        return self.sessions.get(session_id)
+        return await self.sessions.get(session_id)
+    
+    def shutdown(self):
+        """Stop the TTS worker threads"""
+        self._tts_pool.shutdown(wait=False, cancel_futures=True)
 
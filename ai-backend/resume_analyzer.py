@@ -5,10 +5,105 @@ Extracts key information from resumes to generate relevant interview questions
 
 import os
 import re
-from typing import Dict, List, Optional
-import PyPDF2
-from docx import Document
-import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# pdfplumber, PyPDF2 and python-docx are imported on first use in _parse_pdf/_parse_docx:
+# pdfplumber alone drags in pdfminer, Pillow and cryptography, which endpoints that
+# never parse a resume shouldn't pay for at startup
+
+# Try to import PyMuPDF (fast native PDF text extraction)
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    fitz = None
+
+# Try to import pyahocorasick (single-pass multi-keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Patterns are compiled once at import instead of on every resume
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+
+# Common skill keywords
+_SKILL_KEYWORDS = [
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust', 'swift',
+    'react', 'angular', 'vue', 'node', 'express', 'django', 'flask', 'fastapi',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'firebase',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git',
+    'machine learning', 'deep learning', 'ai', 'data science', 'nlp',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
+    'html', 'css', 'tailwind', 'bootstrap',
+    'agile', 'scrum', 'devops', 'ci/cd'
+]
+# Display names computed once, in keyword order (also the order skills are reported in)
+_SKILL_TITLES = {skill: skill.title() for skill in _SKILL_KEYWORDS}
+
+# One alternation scans the text once (longest keywords first so prefixes don't win)
+_SKILLS_PATTERN = re.compile(
+    r'(?<!\w)(?:'
+    + '|'.join(re.escape(skill) for skill in sorted(_SKILL_KEYWORDS, key=len, reverse=True))
+    + r')(?!\w)',
+    re.IGNORECASE
+)
+
+# Projects section: a short header line mentioning "project", up to the next section header
+# (a short line with a section keyword anywhere, so "Technical Skills" / "Work Experience" end it too)
+_PROJECT_SECTION_RE = re.compile(
+    r'^(?=[^\n]{0,29}\n)[^\n]*project[^\n]*\n(.*?)'
+    r'(?=^[^\n]{0,20}\b(?:experience|education|skills?|certifications?)\b[^\n]{0,10}$|\Z)',
+    re.IGNORECASE | re.DOTALL | re.MULTILINE
+)
+
+_CERT_KEYWORDS = [
+    'aws certified', 'azure certified', 'google cloud certified',
+    'certified kubernetes', 'cissp', 'comptia',
+    'pmp', 'scrum master', 'agile certified'
+]
+_CERT_TITLES = {cert: cert.title() for cert in _CERT_KEYWORDS}
+
+
+def _build_automaton(keywords: List[str]):
+    """Aho-Corasick automaton that finds every keyword in one pass over the text"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_automaton(_SKILL_KEYWORDS) if AHOCORASICK_AVAILABLE else None
+_CERT_AUTOMATON = _build_automaton(_CERT_KEYWORDS) if AHOCORASICK_AVAILABLE else None
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+# Degree keywords
+_EDU_RE = re.compile(
+    r'bachelor.*?(?:of|in)\s+[A-Za-z\s]+'
+    r'|master.*?(?:of|in)\s+[A-Za-z\s]+'
+    r'|phd.*?(?:in)?\s+[A-Za-z\s]+'
+    r'|b\.?tech|m\.?tech|b\.?e|m\.?e|b\.?sc|m\.?sc|mba|bba',
+    re.IGNORECASE
+)
+
+# Job titles
+_JOB_RE = re.compile(
+    r'(?:software|senior|junior|lead)\s+(?:engineer|developer|architect|analyst)'
+    r'|(?:data|ml|ai)\s+(?:scientist|engineer|analyst)'
+    r'|(?:full stack|frontend|backend|mobile)\s+developer'
+    r'|(?:project|product)\s+manager'
+    r'|intern(?:ship)?',
+    re.IGNORECASE
+)
 
 
 class ResumeAnalyzer:
@@ -46,40 +141,71 @@ class ResumeAnalyzer:
             'file_name': os.path.basename(file_path)
         }
     
+    def parse_resumes_batch(self, files: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Parse several resumes in parallel worker processes
+        
+        Parsing is CPU-bound Python (PDF extraction + regex), so processes sidestep the GIL.
+        
+        Args:
+            files: List of (file_path, file_type) pairs
+            max_workers: Worker process count (defaults to the CPU count)
+        
+        Returns:
+            One result per file, in order. Files that fail to parse get an
+            {'error', 'file_name'} entry instead of aborting the batch.
+        """
+        if len(files) <= 1:
+            return [_parse_resume_file(file_info) for file_info in files]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_resume_file, files))
+    
     def _parse_pdf(self, file_path: str) -> str:
         """Extract text from PDF"""
-        text = ""
+        parts = []
+        
+        # PyMuPDF first - MuPDF extracts text natively, much faster than pdfminer-based pdfplumber
+        if PYMUPDF_AVAILABLE:
+            try:
+                with fitz.open(file_path) as doc:
+                    parts = [page.get_text("text") for page in doc]
+                if any(part.strip() for part in parts):
+                    return "\n".join(parts) + "\n"
+                parts = []  # No text layer found - let pdfplumber try
+            except Exception as e:
+                print(f"PyMuPDF failed: {e}, trying pdfplumber...")
+                parts = []
         
         try:
-            # Try with pdfplumber first (better for complex PDFs)
+            # Then pdfplumber (better for complex PDFs)
+            import pdfplumber
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text)
         except Exception as e:
             print(f"pdfplumber failed: {e}, trying PyPDF2...")
             # Fallback to PyPDF2
             try:
+                import PyPDF2
                 with open(file_path, 'rb') as file:
                     pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
+                    parts = [page.extract_text() for page in pdf_reader.pages]
             except Exception as e2:
                 print(f"PyPDF2 also failed: {e2}")
                 raise ValueError("Could not parse PDF")
         
-        return text
+        return "\n".join(parts) + "\n" if parts else ""
     
     def _parse_docx(self, file_path: str) -> str:
         """Extract text from DOCX"""
+        from docx import Document
         doc = Document(file_path)
-        text = ""
+        parts = [paragraph.text for paragraph in doc.paragraphs]
         
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        
-        return text
+        return "\n".join(parts) + "\n" if parts else ""
     
     def _extract_information(self, text: str) -> Dict:
         """
@@ -117,56 +243,40 @@ class ResumeAnalyzer:
     
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = _EMAIL_RE.search(text)
         return match.group(0) if match else None
     
     def _extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number"""
-        phone_pattern = r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]'
-        match = re.search(phone_pattern, text)
+        match = _PHONE_RE.search(text)
         return match.group(0) if match else None
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract technical skills"""
-        skills = []
-        
-        # Common skill keywords
-        skill_keywords = [
-            'python', 'java', 'javascript', 'typescript', 'c\\+\\+', 'c#', 'ruby', 'go', 'rust', 'swift',
-            'react', 'angular', 'vue', 'node', 'express', 'django', 'flask', 'fastapi',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'firebase',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git',
-            'machine learning', 'deep learning', 'ai', 'data science', 'nlp',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'html', 'css', 'tailwind', 'bootstrap',
-            'agile', 'scrum', 'devops', 'ci/cd'
-        ]
-        
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if re.search(r'\b' + skill + r'\b', text_lower):
-                skills.append(skill.title())
+        if _SKILL_AUTOMATON is not None:
+            text_lower = text.lower()
+            found = set()
+            for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+                start = end - len(skill) + 1
+                # Whole words only (same as the regex alternation)
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                    continue
+                found.add(skill)
+        else:
+            found = {match.lower() for match in _SKILLS_PATTERN.findall(text)}
         
-        return list(set(skills))  # Remove duplicates
+        # found is already deduplicated - just map to display names in a stable order
+        return [title for skill, title in _SKILL_TITLES.items() if skill in found]
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract education information"""
         education = []
         
         # Look for degree keywords
-        degree_patterns = [
-            r'bachelor.*?(?:of|in)\s+([A-Za-z\s]+)',
-            r'master.*?(?:of|in)\s+([A-Za-z\s]+)',
-            r'phd.*?(?:in)?\s+([A-Za-z\s]+)',
-            r'b\.?tech|m\.?tech|b\.?e|m\.?e|b\.?sc|m\.?sc|mba|bba',
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                education.append(match.group(0).strip())
+        for match in _EDU_RE.finditer(text):
+            education.append(match.group(0).strip())
         
         return education if education else ['Not specified']
     
@@ -175,61 +285,41 @@ class ResumeAnalyzer:
         experience = []
         
         # Look for job titles and company names
-        job_patterns = [
-            r'(?:software|senior|junior|lead|senior)\s+(?:engineer|developer|architect|analyst)',
-            r'(?:data|ml|ai)\s+(?:scientist|engineer|analyst)',
-            r'(?:full stack|frontend|backend|mobile)\s+developer',
-            r'(?:project|product)\s+manager',
-            r'intern(?:ship)?'
-        ]
-        
-        for pattern in job_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                experience.append({
-                    'title': match.group(0).strip()
-                })
+        for match in _JOB_RE.finditer(text):
+            experience.append({
+                'title': match.group(0).strip()
+            })
         
         return experience if experience else [{'title': 'Entry Level / Fresher'}]
     
     def _extract_projects(self, text: str) -> List[str]:
         """Extract project information"""
-        projects = []
-        
-        # Look for project section
-        lines = text.split('\n')
-        in_project_section = False
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            if 'project' in line_lower and len(line_lower) < 30:
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                if line.strip() and not line.startswith(' ') and len(line.strip()) > 15:
-                    if any(keyword in line_lower for keyword in ['experience', 'education', 'skill', 'certification']):
-                        break
-                    projects.append(line.strip())
-        
-        return projects[:5] if projects else []  # Limit to 5 projects
+        match = _PROJECT_SECTION_RE.search(text)
+        if not match:
+            return []
+        
+        projects = [
+            line.strip() for line in match.group(1).splitlines()
+            if len(line.strip()) > 15 and not line.startswith(' ')
+        ]
+        return projects[:5]  # Limit to 5 projects
     
     def _extract_certifications(self, text: str) -> List[str]:
         """Extract certifications"""
-        certifications = []
-        
-        cert_keywords = [
-            'aws certified', 'azure certified', 'google cloud certified',
-            'certified kubernetes', 'cissp', 'comptia',
-            'pmp', 'scrum master', 'agile certified'
-        ]
-        
         text_lower = text.lower()
         
-        for cert in cert_keywords:
-            if cert in text_lower:
-                certifications.append(cert.title())
+        if _CERT_AUTOMATON is not None:
+            found = {cert for _, cert in _CERT_AUTOMATON.iter(text_lower)}
+            return [title for cert, title in _CERT_TITLES.items() if cert in found]
         
-        return certifications
+        # Plain substring checks - each `in` is a C-level search, no regex needed
+        return [title for cert, title in _CERT_TITLES.items() if cert in text_lower]
+
 
+def _parse_resume_file(file_info: Tuple[str, str]) -> Dict:
+    """Worker entry point for parse_resumes_batch (module-level so it can be pickled)"""
+    file_path, file_type = file_info
+    try:
+        return ResumeAnalyzer().parse_resume(file_path, file_type)
+    except Exception as e:
+        return {'error': str(e), 'file_name': os.path.basename(file_path)}
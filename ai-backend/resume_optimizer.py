@@ -5,8 +5,77 @@ Analyzes resumes and provides improvement suggestions
 
 from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
+from functools import lru_cache
+import hashlib
+import json
 import re
 
+# Try to import cachetools (bounded LRU cache for repeated analyses)
+try:
+    from cachetools import LRUCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+    LRUCache = None
+
+# Try to import orjson (faster parsing of LLM JSON responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Try to load a tokenizer (clip prompt inputs by tokens rather than characters)
+try:
+    import tiktoken
+    _TOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    # Not installed, or the encoding file couldn't be fetched
+    _TOKEN_ENCODING = None
+
+ANALYSIS_CACHE_SIZE = 256
+RESUME_PROMPT_TOKENS = 500  # ~2000 characters, the previous cut-off
+JOB_DESCRIPTION_PROMPT_TOKENS = 1000
+
+
+# Fenced ```json ... ``` block in an LLM response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+
+
+def _extract_json(result_text: str):
+    """Parse an LLM JSON response, unwrapping a markdown code fence only if the bare text isn't JSON"""
+    try:
+        return _json_loads(result_text)
+    except ValueError:
+        match = _JSON_BLOCK_RE.search(result_text)
+        if not match:
+            raise
+        return _json_loads(match.group(1).strip())
+
+
+@lru_cache(maxsize=128)
+def _clip_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Clip text to roughly max_tokens tokens for a prompt
+    
+    cl100k_base is an approximation for Gemini's tokenizer, but keeps prompt size
+    predictable. Without tiktoken, falls back to ~4 characters per token.
+    """
+    if _TOKEN_ENCODING is None:
+        return text[:max_tokens * 4]
+    
+    tokens = _TOKEN_ENCODING.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return _TOKEN_ENCODING.decode(tokens[:max_tokens])
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
 
 class ResumeOptimizer:
     """AI-powered resume analysis and optimization"""
@@ -15,20 +84,74 @@ class ResumeOptimizer:
         self.client = ai_client
         # Use the model from the client (dynamic based on provider)
         self.model = getattr(ai_client, 'model_name', 'gemini-2.5-flash')
+        # Parsed LLM results keyed by prompt hash - re-uploading the same resume skips the LLM
+        self._cache = LRUCache(maxsize=ANALYSIS_CACHE_SIZE) if CACHETOOLS_AVAILABLE else {}
     
-    def analyze_resume(self, resume_text: str, resume_summary: Dict) -> Dict:
-        """
-        Comprehensive resume analysis with scoring and suggestions
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key covering the model and every input that went into the prompt"""
+        return hashlib.sha256(f"{self.model}|{prompt}".encode()).hexdigest()
+    
+    def _cache_result(self, key: str, result: Dict):
+        """Store a parsed result (the plain-dict fallback is cleared when full)"""
+        if not CACHETOOLS_AVAILABLE and len(self._cache) >= ANALYSIS_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = result
+    
+    def _json_request(self, system_prompt: str, prompt: str, temperature: float, max_tokens: int, cache: bool) -> Dict:
+        """Chat completion parameters plus the cache key (None when the result shouldn't be cached)"""
+        return {
+            'params': dict(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens
+            ),
+            'cache_key': self._cache_key(prompt) if cache else None
+        }
+    
+    def _complete_json(self, request: Dict) -> Dict:
+        """Run an LLM request and parse its JSON reply"""
+        cache_key = request['cache_key']
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        Args:
-            resume_text: Raw text extracted from resume
-            resume_summary: Parsed resume data (name, skills, experience, etc.)
+        response = self.client.chat.completions.create(**request['params'])
+        return self._parse_result(response, cache_key)
+    
+    async def _acomplete_json(self, request: Dict) -> Dict:
+        """Async version of _complete_json (awaits the async client when available)"""
+        cache_key = request['cache_key']
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        Returns:
-            Analysis with score, strengths, weaknesses, and suggestions
-        """
-        try:
-            prompt = f"""Analyze this resume and provide a comprehensive evaluation:
+        if hasattr(self.client, 'aio'):
+            response = await self.client.aio.chat.completions.create(**request['params'])
+        else:
+            response = await asyncio.to_thread(self.client.chat.completions.create, **request['params'])
+        return self._parse_result(response, cache_key)
+    
+    def _parse_result(self, response, cache_key: Optional[str]) -> Dict:
+        result = _extract_json(response.choices[0].message.content.strip())
+        if cache_key is not None:
+            self._cache_result(cache_key, result)
+        return result
+    
+    def _success(self, key: str, value: Dict) -> Dict:
+        return {
+            "success": True,
+            key: value,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _analysis_request(self, resume_text: str, resume_summary: Dict) -> Dict:
+        prompt = f"""Analyze this resume and provide a comprehensive evaluation:
 
 RESUME CONTENT:
 Name: {resume_summary.get('name', 'Not provided')}
@@ -39,7 +162,7 @@ Experience: {', '.join(resume_summary.get('experience', []))}
 Education: {', '.join(resume_summary.get('education', []))}
 
 FULL TEXT:
-{resume_text[:2000]}...
+{_clip_to_tokens(resume_text, RESUME_PROMPT_TOKENS)}...
 
 Provide analysis in JSON format:
 {{
@@ -76,62 +199,16 @@ Provide analysis in JSON format:
 
 Return ONLY valid JSON."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert resume reviewer and career coach. Provide honest, constructive feedback. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-            
-            import json
-            analysis = json.loads(result_text)
-            
-            return {
-                "success": True,
-                "analysis": analysis,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            print(f"Error analyzing resume: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "analysis": self._generate_fallback_analysis(resume_summary)
-            }
+        return self._json_request(
+            "You are an expert resume reviewer and career coach. Provide honest, constructive feedback. Return only valid JSON.",
+            prompt,
+            temperature=0.7,
+            max_tokens=2000,
+            cache=True
+        )
     
-    def tailor_resume_for_job(
-        self,
-        resume_summary: Dict,
-        job_title: str,
-        job_description: str,
-        company: str
-    ) -> Dict:
-        """
-        Tailor resume content to match specific job posting
-        
-        Args:
-            resume_summary: Current resume data
-            job_title: Target job title
-            job_description: Job posting description
-            company: Company name
-        
-        Returns:
-            Optimized resume content suggestions
-        """
-        try:
-            prompt = f"""Optimize this resume for the following job:
+    def _tailor_request(self, resume_summary: Dict, job_title: str, job_description: str, company: str) -> Dict:
+        prompt = f"""Optimize this resume for the following job:
 
 CURRENT RESUME:
 Name: {resume_summary.get('name', 'Candidate')}
@@ -141,7 +218,7 @@ Experience: {', '.join(resume_summary.get('experience', []))}
 TARGET JOB:
 Company: {company}
 Title: {job_title}
-Description: {job_description}
+Description: {_clip_to_tokens(job_description, JOB_DESCRIPTION_PROMPT_TOKENS)}
 
 Provide tailored resume suggestions in JSON:
 {{
@@ -170,63 +247,20 @@ Provide tailored resume suggestions in JSON:
 
 Return ONLY valid JSON."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a resume optimization expert. Help candidates tailor their resume to specific jobs. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-            
-            import json
-            optimization = json.loads(result_text)
-            
-            return {
-                "success": True,
-                "optimization": optimization,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            print(f"Error tailoring resume: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return self._json_request(
+            "You are a resume optimization expert. Help candidates tailor their resume to specific jobs. Return only valid JSON.",
+            prompt,
+            temperature=0.7,
+            max_tokens=2000,
+            cache=True
+        )
     
-    def generate_resume_bullet_points(
-        self,
-        job_title: str,
-        responsibilities: List[str],
-        achievements: Optional[List[str]] = None
-    ) -> Dict:
-        """
-        Generate professional bullet points for resume experience section
+    def _bullet_points_request(self, job_title: str, responsibilities: List[str], achievements: Optional[List[str]]) -> Dict:
+        achievements_text = ""
+        if achievements:
+            achievements_text = f"\nAchievements: {', '.join(achievements)}"
         
-        Args:
-            job_title: Job title
-            responsibilities: List of responsibilities
-            achievements: Optional list of achievements
-        
-        Returns:
-            Professional bullet points
-        """
-        try:
-            achievements_text = ""
-            if achievements:
-                achievements_text = f"\nAchievements: {', '.join(achievements)}"
-            
-            prompt = f"""Generate 5-7 professional resume bullet points for this role:
+        prompt = f"""Generate 5-7 professional resume bullet points for this role:
 
 Job Title: {job_title}
 Responsibilities: {', '.join(responsibilities)}
@@ -254,33 +288,119 @@ Return as JSON:
 
 Return ONLY valid JSON."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer. Create compelling, achievement-focused bullet points. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,
-                max_tokens=1500
+        # Not cached: asking again is how users get an alternative set
+        return self._json_request(
+            "You are a professional resume writer. Create compelling, achievement-focused bullet points. Return only valid JSON.",
+            prompt,
+            temperature=0.8,
+            max_tokens=1500,
+            cache=False
+        )
+    
+    def analyze_resume(self, resume_text: str, resume_summary: Dict) -> Dict:
+        """
+        Comprehensive resume analysis with scoring and suggestions
+        
+        Args:
+            resume_text: Raw text extracted from resume
+            resume_summary: Parsed resume data (name, skills, experience, etc.)
+        
+        Returns:
+            Analysis with score, strengths, weaknesses, and suggestions
+        """
+        try:
+            analysis = self._complete_json(self._analysis_request(resume_text, resume_summary))
+            return self._success("analysis", analysis)
+        except Exception as e:
+            return self._analysis_failure(e, resume_summary)
+    
+    async def analyze_resume_async(self, resume_text: str, resume_summary: Dict) -> Dict:
+        """Async version of analyze_resume"""
+        try:
+            analysis = await self._acomplete_json(self._analysis_request(resume_text, resume_summary))
+            return self._success("analysis", analysis)
+        except Exception as e:
+            return self._analysis_failure(e, resume_summary)
+    
+    def _analysis_failure(self, error: Exception, resume_summary: Dict) -> Dict:
+        print(f"Error analyzing resume: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "analysis": self._generate_fallback_analysis(resume_summary)
+        }
+    
+    def tailor_resume_for_job(
+        self,
+        resume_summary: Dict,
+        job_title: str,
+        job_description: str,
+        company: str
+    ) -> Dict:
+        """
+        Tailor resume content to match specific job posting
+        
+        Args:
+            resume_summary: Current resume data
+            job_title: Target job title
+            job_description: Job posting description
+            company: Company name
+        
+        Returns:
+            Optimized resume content suggestions
+        """
+        try:
+            optimization = self._complete_json(
+                self._tailor_request(resume_summary, job_title, job_description, company)
             )
-            
-            result_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-            
-            import json
-            result = json.loads(result_text)
-            
+            return self._success("optimization", optimization)
+        except Exception as e:
+            print(f"Error tailoring resume: {e}")
             return {
-                "success": True,
-                "result": result,
-                "timestamp": datetime.now().isoformat()
+                "success": False,
+                "error": str(e)
             }
-            
+    
+    async def tailor_resume_for_job_async(
+        self,
+        resume_summary: Dict,
+        job_title: str,
+        job_description: str,
+        company: str
+    ) -> Dict:
+        """Async version of tailor_resume_for_job"""
+        try:
+            optimization = await self._acomplete_json(
+                self._tailor_request(resume_summary, job_title, job_description, company)
+            )
+            return self._success("optimization", optimization)
+        except Exception as e:
+            print(f"Error tailoring resume: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def generate_resume_bullet_points(
+        self,
+        job_title: str,
+        responsibilities: List[str],
+        achievements: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Generate professional bullet points for resume experience section
+        
+        Args:
+            job_title: Job title
+            responsibilities: List of responsibilities
+            achievements: Optional list of achievements
+        
+        Returns:
+            Professional bullet points
+        """
+        try:
+            result = self._complete_json(self._bullet_points_request(job_title, responsibilities, achievements))
+            return self._success("result", result)
         except Exception as e:
             print(f"Error generating bullet points: {e}")
             return {
@@ -288,6 +408,64 @@ Return ONLY valid JSON."""
                 "error": str(e)
             }
     
+    async def generate_resume_bullet_points_async(
+        self,
+        job_title: str,
+        responsibilities: List[str],
+        achievements: Optional[List[str]] = None
+    ) -> Dict:
+        """Async version of generate_resume_bullet_points"""
+        try:
+            result = await self._acomplete_json(self._bullet_points_request(job_title, responsibilities, achievements))
+            return self._success("result", result)
+        except Exception as e:
+            print(f"Error generating bullet points: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    async def full_review_async(
+        self,
+        resume_text: str,
+        resume_summary: Dict,
+        job_title: str,
+        job_description: str,
+        company: str,
+        responsibilities: Optional[List[str]] = None,
+        achievements: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Analysis, job tailoring and (optionally) bullet points for one resume, with the
+        LLM calls running concurrently instead of back to back
+        
+        Args:
+            resume_text: Raw text extracted from resume
+            resume_summary: Parsed resume data
+            job_title: Target job title
+            job_description: Job posting description
+            company: Company name
+            responsibilities: Responsibilities to turn into bullet points (skipped if None)
+            achievements: Optional achievements for the bullet points
+        
+        Returns:
+            Dictionary with 'analysis', 'tailoring' and 'bullet_points' results
+        """
+        tasks = [
+            self.analyze_resume_async(resume_text, resume_summary),
+            self.tailor_resume_for_job_async(resume_summary, job_title, job_description, company),
+        ]
+        if responsibilities:
+            tasks.append(self.generate_resume_bullet_points_async(job_title, responsibilities, achievements))
+        
+        results = await asyncio.gather(*tasks)
+        
+        return {
+            "analysis": results[0],
+            "tailoring": results[1],
+            "bullet_points": results[2] if responsibilities else None
+        }
+    
     def _generate_fallback_analysis(self, resume_summary: Dict) -> Dict:
         """Generate basic analysis if AI fails"""
         skills_count = len(resume_summary.get('skills', []))
@@ -0,0 +1,105 @@
+"""
+Session Storage for Mock Interviews
+Bounded in-memory store for single-process deployments, Redis for multi-worker deployments
+"""
+
+import os
+import json
+from typing import Dict, Optional, Protocol
+
+# Try to import cachetools (bounded TTL cache)
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+    TTLCache = None
+
+# Try to import Redis asyncio client (optional, for multi-worker deployments)
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+
+# Try to import orjson (faster session serialization)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+SESSION_MAX_COUNT = 10_000
+SESSION_TTL_SECONDS = 3600
+
+
+class SessionStore(Protocol):
+    """Interface for interview session storage"""
+
+    async def get(self, session_id: str) -> Optional[Dict]:
+        ...
+
+    async def set(self, session_id: str, session: Dict) -> None:
+        ...
+
+    async def delete(self, session_id: str) -> None:
+        ...
+
+
+class InMemorySessionStore:
+    """Per-process session store that evicts idle sessions instead of growing forever"""
+
+    def __init__(self, maxsize: int = SESSION_MAX_COUNT, ttl: int = SESSION_TTL_SECONDS):
+        if CACHETOOLS_AVAILABLE:
+            self._sessions = TTLCache(maxsize=maxsize, ttl=ttl)
+        else:
+            print("⚠️  cachetools not installed - interview sessions will not expire")
+            self._sessions = {}
+
+    async def get(self, session_id: str) -> Optional[Dict]:
+        return self._sessions.get(session_id)
+
+    async def set(self, session_id: str, session: Dict) -> None:
+        self._sessions[session_id] = session
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """Session store shared by all Uvicorn workers"""
+
+    def __init__(self, redis_client, ttl: int = SESSION_TTL_SECONDS, prefix: str = "interview_session:"):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, session_id: str) -> Optional[Dict]:
+        data = await self.redis.get(self.prefix + session_id)
+        if data is None:
+            return None
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    async def set(self, session_id: str, session: Dict) -> None:
+        data = orjson.dumps(session) if ORJSON_AVAILABLE else json.dumps(session)
+        await self.redis.set(self.prefix + session_id, data, ex=self.ttl)
+
+    async def delete(self, session_id: str) -> None:
+        await self.redis.delete(self.prefix + session_id)
+
+
+def create_session_store() -> SessionStore:
+    """Use Redis when REDIS_URL is set, otherwise a bounded in-memory store"""
+    redis_url = os.getenv("REDIS_URL")
+
+    if redis_url and REDIS_AVAILABLE:
+        print("✅ Using Redis for interview sessions")
+        return RedisSessionStore(aioredis.from_url(redis_url))
+
+    if redis_url:
+        print("⚠️  REDIS_URL is set but redis is not installed. Run: pip install redis")
+
+    return InMemorySessionStore()
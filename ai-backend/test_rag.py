@@ -22,13 +22,13 @@ print("📚 Knowledge Base Status:")
 print(f"   Collection exists: ✅")
 print()
 
-for i, query in enumerate(test_queries, 1):
+# Search knowledge base (all queries in one batch)
+all_results = knowledge_base.search_batch(test_queries, n_results=2)
+
+for i, (query, results) in enumerate(zip(test_queries, all_results), 1):
     print(f"Test {i}: '{query}'")
     print("-" * 70)
     
-    # Search knowledge base
-    results = knowledge_base.search(query, n_results=2)
-    
     if results:
         print(f"✅ Found {len(results)} relevant documents:")
         for j, doc in enumerate(results, 1):
@@ -13,6 +13,40 @@ import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime
 import os
+import threading
+import time
+
+# Try to import orjson (much faster JSON encode/decode for the interaction log)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one JSONL record as newline-terminated UTF-8 bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+
+_timestamp_cache = (0, '')
+
+
+def _iso_timestamp() -> str:
+    """Local ISO-8601 timestamp at one-second resolution, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
+def _loads(line):
+    """Parse one JSONL record (str or bytes)"""
+    return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
 
 
 class TrainingDataCollector:
@@ -22,6 +56,22 @@ class TrainingDataCollector:
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
         self.data_file = os.path.join(data_dir, "interactions.jsonl")
+        # Append handle kept open across calls (unbuffered, so each record is one write)
+        self._log_file = None
+        self._log_lock = threading.Lock()
+    
+    def close(self):
+        """Flush and close the interaction log"""
+        with self._log_lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
         
     def log_interaction(
         self,
@@ -42,7 +92,8 @@ class TrainingDataCollector:
             metadata: Additional context (user_profile, etc.)
         """
         interaction = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_timestamp(),
+            'timestamp_ns': time.time_ns(),  # Full precision for ordering
             'user_query': user_query,
             'ai_response': ai_response,
             'feature': feature,
@@ -51,8 +102,11 @@ class TrainingDataCollector:
         }
         
         # Append to JSONL file
-        with open(self.data_file, 'a') as f:
-            f.write(json.dumps(interaction) + '\n')
+        line = _dumps_line(interaction)
+        with self._log_lock:
+            if self._log_file is None:
+                self._log_file = open(self.data_file, 'ab', buffering=0)
+            self._log_file.write(line)
             
         return interaction
     
@@ -71,12 +125,11 @@ class TrainingDataCollector:
         Returns:
             DataFrame with training data
         """
-        # Read JSONL file
+        # Read JSONL file in one buffered read, skipping blank lines
         data = []
         if os.path.exists(self.data_file):
-            with open(self.data_file, 'r') as f:
-                for line in f:
-                    data.append(json.loads(line))
+            with open(self.data_file, 'rb') as f:
+                data = [_loads(line) for line in f.read().splitlines() if line]
         
         df = pd.DataFrame(data)
         
@@ -94,23 +147,30 @@ class TrainingDataCollector:
             output_file: Path to output file
             format: 'jsonl' for OpenAI, 'csv' for others
         """
-        df = self.get_training_data()
+        count = 0
         
         if format == 'jsonl':
-            # OpenAI fine-tuning format
-            with open(output_file, 'w') as f:
-                for _, row in df.iterrows():
-                    example = {
-                        'messages': [
-                            {'role': 'user', 'content': row['user_query']},
-                            {'role': 'assistant', 'content': row['ai_response']}
-                        ]
-                    }
-                    f.write(json.dumps(example) + '\n')
+            # OpenAI fine-tuning format - streamed line by line, no DataFrame needed
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'rb') as fin, open(output_file, 'wb') as fout:
+                    for line in fin:
+                        row = _loads(line)
+                        example = {
+                            'messages': [
+                                {'role': 'user', 'content': row['user_query']},
+                                {'role': 'assistant', 'content': row['ai_response']}
+                            ]
+                        }
+                        fout.write(_dumps_line(example))
+                        count += 1
+            else:
+                open(output_file, 'w').close()
         elif format == 'csv':
+            df = self.get_training_data()
             df.to_csv(output_file, index=False)
+            count = len(df)
             
-        print(f"✅ Exported {len(df)} training examples to {output_file}")
+        print(f"✅ Exported {count} training examples to {output_file}")
         return output_file
 
 
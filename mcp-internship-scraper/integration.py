@@ -2,17 +2,139 @@
 Integration script to use the internship scraper with FastAPI backend
 """
 
+import copy
 import sys
 import os
-sys.path.append(os.path.dirname(__file__))
-
-from server import InternshipScraper
+import threading
+from functools import lru_cache
+from typing import AsyncIterator, Dict
 import json
 
+# Try to import orjson (much faster JSON encoding for scrape_internships_json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Try to import cachetools (TTL cache for repeated searches)
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+    TTLCache = None
+
+RESULT_CACHE_SIZE = 512
+RESULT_CACHE_TTL_SECONDS = 300
+
+# Listings barely change within a few minutes, so identical searches are served from memory
+_result_cache = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS) if CACHETOOLS_AVAILABLE else None
+# The sync wrapper may run on several threads at once
+_result_cache_lock = threading.Lock()
+
+
+def _result_cache_key(query: str, location: str, max_results: int):
+    return (query.lower().strip(), location.lower().strip(), max_results)
+
+
+@lru_cache(maxsize=1)
+def _get_scraper():
+    """
+    Import the scraping stack (requests, BeautifulSoup, MCP) on first use rather than
+    when this module is imported, and share one scraper instance across calls
+    """
+    # The directory name isn't a valid package name, so it goes on sys.path (once)
+    scraper_dir = os.path.dirname(os.path.abspath(__file__))
+    if scraper_dir not in sys.path:
+        sys.path.insert(0, scraper_dir)
+    
+    from server import InternshipScraper
+    return InternshipScraper()
+
+
+async def scrape_internships_for_backend_async(query: str, location: str = "", max_results: int = 20):
+    """
+    Scrape internships from all sources concurrently and return in format
+    compatible with backend API (await this from FastAPI handlers)
+    
+    Args:
+        query: Search query (e.g., "software engineering")
+        location: Location filter (e.g., "Remote", "San Francisco")
+        max_results: Maximum results per source
+    
+    Returns:
+        List of internship dictionaries
+    """
+    return await _scrape_for_backend(query, location, max_results, _get_scraper().get_session())
+
+
+async def _scrape_for_backend(query: str, location: str, max_results: int, session):
+    cache_key = _result_cache_key(query, location, max_results)
+    if _result_cache is not None:
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+        if cached is not None:
+            # Copy so callers can't mutate the cached entry
+            return copy.deepcopy(cached)
+    
+    scraper = _get_scraper()
+    formatted = await scraper.scrape_all_sources_async(
+        query, location, max_results, session=session, record_format="backend"
+    )
+    
+    if _result_cache is not None and formatted:
+        with _result_cache_lock:
+            _result_cache[cache_key] = formatted
+        return copy.deepcopy(formatted)
+    
+    return formatted
+
+
+async def stream_internships_for_backend(query: str, location: str = "", max_results: int = 20) -> AsyncIterator[Dict]:
+    """
+    Yield backend-formatted internships as each source finishes, so the first results
+    arrive as soon as the fastest source responds (e.g. for an NDJSON StreamingResponse)
+    
+    Args:
+        query: Search query (e.g., "software engineering")
+        location: Location filter (e.g., "Remote", "San Francisco")
+        max_results: Maximum results per source
+    
+    Yields:
+        Internship dictionaries, deduplicated across sources
+    """
+    cache_key = _result_cache_key(query, location, max_results)
+    if _result_cache is not None:
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+        if cached is not None:
+            for internship in copy.deepcopy(cached):
+                yield internship
+            return
+    
+    scraper = _get_scraper()
+    from server import dedupe_key, to_backend_record
+    seen = set()
+    async for _, internships in scraper.iter_sources_async(
+        query, location, max_results, session=scraper.get_session()
+    ):
+        for internship in internships:
+            key = dedupe_key(internship)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield to_backend_record(internship)
+
+
 def scrape_internships_for_backend(query: str, location: str = "", max_results: int = 20):
     """
     Scrape internships and return in format compatible with backend API
     
+    Blocking wrapper around scrape_internships_for_backend_async - it starts its own
+    event loop, so code that is already async should await the async version instead.
+    
     Args:
         query: Search query (e.g., "software engineering")
         location: Location filter (e.g., "Remote", "San Francisco")
@@ -21,29 +143,38 @@ def scrape_internships_for_backend(query: str, location: str = "", max_results:
     Returns:
         List of internship dictionaries
     """
-    scraper = InternshipScraper()
-    internships = scraper.scrape_all_sources(query, location, max_results)
-    
-    # Format for backend compatibility
-    formatted = []
-    for internship in internships:
-        formatted.append({
-            'title': internship['title'],
-            'company': internship['company'],
-            'description': internship.get('description', ''),
-            'location': internship['location'],
-            'type': 'Internship',
-            'duration': 'Not specified',
-            'requiredSkills': [],  # Could be extracted from description
-            'benefits': [],
-            'applicationTips': f"Apply via {internship['source']}",
-            'matchScore': 75,  # Default score
-            'url': internship.get('url', ''),
-            'source': internship['source'],
-            'scraped_at': internship.get('scraped_at', '')
-        })
+    _get_scraper()  # Puts server on sys.path
+    from server import run_async
     
-    return formatted
+    # A fresh event loop per call can't reuse the shared session, so use a temporary one
+    return run_async(_scrape_for_backend(query, location, max_results, None))
+
+
+async def close_scraper():
+    """Release the shared scraper's connections (call from the app's shutdown hook)"""
+    if _get_scraper.cache_info().currsize:
+        await _get_scraper().aclose()
+
+
+async def scrape_internships_json(query: str, location: str = "", max_results: int = 20) -> bytes:
+    """
+    Same as scrape_internships_for_backend_async, but already encoded as a JSON array
+    (return it as Response(content=..., media_type="application/json") to skip
+    FastAPI's own encoding pass)
+    
+    Args:
+        query: Search query (e.g., "software engineering")
+        location: Location filter (e.g., "Remote", "San Francisco")
+        max_results: Maximum results per source
+    
+    Returns:
+        UTF-8 JSON bytes
+    """
+    formatted = await scrape_internships_for_backend_async(query, location, max_results)
+    
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(formatted)
+    return json.dumps(formatted).encode('utf-8')
 
 
 if __name__ == "__main__":
@@ -7,14 +7,61 @@ Uses multiple scraping approaches:
 2. Selenium (fallback) - Browser automation for JavaScript-heavy sites
 """
 
+import asyncio
+import atexit
+import copy
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import cycle, islice, repeat
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus, urljoin
-from typing import Dict, List, Optional, TYPE_CHECKING
+from requests.adapters import HTTPAdapter
+# Encodings urllib3 can decode here - includes br / zstd when brotli / zstandard are installed
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString
+from urllib.parse import quote_plus, urljoin, urlparse
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 import time
 import re
 import json
+from xml.etree import ElementTree
+
+# Prefer lxml's C tokenizer for BeautifulSoup; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Try to import requests-cache (persistent HTTP cache for repeat searches)
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+    requests_cache = None  # type: ignore
+
+# Per-card progress goes to DEBUG (formatted only when enabled); per-scrape summaries stay on print
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'scraper')
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Try to import aiohttp (non-blocking page fetches for the *_async scrapers)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None  # type: ignore
 
 # Try to import Selenium (browser automation)
 try:
@@ -40,6 +87,764 @@ except ImportError:
     ChromeDriverManager = None  # type: ignore
 
 
+# One requests session for the whole process, so job-board connections stay pooled across scraper instances
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+# Transient server errors are retried on the pooled connection. 429 is left out - Indeed rate limits are
+# handled by the circuit breaker rather than by sleeping on Retry-After inside a request thread.
+HTTP_RETRY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    raise_on_status=False
+)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+# Bot-wall pages that come back as 200s (Cloudflare interstitials, "access denied" bodies)
+_BOT_WALL_MARKERS = (b'just a moment', b'access denied', b'captcha', b'unusual traffic')
+
+
+def _is_cacheable_response(response) -> bool:
+    """requests-cache filter: block pages are 200s too, and must not be replayed to every repeat search"""
+    if _is_indeed_block(response.status_code, response.url, response.content):
+        return False
+    head = response.content[:2000].lower()
+    return not any(marker in head for marker in _BOT_WALL_MARKERS)
+
+
+def _get_http_session(headers: Dict[str, str]):
+    """Shared (cached, when requests-cache is installed) requests session with a keep-alive pool"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            if REQUESTS_CACHE_AVAILABLE:
+                # Repeat searches are answered from SQLite instead of re-hitting (and annoying) the job boards.
+                # Query parameters are normalized into the cache key, so parameter order doesn't matter.
+                session = requests_cache.CachedSession(
+                    HTTP_CACHE_PATH,
+                    backend='sqlite',
+                    expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                    allowable_codes=(200,),
+                    stale_if_error=True,
+                    filter_fn=_is_cacheable_response
+                )
+            else:
+                session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=HTTP_RETRY
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(headers)
+            _http_session = session
+    return _http_session
+
+
+PRECONNECT_HOSTS = ['in.indeed.com', 'www.indeed.com']
+_preconnect_started = False
+
+
+def _preconnect(session):
+    """Open pooled connections to the job boards (DNS + TCP + TLS) before the first scrape needs them"""
+    # Send the warm-up through a plain session on the shared adapter - a cached session would answer
+    # the HEAD from SQLite after a restart and open no connection at all
+    warmup = requests.Session()
+    warmup.headers.update(session.headers)
+    warmup.mount('https://', session.get_adapter('https://'))
+    for host in PRECONNECT_HOSTS:
+        try:
+            warmup.head(f'https://{host}/', timeout=5)
+        except Exception:
+            pass
+
+
+def _start_preconnect(session):
+    """Warm the shared session in the background, once per process"""
+    global _preconnect_started
+    with _http_session_lock:
+        if _preconnect_started:
+            return
+        _preconnect_started = True
+    threading.Thread(target=_preconnect, args=(session,), daemon=True).start()
+
+
+def _aiohttp_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Request headers for aiohttp, which advertises the encodings it can decode itself"""
+    return {k: v for k, v in headers.items() if k != 'Accept-Encoding'}
+
+
+# One aiohttp session per event loop, shared by every InternshipScraper instance
+_async_session = None
+_async_session_loop = None
+
+
+def _get_async_session():
+    """Shared aiohttp session for the running event loop (pooled connections + DNS cache)"""
+    global _async_session, _async_session_loop
+    loop = asyncio.get_running_loop()
+    if _async_session is None or _async_session.closed or _async_session_loop is not loop:
+        _async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        )
+        _async_session_loop = loop
+    return _async_session
+
+
+async def close_async_session():
+    """Close the shared aiohttp session (call from the app's shutdown hook)"""
+    global _async_session
+    if _async_session is not None and not _async_session.closed:
+        await _async_session.close()
+    _async_session = None
+
+
+# Element filters for the card parsers, compiled once instead of per card.
+# bs4 matches these against each class / attribute value of an element.
+_JOB_CARD_RE = re.compile(r'job.*card|card.*job', re.I)
+_HAS_JOB_RE = re.compile(r'job|result', re.I)
+# Words of card text without surrounding punctuation ("Bangalore," -> "Bangalore")
+_WORD_RE = re.compile(r"\w[\w'-]*")
+
+_SKILL_INDIA_CARD_RE = re.compile(r'card|internship', re.I)
+_SKILL_INDIA_HAS_CARD_RE = re.compile(r'internship|course', re.I)
+# Every class keyword the Skill India field lookups care about, found in one scan of an element's classes
+_SKILL_INDIA_FIELD_RE = re.compile(
+    r'title|heading|provider|company|organization|location|place|description|summary|content', re.I
+)
+# Tag name -> class keyword -> card field it marks
+_SKILL_INDIA_CLASS_FIELDS = {
+    'div': {
+        'title': 'title', 'heading': 'title',
+        'provider': 'company', 'company': 'company', 'organization': 'company',
+        'location': 'location', 'place': 'location',
+        'description': 'description', 'summary': 'description', 'content': 'description',
+    },
+    'span': {'provider': 'company', 'company': 'company', 'location': 'location'},
+    'a': {'title': 'title'},
+}
+# Elements the Skill India lookups take by tag name alone
+_SKILL_INDIA_PART_TAGS = frozenset({'h2', 'h3', 'h4', 'mat-card-title', 'mat-card-subtitle', 'p', 'mat-card-content'})
+
+DRIVER_POOL_SIZE = 2
+
+# Resources the parsers never look at - Chrome doesn't download them
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*/analytics*", "*doubleclick*", "*googletagmanager*",
+]
+
+
+def _create_driver():
+    """Start a headless Chrome configured for scraping (None if it can't be started)"""
+    try:
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')  # Run in background
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        # driver.get returns after DOMContentLoaded; the callers wait for their own selectors
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
+        if WEBDRIVER_MANAGER_AVAILABLE:
+            try:
+                service = Service(ChromeDriverManager().install())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except Exception as e:
+                print(f"⚠️  WebDriver Manager failed, trying system ChromeDriver: {e}")
+                driver = webdriver.Chrome(options=chrome_options)
+        else:
+            # Try to use system ChromeDriver
+            driver = webdriver.Chrome(options=chrome_options)
+        
+        # Execute script to hide webdriver property
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': 'Object.defineProperty(navigator, "webdriver", {get: () => undefined})'
+        })
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        
+        print("✅ Selenium WebDriver initialized")
+        return driver
+    except Exception as e:
+        print(f"⚠️  Failed to initialize Selenium: {e}")
+        print("💡 Install ChromeDriver or use: pip install webdriver-manager")
+        return None
+
+
+class DriverPool:
+    """
+    Warm headless Chrome instances shared by all scrapers in the process.
+    
+    Starting Chrome costs seconds, so drivers are handed back to the pool after each
+    scrape instead of being quit, and only shut down when the process exits.
+    """
+    
+    def __init__(self, max_size: int = DRIVER_POOL_SIZE):
+        self.max_size = max_size
+        self._idle = queue.Queue(maxsize=max_size)
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, timeout: float = 60):
+        """Take an idle driver, start a new one if under max_size, or wait for one to be released"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        if can_create:
+            driver = _create_driver()
+            if driver is None:
+                with self._lock:
+                    self._created -= 1
+            return driver
+        
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            print("⚠️  Timed out waiting for a free Selenium driver")
+            return None
+    
+    def release(self, driver):
+        """Return a driver to the pool, dropping it if the browser has died"""
+        try:
+            driver.delete_all_cookies()
+            self._idle.put_nowait(driver)
+        except Exception:
+            self._discard(driver)
+    
+    def _discard(self, driver):
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def shutdown(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+_driver_pool = DriverPool()
+atexit.register(_driver_pool.shutdown)
+
+# Memoized relevance scores, keyed by the lowercased job fields and the search's QueryProfile
+RELEVANCE_SCORE_CACHE_SIZE = 1024
+
+# Realistic descriptions for generate_sample_internships, filled in per sample
+SAMPLE_DESCRIPTIONS = (
+    "Join {company} as a {title} and work on cutting-edge projects. Gain hands-on experience with industry-leading technologies and collaborate with world-class engineers.",
+    "Exciting {title} opportunity at {company}. Work on real-world projects, receive mentorship from senior engineers, and contribute to products used by millions.",
+    "{company} is seeking a {title} to join our team. You'll work on innovative projects, learn from experts, and make a real impact.",
+)
+
+# Relevance scoring tables
+RELEVANCE_STOP_WORDS = {'intern', 'internship', 'the', 'a', 'an', 'and', 'or', 'in', 'at', 'for', 'of', 'to'}
+LOCATION_VARIATIONS = {
+    'remote': ['remote', 'work from home', 'wfh', 'anywhere', 'work from anywhere', 'work remotely'],
+    'bangalore': ['bangalore', 'bengaluru', 'bangaluru', 'banglore', 'bangalore, india', 'bengaluru, india', 'banglore, india'],  # Added misspelling
+    'mumbai': ['mumbai', 'bombay', 'mumbai, india', 'bombay, india'],
+    'delhi': ['delhi', 'ncr', 'new delhi', 'gurgaon', 'gurugram', 'noida', 'delhi, india', 'new delhi, india'],
+    'hyderabad': ['hyderabad', 'hyderabad, india'],
+    'chennai': ['chennai', 'madras', 'chennai, india', 'madras, india'],
+    'pune': ['pune', 'pune, india'],
+    'coimbatore': ['coimbatore', 'coimbatore, india'],
+    'india': ['india', 'indian'],
+}
+US_LOCATION_INDICATORS = ['ca', 'co', 'ny', 'tx', 'il', 'pa', 'ut', 'md', 'al', 'wa', 'or', 'az', 'fl', 'ma', 'nc', 'united states', 'usa', 'us', 'united states of america']
+INDIAN_CITY_NAMES = ('bangalore', 'banglore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune', 'coimbatore')
+BANGALORE_SPELLINGS = ('bangalore', 'bengaluru', 'banglore')
+SOFTWARE_QUERY_TERMS = ('software', 'developer', 'engineer', 'programming')
+ENGINEERING_ROLE_KEYWORDS = ('engineer', 'developer', 'programmer', 'coder')
+RELATED_TECH_KEYWORDS = ('test', 'qa', 'quality', 'automation', 'ai', 'machine learning', 'data')
+TECH_ROLE_KEYWORDS = ('engineer', 'developer', 'programmer', 'test', 'qa', 'automation', 'ai', 'machine learning', 'data')
+DESCRIPTION_TECH_TERMS = ('software', 'developer', 'engineer', 'programming', 'code', 'technical', 'tech')
+GENERIC_TITLES = frozenset({'intern', 'internship', 'job', 'position'})
+BANGALORE_AREA_KEYWORDS = ('bangalore', 'bengaluru', 'banglore', 'india', 'karnataka')
+
+
+def _substring_re(keywords) -> re.Pattern:
+    """One pattern that finds any of keywords anywhere in a string (same as any(k in text ...), one scan)"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+_ENGINEERING_ROLE_RE = _substring_re(ENGINEERING_ROLE_KEYWORDS)
+_RELATED_TECH_RE = _substring_re(RELATED_TECH_KEYWORDS)
+_TECH_ROLE_RE = _substring_re(TECH_ROLE_KEYWORDS)
+_DESCRIPTION_TECH_RE = _substring_re(DESCRIPTION_TECH_TERMS)
+_BANGALORE_AREA_RE = _substring_re(BANGALORE_AREA_KEYWORDS)
+_US_LOCATION_RE = _substring_re(US_LOCATION_INDICATORS)
+
+
+@dataclass(frozen=True)
+class QueryProfile:
+    """Lowercased query/location and the lookups derived from them, shared by every job in a search"""
+    query_lower: str
+    query_terms: tuple
+    is_software_query: bool
+    loc_lower: str
+    location_variations_re: Optional[re.Pattern]  # None when the search names no known location
+    searching_india: bool
+    searching_bangalore: bool
+
+# Indian cities Indeed India knows, mapped to the location string it expects.
+# All keys are matched in a single regex scan rather than one substring test per city.
+INDEED_INDIA_LOCATIONS = {
+    'bangalore': 'Bengaluru, Karnataka',
+    'banglore': 'Bengaluru, Karnataka',
+    'bengaluru': 'Bengaluru, Karnataka',
+    'bangaluru': 'Bengaluru, Karnataka',
+    'mumbai': 'Mumbai, Maharashtra',
+    'delhi': 'Delhi, Delhi',
+    'hyderabad': 'Hyderabad, Telangana',
+    'chennai': 'Chennai, Tamil Nadu',
+    'pune': 'Pune, Maharashtra',
+    'coimbatore': 'Coimbatore, Tamil Nadu',
+}
+_INDEED_INDIA_CITY_RE = re.compile('|'.join(map(re.escape, INDEED_INDIA_LOCATIONS)))
+
+# Parsed Indeed results, shared across scraper instances (the backend builds one per request)
+INDEED_RESULT_TTL_SECONDS = 900
+_indeed_results: Dict[tuple, tuple] = {}
+_indeed_results_lock = threading.Lock()
+
+
+def _indeed_results_key(query: str, location: str, max_results: int) -> tuple:
+    return (query.strip().lower(), (location or "").strip().lower(), max_results)
+
+
+def _get_cached_indeed_results(key: tuple) -> Optional[List[Dict]]:
+    """Return a copy of a fresh cached Indeed result, or None"""
+    with _indeed_results_lock:
+        entry = _indeed_results.get(key)
+        if entry is None:
+            return None
+        stored_at, internships = entry
+        if time.time() - stored_at > INDEED_RESULT_TTL_SECONDS:
+            del _indeed_results[key]
+            return None
+    return copy.deepcopy(internships)
+
+
+def _cache_indeed_results(key: tuple, internships: List[Dict]):
+    if not internships:
+        return
+    with _indeed_results_lock:
+        _indeed_results[key] = (time.time(), copy.deepcopy(internships))
+
+
+# Rendered Selenium pages by (url, wait_selector) - requests-cache only covers the requests session,
+# and a browser render is by far the slowest fetch the scraper makes
+RENDERED_PAGE_TTL_SECONDS = 1800
+_rendered_pages: Dict[tuple, tuple] = {}
+_rendered_pages_lock = threading.Lock()
+
+
+def _get_cached_rendered_page(key: tuple) -> Optional[str]:
+    with _rendered_pages_lock:
+        entry = _rendered_pages.get(key)
+        if entry is None:
+            return None
+        stored_at, page_source = entry
+        if time.time() - stored_at > RENDERED_PAGE_TTL_SECONDS:
+            del _rendered_pages[key]
+            return None
+    return page_source
+
+
+def _cache_rendered_page(key: tuple, page_source: Optional[str]):
+    if not page_source:
+        return
+    with _rendered_pages_lock:
+        _rendered_pages[key] = (time.time(), page_source)
+
+
+# Indeed card fields as CSS selector lists, so each lookup walks the card once instead of once per
+# fallback. A list matches in document order, so the title keeps priority tiers: specific title
+# markup first, then any heading, then a link to the job page (which often carries the title).
+INDEED_TITLE_SELECTORS = (
+    'h2.jobTitle, h2[class*="title" i], a.jobTitle, a[class*="title" i], span[id*="jobtitle" i], '
+    'span[class*="title" i], h2[data-testid*="title" i], a[data-testid*="title" i]',
+    'h2, h3',
+    'a[href*="/viewjob" i], a[href*="/jobs" i]',
+)
+INDEED_COMPANY_SELECTOR = (
+    'span.companyName, span[data-testid="company-name"], a.companyName, span[class*="company" i]'
+)
+INDEED_LOCATION_SELECTOR = (
+    'div.companyLocation, div[data-testid="job-location"], span.companyLocation, div[class*="location" i]'
+)
+INDEED_SUMMARY_SELECTOR = (
+    'div.job-snippet, div.summary, span.summary, '
+    'div[class*="snippet" i], div[class*="summary" i], div[class*="description" i], '
+    'span[class*="snippet" i], span[class*="summary" i], span[class*="description" i], '
+    'div[data-testid*="snippet" i], div[data-testid*="summary" i], '
+    'ul[class*="requirement" i]'  # Sometimes requirements are shown
+)
+
+
+def _element_text(element) -> str:
+    """element.get_text(strip=True), without walking the subtree when it holds a single string"""
+    string = element.string
+    if type(string) is NavigableString:  # Not a Comment / CData etc, which get_text leaves out
+        return string.strip()
+    return element.get_text(strip=True)
+
+
+def _select_first(element, selector_tiers):
+    """First element matching the earliest selector tier that matches anything"""
+    for selector in selector_tiers:
+        found = element.select_one(selector)
+        if found is not None:
+            return found
+    return None
+
+
+def _has_class(tag, class_name: str) -> bool:
+    return class_name in (tag.get('class') or ())
+
+
+def _class_matches(tag, pattern: re.Pattern) -> bool:
+    return any(pattern.search(cls) for cls in tag.get('class') or ())
+
+
+def _glassdoor_card_tier(tag) -> Optional[int]:
+    if tag.name == 'li' and _has_class(tag, 'react-job-listing'):
+        return 0
+    if tag.get('data-test') == 'job-listing':
+        if tag.name == 'div':
+            return 1
+        if tag.name == 'li':
+            return 2
+    return None
+
+
+def _internships_com_card_tier(tag) -> Optional[int]:
+    if tag.name == 'div':
+        if _has_class(tag, 'internship'):
+            return 0
+        if tag.has_attr('data-internship-id'):
+            return 1
+    elif tag.name == 'article' and _has_class(tag, 'internship'):
+        return 2
+    return None
+
+
+def _skill_india_card_tier(tag) -> Optional[int]:
+    if tag.name == 'mat-card':
+        return 0
+    if tag.name == 'div':
+        if _class_matches(tag, _SKILL_INDIA_CARD_RE):
+            return 1
+        if _class_matches(tag, _SKILL_INDIA_HAS_CARD_RE):
+            return 3
+    elif tag.name == 'article':
+        return 2
+    return None
+
+
+def _skill_india_card_parts(card) -> Dict:
+    """
+    First element of every kind the Skill India field lookups use, from one walk over the card.
+    
+    Keys are tag names from _SKILL_INDIA_PART_TAGS, 'link' for the first <a href>, and
+    (tag name, field) for elements whose classes mark a field (see _SKILL_INDIA_CLASS_FIELDS).
+    """
+    found = {}
+    for tag in card.find_all(True):
+        name = tag.name
+        if name in _SKILL_INDIA_PART_TAGS:
+            found.setdefault(name, tag)
+        elif name == 'a' and 'link' not in found and tag.has_attr('href'):
+            found['link'] = tag
+        fields = _SKILL_INDIA_CLASS_FIELDS.get(name)
+        if fields and tag.get('class'):
+            for keyword in _SKILL_INDIA_FIELD_RE.findall(' '.join(tag['class'])):
+                field = fields.get(keyword.lower())
+                if field:
+                    found.setdefault((name, field), tag)
+    return found
+
+
+def _find_cards(soup, card_tier, limit: int) -> list:
+    """
+    Collect job cards from the earliest fallback selector that matches anything.
+    
+    Args:
+        soup: Parsed results page
+        card_tier: Returns the index of the first fallback selector a tag matches, or None
+        limit: Maximum number of cards wanted
+    
+    Returns:
+        Up to limit cards of the best matching tier in document order, walking the document
+        once instead of re-scanning it for every fallback
+    """
+    tiers: Dict[int, list] = {}
+    for tag in soup.find_all(True):
+        tier = card_tier(tag)
+        if tier is not None:
+            tiers.setdefault(tier, []).append(tag)
+            # Nothing can beat the first selector, so stop once it has enough cards
+            if tier == 0 and len(tiers[0]) >= limit:
+                break
+    return tiers[min(tiers)][:limit] if tiers else []
+
+
+def _extract_indeed_card(card, query: str, location: str, indeed_domain: str, scraped_at: str) -> Optional[Dict]:
+    """
+    Pull title, company, location, summary and link out of one Indeed job card.
+    
+    Returns None if the card has no usable title.
+    """
+    try:
+        # Extract job key for link
+        job_key = card.get('data-jk', '')
+        
+        # Find title, company, location and summary - one selector pass per tier (including India Indeed specific)
+        title_elem = _select_first(card, INDEED_TITLE_SELECTORS)
+        company_elem = card.select_one(INDEED_COMPANY_SELECTOR)
+        location_elem = card.select_one(INDEED_LOCATION_SELECTOR)
+        summary_elem = card.select_one(INDEED_SUMMARY_SELECTOR)
+        
+        if not title_elem:
+            return None
+        
+        # Full card text is only needed by the fallbacks below - computed at most once
+        card_text = None
+        
+        # Get title text - try to get from nested elements if main element is too short
+        title = _element_text(title_elem)
+        
+        # If title is too short or generic, try to find nested link or span with better text
+        if not title or len(title) < 5 or title.lower() in ['intern', 'internship', 'job']:
+            # Try to find nested link with title
+            nested_link = title_elem.find('a', href=True)
+            if nested_link:
+                nested_title = _element_text(nested_link)
+                if nested_title and len(nested_title) > len(title):
+                    title = nested_title
+            
+            # Try to find nested span
+            nested_span = title_elem.find('span')
+            if nested_span:
+                nested_title = _element_text(nested_span)
+                if nested_title and len(nested_title) > len(title):
+                    title = nested_title
+            
+            # If still too short, try to get all text from the card's title area
+            if not title or len(title) < 5:
+                # Look for any text in the card that might be the title
+                card_text = card.get_text(separator=' ', strip=True)
+                # Try to extract meaningful title from first line
+                first_line = card_text.split('\n')[0] if '\n' in card_text else card_text.split('.')[0]
+                if first_line and len(first_line) > len(title):
+                    title = first_line[:100]  # Limit length
+        
+        if not title or len(title) < 3:
+            return None
+        
+        company = _element_text(company_elem) if company_elem else "Company Not Specified"
+        location_text = _element_text(location_elem) if location_elem else location or "Location Not Specified"
+        
+        # Extract summary - try to get more context if summary is missing or too short
+        summary = _element_text(summary_elem) if summary_elem else ""
+        
+        # If summary is missing or too short, try to extract more context from the card
+        if not summary or len(summary) < 20:
+            # Get all text from card and remove title, company, location to get description
+            if card_text is None:
+                card_text = card.get_text(separator=' ', strip=True)
+            # Remove title, company, location from the text to get description
+            banned_words = frozenset(_WORD_RE.findall(f"{title} {company} {location_text}".lower()))
+            
+            # Filter out title, company, location words to get description - one lower() and one lookup per word
+            words = (m.group() for m in _WORD_RE.finditer(card_text))
+            desc_words = list(islice((w for w in words if w.lower() not in banned_words), 50))  # Take first 50 words
+            if desc_words:
+                summary = ' '.join(desc_words)
+        
+        # Fallback if still no summary
+        if not summary or len(summary) < 10:
+            summary = f"Internship opportunity for {query} position"
+        
+        # Build job link
+        job_link = ""
+        if job_key:
+            job_link = f"https://{indeed_domain}/viewjob?jk={job_key}"
+        else:
+            link_elem = title_elem.find('a') if title_elem.name != 'a' else title_elem
+            if not link_elem or link_elem.name != 'a':
+                link_elem = card.find('a', href=True)
+            
+            if link_elem and link_elem.get('href'):
+                href = link_elem['href']
+                if href.startswith('/'):
+                    job_link = f"https://{indeed_domain}{href}"
+                elif href.startswith('http'):
+                    job_link = href
+        
+        return {
+            'title': title,
+            'company': company,
+            'location': location_text,
+            'description': summary,
+            'source': 'Indeed',
+            'url': job_link,
+            'scraped_at': scraped_at
+        }
+    except Exception as e:
+        logger.warning("⚠️  Error parsing Indeed job card: %s", e)
+        return None
+
+
+def _extract_indeed_card_html(card_html: str, query: str, location: str, indeed_domain: str, scraped_at: str) -> Optional[Dict]:
+    """_extract_indeed_card for a worker process, which gets the card's HTML rather than a bs4 node"""
+    # lxml wraps fragments in <html><body>, so look the card div up explicitly
+    card = BeautifulSoup(card_html, HTML_PARSER).find('div')
+    if card is None:
+        return None
+    return _extract_indeed_card(card, query, location, indeed_domain, scraped_at)
+
+
+# Worker processes for Indeed card extraction (bs4 lookups are pure Python, so threads wouldn't help)
+PARALLEL_CARD_THRESHOLD = 16
+_card_executor = None
+_card_executor_lock = threading.Lock()
+
+
+def _get_card_executor() -> ProcessPoolExecutor:
+    global _card_executor
+    with _card_executor_lock:
+        if _card_executor is None:
+            # The pool is started from a worker thread of a threaded server - fork there can deadlock,
+            # so workers come from a forkserver (spawn where that isn't available, e.g. Windows)
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _card_executor = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context(start_method)
+            )
+            atexit.register(_card_executor.shutdown)
+    return _card_executor
+
+
+# ETag / Last-Modified validators with the parsed results they belong to, keyed by (url, max_results).
+# A 304 on re-fetch means Indeed's page is unchanged, so the stored results are reused.
+VALIDATED_RESULTS_MAX = 256
+_validated_results: Dict[tuple, tuple] = {}
+_validated_results_lock = threading.Lock()
+
+
+def _conditional_headers(key: tuple) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for a previously fetched page"""
+    with _validated_results_lock:
+        entry = _validated_results.get(key)
+    if entry is None:
+        return {}
+    etag, last_modified, _ = entry
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _not_modified_results(key: tuple) -> List[Dict]:
+    """Results stored for a page the server answered with 304 Not Modified"""
+    with _validated_results_lock:
+        entry = _validated_results.get(key)
+    return copy.deepcopy(entry[2]) if entry else []
+
+
+def _remember_validators(key: tuple, response_headers, internships: List[Dict]):
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if not internships or not (etag or last_modified):
+        return
+    with _validated_results_lock:
+        _validated_results.pop(key, None)
+        if len(_validated_results) >= VALIDATED_RESULTS_MAX:
+            del _validated_results[next(iter(_validated_results))]
+        _validated_results[key] = (etag, last_modified, copy.deepcopy(internships))
+
+
+# Indeed lists this many jobs per results page; page 2 is fetched while page 1 is parsed
+INDEED_PAGE_SIZE = 10
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="indeed-prefetch")
+
+
+class CircuitBreaker:
+    """
+    Stop trying a scraping strategy that keeps failing for a while.
+    
+    After `threshold` failures within `window` seconds the breaker opens for `cooldown`
+    seconds; a success closes it again.
+    """
+    
+    def __init__(self, threshold: int = 3, window: float = 300, cooldown: float = 600):
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._failures: Dict[str, tuple] = {}  # key -> (count, first_failure_at)
+        self._open_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            return self._open_until.get(key, 0) > time.time()
+    
+    def record_failure(self, key: str):
+        now = time.time()
+        with self._lock:
+            count, first_at = self._failures.get(key, (0, now))
+            if now - first_at > self.window:
+                count, first_at = 0, now
+            count += 1
+            self._failures[key] = (count, first_at)
+            if count >= self.threshold:
+                self._open_until[key] = now + self.cooldown
+                del self._failures[key]
+                print(f"🔌 {key} failed {count} times - skipping it for {int(self.cooldown)}s")
+    
+    def record_success(self, key: str):
+        with self._lock:
+            self._failures.pop(key, None)
+            self._open_until.pop(key, None)
+
+
+# Shared by all scraper instances: "requests:<domain>" for plain fetches, "selenium:<domain>" for the browser
+_indeed_breaker = CircuitBreaker()
+
+
+def _is_indeed_block(status_code: int, response_url: str, content: bytes) -> bool:
+    """True if Indeed answered with a 403 or a captcha / unusual-traffic page"""
+    if status_code == 403:
+        return True
+    return status_code == 200 and ('captcha' in response_url.lower() or b'unusual' in content[:1000].lower())
+
+
 class InternshipScraper:
     """Scraper for internship opportunities from various job boards
     
@@ -60,7 +865,7 @@ class InternshipScraper:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -68,15 +873,14 @@ class InternshipScraper:
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.session = _get_http_session(self.headers)
+        _start_preconnect(self.session)
         
         # Browser automation tools (optional, used as fallback)
-        self._driver = None  # Selenium WebDriver instance
+        self._pool = _driver_pool  # Warm Selenium WebDrivers shared across scrapers
         self._use_beautifulsoup = use_beautifulsoup
         
         self._current_query = ""
-        self._current_location = ""
         
         # Primary method: BeautifulSoup + Requests (simple, fast, reliable)
         if self._use_beautifulsoup:
@@ -88,53 +892,10 @@ class InternshipScraper:
         else:
             print("💡 Selenium not available - install with: pip install selenium webdriver-manager")
     
-    def _get_driver(self):
-        """Get or create Selenium WebDriver"""
-        if not SELENIUM_AVAILABLE:
-            return None
-        
-        if self._driver is None:
-            try:
-                chrome_options = Options()
-                chrome_options.add_argument('--headless')  # Run in background
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option('useAutomationExtension', False)
-                chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-                
-                # Check if webdriver-manager is available (with safety check)
-                use_webdriver_manager = False
-                try:
-                    use_webdriver_manager = WEBDRIVER_MANAGER_AVAILABLE
-                except NameError:
-                    # Variable not defined, assume webdriver-manager is not available
-                    use_webdriver_manager = False
-                
-                if use_webdriver_manager:
-                    try:
-                        service = Service(ChromeDriverManager().install())
-                        self._driver = webdriver.Chrome(service=service, options=chrome_options)
-                    except Exception as e:
-                        print(f"⚠️  WebDriver Manager failed, trying system ChromeDriver: {e}")
-                        self._driver = webdriver.Chrome(options=chrome_options)
-                else:
-                    # Try to use system ChromeDriver
-                    self._driver = webdriver.Chrome(options=chrome_options)
-                
-                # Execute script to hide webdriver property
-                self._driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                    'source': 'Object.defineProperty(navigator, "webdriver", {get: () => undefined})'
-                })
-                
-                print("✅ Selenium WebDriver initialized")
-            except Exception as e:
-                print(f"⚠️  Failed to initialize Selenium: {e}")
-                print("💡 Install ChromeDriver or use: pip install webdriver-manager")
-                return None
-        
-        return self._driver
+    def clear_expired_cache(self):
+        """Drop expired responses from the on-disk HTTP cache"""
+        if REQUESTS_CACHE_AVAILABLE:
+            self.session.cache.delete(expired=True)
     
     def _scrape_with_selenium(self, url: str, wait_selector: Optional[str] = None, timeout: int = 30) -> Optional[str]:
         """Scrape a URL using Selenium"""
@@ -142,10 +903,32 @@ class InternshipScraper:
             print("⚠️  Selenium not available")
             return None
         
-        driver = self._get_driver()
+        key = (url, wait_selector)
+        cached = _get_cached_rendered_page(key)
+        if cached is not None:
+            print(f"♻️  Reusing rendered page for {url}")
+            return cached
+        
+        driver = self._pool.acquire()
         if not driver:
             return None
         
+        try:
+            page_source, complete = self._load_page_with_driver(driver, url, wait_selector, timeout)
+        finally:
+            self._pool.release(driver)
+        # Partial pages (load timeouts, errors, interstitials without the cards) are used once, never reused
+        if complete:
+            _cache_rendered_page(key, page_source)
+        return page_source
+    
+    def _load_page_with_driver(self, driver, url: str, wait_selector: Optional[str], timeout: int) -> Tuple[Optional[str], bool]:
+        """
+        Navigate a pooled driver to url and return the rendered HTML
+        
+        Returns:
+            (page source or None, whether the page loaded and wait_selector - if any - matched)
+        """
         try:
             print(f"🌐 Selenium navigating to: {url}")
             # Set longer timeouts for slow-loading pages
@@ -170,7 +953,7 @@ class InternshipScraper:
                             page_source = driver.page_source
                             if page_source and len(page_source) > 1000:
                                 print(f"📄 Retrieved partial page source ({len(page_source)} chars)")
-                                return page_source
+                                return page_source, False
                         except:
                             pass
                         raise e
@@ -178,49 +961,40 @@ class InternshipScraper:
             # Wait for page to be in a ready state
             try:
                 WebDriverWait(driver, min(10, timeout // 3)).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
+                    lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
                 )
             except:
                 print("⚠️  Page ready state check timeout, continuing anyway...")
             
             # Wait for page to load or specific selector (with shorter timeout)
+            selector_found = not wait_selector
             if wait_selector:
                 try:
-                    # Try each selector in the comma-separated list with shorter timeout
-                    selectors = [s.strip() for s in wait_selector.split(',')]
-                    found = False
+                    # One explicit wait on the whole comma-separated list - CSS matches whichever appears first
                     wait_timeout = min(15, timeout // 2)  # Use shorter timeout for selector wait
-                    for selector in selectors:
-                        try:
-                            WebDriverWait(driver, wait_timeout).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                            )
-                            print(f"✅ Selenium found selector: {selector}")
-                            found = True
-                            break
-                        except:
-                            continue
-                    if not found:
-                        print(f"⚠️  Selenium timeout waiting for selectors: {wait_selector} (page may still have loaded)")
-                except Exception as e:
-                    print(f"⚠️  Selenium timeout waiting for selector {wait_selector}: {e}")
+                    WebDriverWait(driver, wait_timeout).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                    )
+                    selector_found = True
+                    print(f"✅ Selenium found selector: {wait_selector}")
+                except Exception:
+                    print(f"⚠️  Selenium timeout waiting for selectors: {wait_selector} (page may still have loaded)")
                     # Continue anyway, page might have loaded
             
-            # Wait a bit for dynamic content to render
-            time.sleep(3)
+            # Wait for dynamic content to finish rendering
+            self._wait_for_stable_content(driver, wait_selector, timeout=5)
             
             # Scroll to trigger lazy loading
             try:
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+                self._wait_for_stable_content(driver, wait_selector, timeout=2)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
             except:
                 pass
             
             page_source = driver.page_source
             print(f"📄 Selenium retrieved {len(page_source)} characters of HTML")
-            return page_source
+            return page_source, selector_found
         except Exception as e:
             print(f"⚠️  Selenium scraping failed: {e}")
             # Try to get page source even on error
@@ -228,281 +1002,342 @@ class InternshipScraper:
                 page_source = driver.page_source
                 if page_source and len(page_source) > 1000:
                     print(f"📄 Retrieved page source despite error ({len(page_source)} chars)")
-                    return page_source
+                    return page_source, False
             except:
                 pass
             import traceback
             traceback.print_exc()
-            return None
+            return None, False
     
-    def __del__(self):
-        """Cleanup browser automation tools"""
-        # Cleanup Selenium WebDriver
-        if self._driver:
-            try:
-                self._driver.quit()
-            except Exception:
-                pass
+    def _wait_for_stable_content(self, driver, wait_selector: Optional[str], timeout: float):
+        """
+        Poll until the page stops changing instead of sleeping a fixed time.
         
-        # Selenium removed - no cleanup needed
+        With a selector, "stable" means the number of matching elements is non-zero and
+        unchanged between two polls; without one, the document has finished loading.
+        """
+        if not wait_selector:
+            condition = lambda d: d.execute_script("return document.readyState") == "complete"
+        else:
+            last_count = [-1]
+            
+            def condition(d):
+                count = len(d.find_elements(By.CSS_SELECTOR, wait_selector))
+                stable = count > 0 and count == last_count[0]
+                last_count[0] = count
+                return stable
+        
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.5).until(condition)
+        except Exception:
+            pass
     
     def _get_indeed_domain_and_location(self, location: str) -> tuple[str, str]:
         """Determine which Indeed domain to use and format location"""
-        indian_cities = {
-            'bangalore': 'Bengaluru, Karnataka',
-            'banglore': 'Bengaluru, Karnataka',
-            'bengaluru': 'Bengaluru, Karnataka',
-            'bangaluru': 'Bengaluru, Karnataka',
-            'mumbai': 'Mumbai, Maharashtra',
-            'delhi': 'Delhi, Delhi',
-            'hyderabad': 'Hyderabad, Telangana',
-            'chennai': 'Chennai, Tamil Nadu',
-            'pune': 'Pune, Maharashtra',
-            'coimbatore': 'Coimbatore, Tamil Nadu',
-        }
-        
         loc_lower = location.lower().strip() if location else ""
         
         # Check if it's an Indian city
-        for city_key, formatted_location in indian_cities.items():
-            if city_key in loc_lower:
-                return 'in.indeed.com', formatted_location
+        match = _INDEED_INDIA_CITY_RE.search(loc_lower)
+        if match:
+            return 'in.indeed.com', INDEED_INDIA_LOCATIONS[match.group()]
         
         # Default to US Indeed
         return 'www.indeed.com', location.strip() if location else ""
     
+    def _indeed_search_query(self, query: str) -> str:
+        """Indeed search text - make sure the query asks for internships"""
+        if 'intern' not in query.lower():
+            return f"{query} intern"
+        return query
+    
+    def _build_indeed_rss_url(self, query: str, location: str = "") -> str:
+        """Build the Indeed RSS search URL"""
+        search_query = self._indeed_search_query(query)
+        
+        # Determine which Indeed domain to use (India vs US)
+        indeed_domain, formatted_location = self._get_indeed_domain_and_location(location)
+        
+        # Build RSS URL - India Indeed might not support RSS, but try anyway
+        if indeed_domain == 'in.indeed.com':
+            query_param = quote_plus(search_query, safe=' ')
+            if formatted_location:
+                location_param = quote_plus(formatted_location, safe=' ')
+                rss_url = f"https://{indeed_domain}/rss?q={query_param}&l={location_param}"
+            else:
+                rss_url = f"https://{indeed_domain}/rss?q={query_param}"
+        else:
+            rss_url = f"https://{indeed_domain}/rss?q={quote_plus(search_query)}&l={quote_plus(formatted_location) if formatted_location else ''}&jt=internship"
+        return rss_url
+    
+    def _parse_indeed_rss(self, content: bytes, query: str, location: str, max_results: int) -> List[Dict]:
+        """Parse an Indeed RSS feed into relevance-sorted internships"""
+        internships = []
+        scores = []
+        scraped_at = datetime.now().isoformat()
+        items_seen = 0
+        profile = self._query_profile(query, location)
+        
+        # Stream RSS items - stop after max_results instead of building the whole tree
+        for _, item in ElementTree.iterparse(io.BytesIO(content), events=('end',)):
+            if item.tag != 'item':
+                continue
+            items_seen += 1
+            try:
+                title = item.find('title')
+                link = item.find('link')
+                description = item.find('description')
+                
+                if title is not None and title.text:
+                    # Parse title (format: "Job Title - Company - Location")
+                    title_parts = title.text.split(' - ')
+                    job_title = title_parts[0].strip()
+                    company = title_parts[1].strip() if len(title_parts) > 1 else "Company Not Specified"
+                    location_text = title_parts[2].strip() if len(title_parts) > 2 else location or "Location Not Specified"
+                    
+                    job_desc = description.text if description is not None and description.text else f"Internship opportunity for {query}"
+                    
+                    # Filter for relevance - the score is kept for ranking below
+                    relevant, score = self._evaluate(job_title, job_desc, location_text, profile)
+                    if relevant:
+                        scores.append(score)
+                        internships.append({
+                            'title': job_title,
+                            'company': company,
+                            'location': location_text,
+                            'description': job_desc,
+                            'source': 'Indeed (RSS)',
+                            'url': link.text if link is not None and link.text else '',
+                            'scraped_at': scraped_at
+                        })
+                        logger.debug("✅ Found via RSS: %s at %s (%s)", job_title, company, location_text)
+                    else:
+                        logger.debug("⏭️  Skipped RSS (not relevant): %s", job_title)
+            except Exception as e:
+                logger.warning("⚠️  Error parsing RSS item: %s", e)
+            finally:
+                item.clear()
+            if items_seen >= max_results:
+                break
+        
+        if internships:
+            # Sort by relevance
+            ranked = self._rank_by_score(scores)
+            internships = [internships[i] for i in ranked[:max_results]]
+            print(f"📊 RSS scraping successful: {len(internships)} relevant internships found")
+            return internships
+        
+        return []
+    
     def scrape_indeed_rss(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
         """Try to scrape using Indeed RSS feed (more reliable)"""
-        internships = []
         try:
-            # Build search query similar to main scraper
-            query_clean = query.strip().lower()
-            if 'intern' not in query_clean and 'internship' not in query_clean:
-                search_query = f"{query} intern"
-            else:
-                search_query = query
-            
-            # Determine which Indeed domain to use (India vs US)
-            indeed_domain, formatted_location = self._get_indeed_domain_and_location(location)
-            
-            # Build RSS URL - India Indeed might not support RSS, but try anyway
-            if indeed_domain == 'in.indeed.com':
-                query_param = quote_plus(search_query, safe=' ')
-                if formatted_location:
-                    location_param = quote_plus(formatted_location, safe=' ')
-                    rss_url = f"https://{indeed_domain}/rss?q={query_param}&l={location_param}"
-                else:
-                    rss_url = f"https://{indeed_domain}/rss?q={query_param}"
-            else:
-                rss_url = f"https://{indeed_domain}/rss?q={quote_plus(search_query)}&l={quote_plus(formatted_location) if formatted_location else ''}&jt=internship"
-            
+            rss_url = self._build_indeed_rss_url(query, location)
             print(f"🌐 Trying Indeed RSS: {rss_url}")
-            response = self.session.get(rss_url, timeout=15)
+            key = (rss_url, max_results)
+            # requests-cache revalidates on its own; otherwise send our stored validators
+            conditional = not REQUESTS_CACHE_AVAILABLE
+            response = self.session.get(rss_url, headers=_conditional_headers(key) if conditional else None, timeout=15)
             
+            if response.status_code == 304:
+                print("♻️  Indeed RSS not modified - reusing previous results")
+                return _not_modified_results(key)
             if response.status_code == 200 and 'xml' in response.headers.get('content-type', '').lower():
-                from xml.etree import ElementTree as ET
-                root = ET.fromstring(response.content)
-                
-                # Parse RSS items
-                for item in root.findall('.//item')[:max_results]:
-                    try:
-                        title = item.find('title')
-                        link = item.find('link')
-                        description = item.find('description')
-                        
-                        if title is not None and title.text:
-                            # Parse title (format: "Job Title - Company - Location")
-                            title_parts = title.text.split(' - ')
-                            job_title = title_parts[0].strip()
-                            company = title_parts[1].strip() if len(title_parts) > 1 else "Company Not Specified"
-                            location_text = title_parts[2].strip() if len(title_parts) > 2 else location or "Location Not Specified"
-                            
-                            job_desc = description.text if description is not None and description.text else f"Internship opportunity for {query}"
-                            
-                            # Filter for relevance
-                            if self._is_relevant(job_title, job_desc, location_text, query, location):
-                                internships.append({
-                                    'title': job_title,
-                                    'company': company,
-                                    'location': location_text,
-                                    'description': job_desc,
-                                    'source': 'Indeed (RSS)',
-                                    'url': link.text if link is not None and link.text else '',
-                                    'scraped_at': datetime.now().isoformat()
-                                })
-                                print(f"  ✅ Found via RSS: {job_title} at {company} ({location_text})")
-                            else:
-                                print(f"  ⏭️  Skipped RSS (not relevant): {job_title}")
-                    except Exception as e:
-                        print(f"  ⚠️  Error parsing RSS item: {e}")
-                        continue
-                
-                if internships:
-                    # Score and sort by relevance
-                    scored_internships = []
-                    for job in internships:
-                        score = self._calculate_relevance_score(
-                            job['title'],
-                            job.get('description', ''),
-                            job['location'],
-                            query,
-                            location
-                        )
-                        scored_internships.append((score, job))
-                    
-                    scored_internships.sort(key=lambda x: x[0], reverse=True)
-                    internships = [job for _, job in scored_internships[:max_results]]
-                    print(f"📊 RSS scraping successful: {len(internships)} relevant internships found")
-                    return internships
+                internships = self._parse_indeed_rss(response.content, query, location, max_results)
+                if conditional:
+                    _remember_validators(key, response.headers, internships)
+                return internships
         except Exception as e:
             print(f"⚠️  RSS scraping failed: {e}")
         
         return []
     
-    def scrape_indeed(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
-        """Scrape internships from Indeed using BeautifulSoup + Requests, with Selenium as fallback"""
-        internships = []
+    async def scrape_indeed_rss_async(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
+        """Async version of scrape_indeed_rss (fetches on the shared aiohttp session)"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.scrape_indeed_rss, query, location, max_results)
         
+        try:
+            rss_url = self._build_indeed_rss_url(query, location)
+            print(f"🌐 Trying Indeed RSS: {rss_url}")
+            key = (rss_url, max_results)
+            async with _get_async_session().get(
+                rss_url,
+                headers=_aiohttp_headers({**self.headers, **_conditional_headers(key)}),
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                content = await response.read()
+                content_type = response.headers.get('content-type', '')
+            
+            if response.status == 304:
+                print("♻️  Indeed RSS not modified - reusing previous results")
+                return _not_modified_results(key)
+            if response.status == 200 and 'xml' in content_type.lower():
+                internships = self._parse_indeed_rss(content, query, location, max_results)
+                _remember_validators(key, response.headers, internships)
+                return internships
+        except Exception as e:
+            print(f"⚠️  RSS scraping failed: {e}")
+        
+        return []
+    
+    def _build_indeed_url(self, query: str, location: str = "") -> tuple[str, str]:
+        """Build the Indeed search URL, returns (indeed_domain, url)"""
         # Determine which Indeed domain to use (India vs US)
         indeed_domain, formatted_location = self._get_indeed_domain_and_location(location)
         
-        # Build search query - India Indeed doesn't use jt=internship parameter
-        query_clean = query.strip().lower()
+        # Match the exact format from working URLs (quote_plus encodes spaces as +)
+        query_param = quote_plus(self._indeed_search_query(query))
+        location_param = f"&l={quote_plus(formatted_location)}" if formatted_location else ""
         if indeed_domain == 'in.indeed.com':
-            # For India: include "intern" in query itself, don't use jt parameter
-            if 'intern' not in query_clean and 'internship' not in query_clean:
-                search_query = f"{query} intern"
-            else:
-                search_query = query
-        else:
-            # For US: can use jt=internship parameter
-            if 'intern' not in query_clean and 'internship' not in query_clean:
-                search_query = f"{query} intern"
-            else:
-                search_query = query
-        
-        # Build URL - Indeed India uses different format
-        if indeed_domain == 'in.indeed.com':
-            # India Indeed format: q=software+engineer&l=Bengaluru%2C+Karnataka
-            # Match the exact format from working URL (uses + for spaces, not %20)
-            query_param = quote_plus(search_query)  # Encode spaces as +
-            if formatted_location:
-                location_param = quote_plus(formatted_location)  # Encode spaces as +
-                url = f"https://{indeed_domain}/jobs?q={query_param}&l={location_param}"
-            else:
-                url = f"https://{indeed_domain}/jobs?q={query_param}"
+            # India Indeed format: q=software+engineer+intern&l=Bengaluru%2C+Karnataka (no jt parameter)
+            url = f"https://{indeed_domain}/jobs?q={query_param}{location_param}"
         else:
             # US Indeed format: q=software+engineer+intern&jt=internship&l=location
-            params = {
-                'q': search_query,
-                'jt': 'internship',  # Filter to internships only
-            }
-            if formatted_location:
-                params['l'] = formatted_location
-            url = f"https://{indeed_domain}/jobs?" + "&".join([f"{k}={quote_plus(v)}" for k, v in params.items()])
+            url = f"https://{indeed_domain}/jobs?q={query_param}&jt=internship{location_param}"
         
-        # Store original query for filtering
-        self._current_query = query.lower()
-        self._current_location = location.lower() if location else ""
-        
-        print(f"🌐 Scraping Indeed ({indeed_domain}): {url}")
-        
-        # Strategy 1: Try BeautifulSoup + Requests first (simplest, fastest for static content)
+        return indeed_domain, url
+    
+    def _next_indeed_page_url(self, url: str) -> str:
+        return f"{url}&start={INDEED_PAGE_SIZE}"
+    
+    def _merge_indeed_pages(self, internships: List[Dict], more: List[Dict], max_results: int) -> List[Dict]:
+        """Append next-page jobs (page order kept, repeated titles dropped) up to max_results"""
+        seen_titles = {job['title'].lower() for job in internships}
+        merged = list(internships)
+        for job in more:
+            if len(merged) >= max_results:
+                break
+            if job['title'].lower() not in seen_titles:
+                seen_titles.add(job['title'].lower())
+                merged.append(job)
+        return merged
+    
+    def _add_next_indeed_page(
+        self,
+        next_page: Future,
+        internships: List[Dict],
+        query: str,
+        location: str,
+        max_results: int
+    ) -> List[Dict]:
+        """Use the prefetched next page only if the first page came up short"""
+        if len(internships) >= max_results:
+            next_page.cancel()
+            return internships
         try:
-            print("🚀 Using BeautifulSoup + Requests...")
-            # Add delay to be respectful
-            time.sleep(1)
-            
-            # Enhanced headers to mimic real browser
-            enhanced_headers = self.headers.copy()
-            enhanced_headers.update({
-                'Referer': f'https://{indeed_domain}/',
-                'Origin': f'https://{indeed_domain}',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache',
-            })
-            
-            response = self.session.get(url, headers=enhanced_headers, timeout=25, allow_redirects=True)
-            print(f"📊 Indeed response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                # Check if we got redirected to a captcha or error page
-                if 'captcha' in response.url.lower() or 'unusual' in response.text.lower()[:1000]:
-                    print("🚫 Indeed is showing captcha or blocking request")
+            response = next_page.result()
+            more = self._parse_indeed_response(
+                response.status_code, response.url, response.content, query, location, max_results
+            )
+        except Exception as e:
+            print(f"⚠️  Indeed next page failed: {e}")
+            return internships
+        return self._merge_indeed_pages(internships, more, max_results)
+    
+    async def _fetch_indeed_page_async(self, url: str, headers: Dict[str, str]) -> tuple:
+        """GET an Indeed page on the shared aiohttp session, returns (status, final_url, content)"""
+        async with _get_async_session().get(
+            url,
+            headers=_aiohttp_headers(headers),
+            timeout=aiohttp.ClientTimeout(total=25),
+            allow_redirects=True
+        ) as response:
+            content = await response.read()
+        return response.status, str(response.url), content
+    
+    def _indeed_request_headers(self, indeed_domain: str) -> Dict[str, str]:
+        # Enhanced headers to mimic real browser
+        enhanced_headers = self.headers.copy()
+        enhanced_headers.update({
+            'Referer': f'https://{indeed_domain}/',
+            'Origin': f'https://{indeed_domain}',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Cache-Control': 'no-cache',
+            'Pragma': 'no-cache',
+        })
+        if REQUESTS_CACHE_AVAILABLE:
+            # no-cache would make the HTTP cache skip its stored copy
+            del enhanced_headers['Cache-Control']
+            del enhanced_headers['Pragma']
+        return enhanced_headers
+    
+    def _parse_indeed_response(
+        self,
+        status_code: int,
+        response_url: str,
+        content: bytes,
+        query: str,
+        location: str,
+        max_results: int
+    ) -> List[Dict]:
+        """Parse and rank a fetched Indeed search page (empty list = fall back to browser automation)"""
+        print(f"📊 Indeed response status: {status_code}")
+        
+        if status_code == 200:
+            # Check if we got redirected to a captcha or error page
+            if _is_indeed_block(status_code, response_url, content):
+                print("🚫 Indeed is showing captcha or blocking request")
+            else:
+                # Debug: Check if page has job listings (on the raw bytes - no need to build the tree first)
+                page_bytes = content.lower()
+                if b'no jobs found' in page_bytes or b'try different keywords' in page_bytes:
+                    print("⚠️  Indeed shows 'no jobs found' message")
                 else:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    # Parse HTML
+                    soup = BeautifulSoup(content, HTML_PARSER)
+                    internships, scores = self._parse_indeed_html(soup, query, location, max_results * 2)
                     
-                    # Debug: Check if page has job listings
-                    page_text = soup.get_text().lower()
-                    if 'no jobs found' in page_text or 'try different keywords' in page_text:
-                        print("⚠️  Indeed shows 'no jobs found' message")
-                    else:
-                        # Parse HTML
-                        internships = self._parse_indeed_html(soup, query, location, max_results * 2)
+                    # Filter and sort by relevance
+                    if internships:
+                        # Filter out low-scoring jobs (adaptive filtering)
+                        max_score = max(scores)
+                        if len(scores) <= 5:
+                            min_score = 0.15
+                        elif max_score > 0.4:
+                            min_score = 0.2
+                        else:
+                            min_score = 0.25
                         
-                        # Filter and sort by relevance
-                        if internships:
-                            # Score each internship
-                            scored_internships = []
-                            for job in internships:
-                                score = self._calculate_relevance_score(
-                                    job['title'], 
-                                    job.get('description', ''),
-                                    job['location'],
-                                    query,
-                                    location
-                                )
-                                scored_internships.append((score, job))
-                            
-                            # Filter out low-scoring jobs (adaptive filtering)
-                            if scored_internships:
-                                max_score = max(s for s, _ in scored_internships)
-                                if len(scored_internships) <= 5:
-                                    min_score = 0.15
-                                elif max_score > 0.4:
-                                    min_score = 0.2
-                                else:
-                                    min_score = 0.25
-                            else:
-                                min_score = 0.2 if location else 0.15
-                            
-                            filtered_scored = [(s, j) for s, j in scored_internships if s >= min_score]
-                            
-                            # If filtering removed everything, be more lenient
-                            if not filtered_scored and scored_internships:
-                                filtered_scored = sorted(scored_internships, key=lambda x: x[0], reverse=True)[:max_results]
-                                print(f"⚠️  All jobs below threshold, returning top {len(filtered_scored)} anyway")
-                            
-                            # Sort by relevance score
-                            filtered_scored.sort(key=lambda x: x[0], reverse=True)
-                            internships = [job for _, job in filtered_scored[:max_results]]
-                            
-                            # Log results
-                            filtered_count = len(internships)
-                            total_count = len(scored_internships)
-                            print(f"📊 Filtered {total_count} jobs → {filtered_count} relevant internships")
-                            
-                            if location and internships:
-                                matching_locations = [j['location'] for _, j in internships]
-                                print(f"📍 Locations found: {', '.join(set(matching_locations[:5]))}")
-                            
-                            if internships:
-                                print(f"✅ BeautifulSoup scraping successful: {len(internships)} internships found")
-                                return internships
+                        # Sort by relevance score
+                        ranked = self._rank_by_score(scores)
+                        kept = [i for i in ranked if scores[i] >= min_score]
                         
-                        print("⚠️  BeautifulSoup found page but no jobs parsed - trying browser automation...")
-            elif response.status_code == 403:
-                print("🚫 Access forbidden (403) - trying browser automation...")
-            else:
-                print(f"⚠️  Unexpected status code {response.status_code} - trying browser automation...")
-        except Exception as e:
-            print(f"⚠️  BeautifulSoup scraping failed: {e}")
-            # Fallback to browser automation
+                        # If filtering removed everything, be more lenient
+                        if not kept:
+                            kept = ranked[:max_results]
+                            print(f"⚠️  All jobs below threshold, returning top {len(kept)} anyway")
+                        
+                        total_count = len(internships)
+                        internships = [internships[i] for i in kept[:max_results]]
+                        
+                        # Log results
+                        filtered_count = len(internships)
+                        print(f"📊 Filtered {total_count} jobs → {filtered_count} relevant internships")
+                        
+                        if location and internships:
+                            matching_locations = {j['location'] for j in internships[:5]}
+                            print(f"📍 Locations found: {', '.join(matching_locations)}")
+                        
+                        if internships:
+                            print(f"✅ BeautifulSoup scraping successful: {len(internships)} internships found")
+                            return internships
+                    
+                    print("⚠️  BeautifulSoup found page but no jobs parsed - trying browser automation...")
+        elif status_code == 403:
+            print("🚫 Access forbidden (403) - trying browser automation...")
+        else:
+            print(f"⚠️  Unexpected status code {status_code} - trying browser automation...")
         
+        return []
+    
+    def _scrape_indeed_with_selenium(self, url: str, query: str, location: str, max_results: int) -> List[Dict]:
+        """Render the Indeed search page in a browser and parse it"""
         # Strategy 2: Try Selenium (for JavaScript-heavy sites)
-        if SELENIUM_AVAILABLE:
+        selenium_key = f"selenium:{urlparse(url).netloc}"
+        if SELENIUM_AVAILABLE and _indeed_breaker.is_open(selenium_key):
+            print("⏭️  Selenium keeps failing on Indeed right now - skipping browser automation")
+        elif SELENIUM_AVAILABLE:
             try:
                 print("🚀 Using Selenium to bypass Cloudflare...")
                 page_source = self._scrape_with_selenium(
@@ -513,11 +1348,12 @@ class InternshipScraper:
                 
                 if page_source:
                     print(f"📄 Selenium retrieved {len(page_source)} characters of HTML")
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    internships = self._parse_indeed_html(soup, query, location, max_results * 2)
+                    soup = BeautifulSoup(page_source, HTML_PARSER)
+                    internships, _ = self._parse_indeed_html(soup, query, location, max_results * 2)
                     
                     if internships:
                         print(f"✅ Selenium scraping successful: {len(internships)} internships found")
+                        _indeed_breaker.record_success(selenium_key)
                         return internships
                     else:
                         print("⚠️  Selenium retrieved page but no jobs were parsed")
@@ -527,9 +1363,87 @@ class InternshipScraper:
                 print(f"⚠️  Selenium scraping failed: {e}")
             import traceback
             traceback.print_exc()
+            _indeed_breaker.record_failure(selenium_key)
         else:
             print("⏭️  Selenium not available")
         
+        return []
+    
+    def scrape_indeed(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
+        """Scrape internships from Indeed using BeautifulSoup + Requests, with Selenium as fallback"""
+        key = _indeed_results_key(query, location, max_results)
+        cached = _get_cached_indeed_results(key)
+        if cached is not None:
+            print(f"⚡ Indeed results for '{query}' served from cache")
+            return cached
+        
+        internships = self._scrape_indeed_uncached(query, location, max_results)
+        _cache_indeed_results(key, internships)
+        return internships
+    
+    def _scrape_indeed_uncached(self, query: str, location: str, max_results: int) -> List[Dict]:
+        indeed_domain, url = self._build_indeed_url(query, location)
+        
+        # Store original query for filtering
+        self._current_query = query.lower()
+        
+        print(f"🌐 Scraping Indeed ({indeed_domain}): {url}")
+        
+        # Strategy 1 is skipped while Indeed keeps blocking plain requests from this host
+        static_key = f"requests:{indeed_domain}"
+        if _indeed_breaker.is_open(static_key):
+            print("⏭️  Indeed is blocking plain requests right now - going straight to browser automation")
+        else:
+            # Strategy 1: Try BeautifulSoup + Requests first (simplest, fastest for static content)
+            try:
+                print("🚀 Using BeautifulSoup + Requests...")
+                # Add delay to be respectful
+                time.sleep(1)
+                
+                key = (url, max_results)
+                headers = self._indeed_request_headers(indeed_domain)
+                # requests-cache revalidates on its own; otherwise send our stored validators
+                conditional = not REQUESTS_CACHE_AVAILABLE
+                if conditional:
+                    headers.update(_conditional_headers(key))
+                
+                response = self.session.get(url, headers=headers, timeout=25, allow_redirects=True)
+                if response.status_code == 304:
+                    print("♻️  Indeed page not modified - reusing previous results")
+                    internships = _not_modified_results(key)
+                else:
+                    blocked = _is_indeed_block(response.status_code, response.url, response.content)
+                    next_page = None
+                    if response.status_code == 200 and not blocked:
+                        # Fetch the next results page while this one is parsed
+                        next_page = _prefetch_executor.submit(
+                            self.session.get,
+                            self._next_indeed_page_url(url),
+                            headers=self._indeed_request_headers(indeed_domain),
+                            timeout=25,
+                            allow_redirects=True
+                        )
+                    internships = self._parse_indeed_response(
+                        response.status_code, response.url, response.content, query, location, max_results
+                    )
+                    if next_page is not None:
+                        internships = self._add_next_indeed_page(next_page, internships, query, location, max_results)
+                    if conditional:
+                        _remember_validators(key, response.headers, internships)
+                    if blocked:
+                        _indeed_breaker.record_failure(static_key)
+                if internships:
+                    _indeed_breaker.record_success(static_key)
+                    return internships
+            except Exception as e:
+                print(f"⚠️  BeautifulSoup scraping failed: {e}")
+                # Fallback to browser automation
+        
+        # Strategy 2: Try Selenium (for JavaScript-heavy sites)
+        internships = self._scrape_indeed_with_selenium(url, query, location, max_results)
+        if internships:
+            return internships
+        
         # Final fallback: Try RSS feed
         print("🔄 Trying RSS feed as final fallback...")
         try:
@@ -541,186 +1455,211 @@ class InternshipScraper:
         
         return internships
     
-    def _parse_indeed_html(self, soup: BeautifulSoup, query: str, location: str, max_results: int) -> List[Dict]:
-        """Parse Indeed HTML to extract job listings"""
+    async def scrape_indeed_async(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
+        """
+        Async version of scrape_indeed - the page fetch doesn't block the event loop, so Indeed
+        can be scraped while other sources are in flight. Parsing and Selenium run in worker threads.
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.scrape_indeed, query, location, max_results)
+        
+        key = _indeed_results_key(query, location, max_results)
+        cached = _get_cached_indeed_results(key)
+        if cached is not None:
+            print(f"⚡ Indeed results for '{query}' served from cache")
+            return cached
+        
+        internships = await self._scrape_indeed_uncached_async(query, location, max_results)
+        _cache_indeed_results(key, internships)
+        return internships
+    
+    async def _scrape_indeed_uncached_async(self, query: str, location: str, max_results: int) -> List[Dict]:
+        indeed_domain, url = self._build_indeed_url(query, location)
+        
+        # Store original query for filtering
+        self._current_query = query.lower()
+        
+        print(f"🌐 Scraping Indeed ({indeed_domain}): {url}")
+        
+        # Strategy 1 is skipped while Indeed keeps blocking plain requests from this host
+        static_key = f"requests:{indeed_domain}"
+        if _indeed_breaker.is_open(static_key):
+            print("⏭️  Indeed is blocking plain requests right now - going straight to browser automation")
+        else:
+            # Strategy 1: aiohttp + BeautifulSoup
+            try:
+                print("🚀 Using BeautifulSoup + aiohttp...")
+                # Add delay to be respectful
+                await asyncio.sleep(1)
+                
+                key = (url, max_results)
+                headers = self._indeed_request_headers(indeed_domain)
+                headers.update(_conditional_headers(key))
+                async with _get_async_session().get(
+                    url,
+                    headers=_aiohttp_headers(headers),
+                    timeout=aiohttp.ClientTimeout(total=25),
+                    allow_redirects=True
+                ) as response:
+                    content = await response.read()
+                
+                if response.status == 304:
+                    print("♻️  Indeed page not modified - reusing previous results")
+                    internships = _not_modified_results(key)
+                else:
+                    blocked = _is_indeed_block(response.status, str(response.url), content)
+                    next_page = None
+                    if response.status == 200 and not blocked:
+                        # Fetch the next results page while this one is parsed
+                        next_page = asyncio.create_task(self._fetch_indeed_page_async(
+                            self._next_indeed_page_url(url), self._indeed_request_headers(indeed_domain)
+                        ))
+                    try:
+                        internships = await asyncio.to_thread(
+                            self._parse_indeed_response,
+                            response.status, str(response.url), content, query, location, max_results
+                        )
+                        if next_page is not None and len(internships) < max_results:
+                            try:
+                                status, page_url, page_content = await next_page
+                                more = await asyncio.to_thread(
+                                    self._parse_indeed_response,
+                                    status, page_url, page_content, query, location, max_results
+                                )
+                                internships = self._merge_indeed_pages(internships, more, max_results)
+                            except Exception as e:
+                                print(f"⚠️  Indeed next page failed: {e}")
+                    finally:
+                        if next_page is not None:
+                            next_page.cancel()
+                    _remember_validators(key, response.headers, internships)
+                    if blocked:
+                        _indeed_breaker.record_failure(static_key)
+                if internships:
+                    _indeed_breaker.record_success(static_key)
+                    return internships
+            except Exception as e:
+                print(f"⚠️  BeautifulSoup scraping failed: {e}")
+        
+        # Strategy 2: Selenium drives a real browser synchronously - keep it off the event loop
+        internships = await asyncio.to_thread(self._scrape_indeed_with_selenium, url, query, location, max_results)
+        if internships:
+            return internships
+        
+        # Final fallback: Try RSS feed
+        print("🔄 Trying RSS feed as final fallback...")
+        rss_results = await self.scrape_indeed_rss_async(query, location, max_results)
+        if rss_results:
+            return rss_results
+        
+        return internships
+    
+    def _parse_indeed_html(self, soup: BeautifulSoup, query: str, location: str, max_results: int) -> Tuple[List[Dict], List[float]]:
+        """Parse Indeed HTML to extract relevant job listings and their relevance scores"""
         internships = []
+        scores = []
+        scraped_at = datetime.now().isoformat()  # Shared by every card on the page
         
         # Method 1: Look for job cards with data-jk attribute (job key)
-        job_cards = soup.find_all('div', {'data-jk': True})
+        # (each lookup stops as soon as it has max_results cards)
+        job_cards = soup.find_all('div', {'data-jk': True}, limit=max_results)
         if not job_cards:
             # Method 2: Look for job_seen_beacon class
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
+            job_cards = soup.find_all('div', class_='job_seen_beacon', limit=max_results)
         if not job_cards:
             # Method 3: Look for job cards by structure
-            job_cards = soup.find_all('div', class_=re.compile(r'job.*card|card.*job', re.I))
+            job_cards = soup.find_all('div', class_=_JOB_CARD_RE, limit=max_results)
         if not job_cards:
             # Method 4: Look for any div with job-related classes
-            job_cards = soup.find_all('div', class_=lambda x: x and ('job' in ' '.join(x).lower() or 'result' in ' '.join(x).lower()))
+            job_cards = soup.find_all('div', class_=_HAS_JOB_RE, limit=max_results)
         
         print(f"📋 Found {len(job_cards)} potential job cards on Indeed")
         
-        # Process found job cards
-        for card in job_cards[:max_results]:
-            try:
-                # Extract job key for link
-                job_key = card.get('data-jk', '')
-                
-                # Find title - try multiple selectors (including India Indeed specific)
-                title_elem = (
-                    card.find('h2', class_='jobTitle') or
-                    card.find('h2', class_=re.compile(r'title', re.I)) or
-                    card.find('a', class_='jobTitle') or
-                    card.find('a', class_=re.compile(r'job.*title|title.*job', re.I)) or
-                    card.find('span', {'id': lambda x: x and 'jobTitle' in x.lower()}) or
-                    card.find('span', class_=re.compile(r'title', re.I)) or
-                    card.find('h2', {'data-testid': lambda x: x and 'title' in x.lower()}) or
-                    card.find('a', {'data-testid': lambda x: x and 'title' in x.lower()}) or
-                    card.find('h2') or
-                    card.find('h3') or
-                    card.find('a', href=re.compile(r'/viewjob|/jobs', re.I))  # Link to job page often has title
-                )
-                
-                # Find company
-                company_elem = (
-                    card.find('span', class_='companyName') or
-                    card.find('span', {'data-testid': 'company-name'}) or
-                    card.find('a', class_='companyName') or
-                    card.find('span', class_=re.compile(r'company', re.I))
-                )
-                
-                # Find location
-                location_elem = (
-                    card.find('div', class_='companyLocation') or
-                    card.find('div', {'data-testid': 'job-location'}) or
-                    card.find('span', class_='companyLocation') or
-                    card.find('div', class_=re.compile(r'location', re.I))
-                )
-                
-                # Find summary - try multiple selectors
-                summary_elem = (
-                    card.find('div', class_='job-snippet') or
-                    card.find('div', class_='summary') or
-                    card.find('span', class_='summary') or
-                    card.find('div', class_=re.compile(r'snippet|summary|description', re.I)) or
-                    card.find('span', class_=re.compile(r'snippet|summary|description', re.I)) or
-                    card.find('div', {'data-testid': lambda x: x and ('snippet' in x.lower() or 'summary' in x.lower())}) or
-                    card.find('ul', class_=re.compile(r'job.*requirement|requirement', re.I))  # Sometimes requirements are shown
-                )
-                
-                if title_elem:
-                    # Get title text - try to get from nested elements if main element is too short
-                    title = title_elem.get_text(strip=True)
-                    
-                    # If title is too short or generic, try to find nested link or span with better text
-                    if not title or len(title) < 5 or title.lower() in ['intern', 'internship', 'job']:
-                        # Try to find nested link with title
-                        nested_link = title_elem.find('a', href=True)
-                        if nested_link:
-                            nested_title = nested_link.get_text(strip=True)
-                            if nested_title and len(nested_title) > len(title):
-                                title = nested_title
-                        
-                        # Try to find nested span
-                        nested_span = title_elem.find('span')
-                        if nested_span:
-                            nested_title = nested_span.get_text(strip=True)
-                            if nested_title and len(nested_title) > len(title):
-                                title = nested_title
-                        
-                        # If still too short, try to get all text from the card's title area
-                        if not title or len(title) < 5:
-                            # Look for any text in the card that might be the title
-                            all_text = card.get_text(separator=' ', strip=True)
-                            # Try to extract meaningful title from first line
-                            first_line = all_text.split('\n')[0] if '\n' in all_text else all_text.split('.')[0]
-                            if first_line and len(first_line) > len(title):
-                                title = first_line[:100]  # Limit length
-                    
-                    if not title or len(title) < 3:
-                        continue
-                        
-                    company = company_elem.get_text(strip=True) if company_elem else "Company Not Specified"
-                    location_text = location_elem.get_text(strip=True) if location_elem else location or "Location Not Specified"
-                    
-                    # Extract summary - try to get more context if summary is missing or too short
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    # If summary is missing or too short, try to extract more context from the card
-                    if not summary or len(summary) < 20:
-                        # Get all text from card and remove title, company, location to get description
-                        all_card_text = card.get_text(separator=' ', strip=True)
-                        # Remove title, company, location from the text to get description
-                        text_parts = all_card_text.split()
-                        title_words = set(title.lower().split())
-                        company_words = set(company.lower().split())
-                        location_words = set(location_text.lower().split())
-                        
-                        # Filter out title, company, location words to get description
-                        desc_words = [w for w in text_parts if w.lower() not in title_words and w.lower() not in company_words and w.lower() not in location_words]
-                        if desc_words:
-                            summary = ' '.join(desc_words[:50])  # Take first 50 words
-                    
-                    # Fallback if still no summary
-                    if not summary or len(summary) < 10:
-                        summary = f"Internship opportunity for {query} position"
-                    
-                    # Build job link
-                    job_link = ""
-                    if job_key:
-                        # Determine domain from current context
-                        indeed_domain = 'in.indeed.com' if self._current_location and any(city in self._current_location for city in ['bangalore', 'banglore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune', 'coimbatore']) else 'www.indeed.com'
-                        job_link = f"https://{indeed_domain}/viewjob?jk={job_key}"
-                    else:
-                        link_elem = title_elem.find('a') if title_elem.name != 'a' else title_elem
-                        if not link_elem or link_elem.name != 'a':
-                            link_elem = card.find('a', href=True)
-                        
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            if href.startswith('/'):
-                                # Determine domain from current context
-                                indeed_domain = 'in.indeed.com' if self._current_location and any(city in self._current_location for city in ['bangalore', 'banglore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune', 'coimbatore']) else 'www.indeed.com'
-                                job_link = f"https://{indeed_domain}{href}"
-                            elif href.startswith('http'):
-                                job_link = href
-                    
-                    # Filter for relevance
-                    if self._is_relevant(title, summary, location_text, query, location):
-                        internships.append({
-                            'title': title,
-                            'company': company,
-                            'location': location_text,
-                            'description': summary,
-                            'source': 'Indeed',
-                            'url': job_link,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        print(f"  ✅ Found: {title} at {company} ({location_text})")
-                    else:
-                        print(f"  ⏭️  Skipped (not relevant): {title}")
-            except Exception as e:
-                print(f"  ⚠️  Error parsing Indeed job card: {e}")
-                continue
+        # Process found job cards - field extraction is independent per card, so large
+        # result pages are spread over worker processes (only those cards are serialized)
+        # Links point at the same domain the page was fetched from - resolved once per page
+        indeed_domain, _ = self._get_indeed_domain_and_location(location)
+        args = (repeat(query), repeat(location), repeat(indeed_domain), repeat(scraped_at))
+        if len(job_cards) >= PARALLEL_CARD_THRESHOLD:
+            card_htmls = [str(card) for card in job_cards]
+            jobs = _get_card_executor().map(_extract_indeed_card_html, card_htmls, *args, chunksize=8)
+        else:
+            jobs = map(_extract_indeed_card, job_cards, *args)
         
-        # Remove duplicates
+        profile = self._query_profile(query, location)
         seen_titles = set()
-        unique_internships = []
-        for job in internships:
+        for job in jobs:
+            if job is None:
+                continue
+            # Remove duplicates as we go - a title already accepted needs no second relevance check
             title_lower = job['title'].lower()
-            if title_lower not in seen_titles:
+            if title_lower in seen_titles:
+                continue
+            # Filter for relevance
+            relevant, score = self._evaluate(job['title'], job['description'], job['location'], profile, title_lower)
+            if relevant:
                 seen_titles.add(title_lower)
-                unique_internships.append(job)
+                internships.append(job)
+                scores.append(score)
+                logger.debug("✅ Found: %s at %s (%s)", job['title'], job['company'], job['location'])
+            else:
+                logger.debug("⏭️  Skipped (not relevant): %s", job['title'])
         
-        return unique_internships
+        return internships, scores
     
-    def _calculate_relevance_score(self, title: str, description: str, job_location: str, query: str, location: str) -> float:
-        """Calculate relevance score (0-1) for a job listing"""
-        title_lower = title.lower()
-        desc_lower = description.lower()
-        job_loc_lower = job_location.lower()
+    def _query_profile(self, query: str, location: str) -> QueryProfile:
+        """Query-side inputs of the relevance checks, computed once per search instead of per job"""
         query_lower = query.lower()
         loc_lower = location.lower() if location else ""
         
+        # Normalize location for comparison
+        loc_normalized = loc_lower.replace('banglore', 'bangalore')
+        location_variations = [
+            var for key, variations in LOCATION_VARIATIONS.items() if key in loc_lower for var in variations
+        ]
+        
+        return QueryProfile(
+            query_lower=query_lower,
+            # Key terms from the query (common words removed)
+            query_terms=tuple(term for term in query_lower.split() if term not in RELEVANCE_STOP_WORDS and len(term) > 2),
+            # Check if query is about software engineering
+            is_software_query=any(term in query_lower for term in SOFTWARE_QUERY_TERMS),
+            loc_lower=loc_lower,
+            # Every spelling of every location key the search mentions
+            location_variations_re=_substring_re(location_variations) if location_variations else None,
+            searching_india=any(ind in loc_normalized for ind in INDIAN_CITY_NAMES),
+            searching_bangalore=any(city in loc_lower for city in BANGALORE_SPELLINGS),
+        )
+    
+    def _rank_by_score(self, scores: List[float]) -> List[int]:
+        """Indices of scores from best to worst (stable, so ties keep page order)"""
+        return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    
+    def _calculate_relevance_score(
+        self,
+        title: str,
+        description: str,
+        job_location: str,
+        query: str,
+        location: str,
+        profile: Optional[QueryProfile] = None
+    ) -> float:
+        """Calculate relevance score (0-1) for a job listing
+        
+        Pass a profile from _query_profile when scoring many jobs for the same search.
+        """
+        if profile is None:
+            profile = self._query_profile(query, location)
+        return self._score_lowered(title.lower(), description.lower(), job_location.lower(), profile)
+    
+    @staticmethod
+    @lru_cache(maxsize=RELEVANCE_SCORE_CACHE_SIZE)
+    def _score_lowered(title_lower: str, desc_lower: str, job_loc_lower: str, profile: QueryProfile) -> float:
+        """_calculate_relevance_score on already-lowercased job fields
+        
+        Memoized: _is_relevant and the final ranking score the same jobs, and Indeed repeats cards.
+        """
+        query_terms = profile.query_terms
         score = 0.0
         
         # Base score for internships (ensures internships get some points even if query terms don't match)
@@ -735,35 +1674,18 @@ class InternshipScraper:
         if is_internship:
             score += 0.15  # Base score for any internship
         
-        # Extract key terms from query (remove common words)
-        stop_words = {'intern', 'internship', 'the', 'a', 'an', 'and', 'or', 'in', 'at', 'for', 'of', 'to'}
-        # Don't remove 'engineer' and 'developer' from stop words - they're important query terms
-        query_terms = [term for term in query_lower.split() if term not in stop_words and len(term) > 2]
-        
-        # Tech-related keywords that indicate relevance to software engineering
-        tech_keywords = {
-            'software': ['software', 'developer', 'programming', 'code', 'coding', 'application', 'app', 'web', 'mobile', 'backend', 'frontend', 'fullstack', 'full-stack'],
-            'engineer': ['engineer', 'engineering', 'developer', 'programmer', 'coder', 'architect', 'technical'],
-            'test': ['test', 'testing', 'qa', 'quality', 'automation', 'sdet'],
-            'ai': ['ai', 'artificial intelligence', 'machine learning', 'ml', 'data science', 'data scientist'],
-            'data': ['data', 'analyst', 'analytics', 'database', 'data engineer'],
-        }
-        
-        # Check if query is about software engineering
-        is_software_query = any(term in query_lower for term in ['software', 'developer', 'engineer', 'programming'])
-        
         # Title matching (most important)
         title_matches = sum(1 for term in query_terms if term in title_lower)
         if query_terms:
             score += (title_matches / len(query_terms)) * 0.5
         
         # Bonus: If it's a software engineering query, accept related tech roles
-        if is_software_query:
+        if profile.is_software_query:
             # Check for engineering/developer roles
-            if any(keyword in title_lower for keyword in ['engineer', 'developer', 'programmer', 'coder']):
+            if _ENGINEERING_ROLE_RE.search(title_lower):
                 score += 0.2  # Bonus for engineering roles
             # Check for related tech fields (QA, Test, AI, etc. are still relevant)
-            if any(keyword in title_lower for keyword in ['test', 'qa', 'quality', 'automation', 'ai', 'machine learning', 'data']):
+            if _RELATED_TECH_RE.search(title_lower):
                 score += 0.15  # Bonus for related tech fields
         
         # Description matching
@@ -773,66 +1695,77 @@ class InternshipScraper:
             score += (desc_matches / len(query_terms)) * 0.2
         
         # Location matching (strict)
-        if loc_lower:
-            location_variations = {
-                'remote': ['remote', 'work from home', 'wfh', 'anywhere', 'work from anywhere', 'work remotely'],
-                'bangalore': ['bangalore', 'bengaluru', 'bangaluru', 'banglore', 'bangalore, india', 'bengaluru, india', 'banglore, india'],  # Added misspelling
-                'mumbai': ['mumbai', 'bombay', 'mumbai, india', 'bombay, india'],
-                'delhi': ['delhi', 'ncr', 'new delhi', 'gurgaon', 'gurugram', 'noida', 'delhi, india', 'new delhi, india'],
-                'hyderabad': ['hyderabad', 'hyderabad, india'],
-                'chennai': ['chennai', 'madras', 'chennai, india', 'madras, india'],
-                'pune': ['pune', 'pune, india'],
-                'coimbatore': ['coimbatore', 'coimbatore, india'],
-                'india': ['india', 'indian'],
-            }
-            
-            matched = False
+        if profile.loc_lower:
             job_loc_lower_clean = job_loc_lower.replace(',', '').replace('.', '')
             
             # Check for exact location match
-            for key, variations in location_variations.items():
-                if key in loc_lower:
-                    # Check if job location contains any variation
-                    if any(var in job_loc_lower_clean for var in variations):
-                        score += 0.4  # Strong location match
-                        matched = True
-                        break
-            
+            matched = profile.location_variations_re is not None and profile.location_variations_re.search(job_loc_lower_clean)
+            if matched:
+                score += 0.4  # Strong location match
             # If location specified but doesn't match
-            if not matched:
-                # Check if it's a US location when searching for Indian city
-                us_indicators = ['ca', 'co', 'ny', 'tx', 'il', 'pa', 'ut', 'md', 'al', 'wa', 'or', 'az', 'fl', 'ma', 'nc', 'united states', 'usa', 'us', 'united states of america']
-                indian_cities = ['bangalore', 'banglore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune', 'coimbatore']
-                
-                # Normalize location for comparison
-                loc_normalized = loc_lower.replace('bangalore', 'bangalore').replace('banglore', 'bangalore')
-                
-                if any(ind in loc_normalized for ind in indian_cities):
-                    # Searching for Indian city
-                    if any(us_ind in job_loc_lower_clean for us_ind in us_indicators):
-                        # Job is in US, searching for India - heavily penalize but don't completely exclude
-                        # If query matches well, still include but with low score
-                        if score > 0.3:  # Query matches well
-                            score *= 0.15  # Reduce but don't eliminate
-                        else:
-                            score *= 0.05  # Very low score
+            elif profile.searching_india:
+                # Searching for Indian city
+                if _US_LOCATION_RE.search(job_loc_lower_clean):
+                    # Job is in US, searching for India - heavily penalize but don't completely exclude
+                    # If query matches well, still include but with low score
+                    if score > 0.3:  # Query matches well
+                        score *= 0.15  # Reduce but don't eliminate
                     else:
-                        # Not US, but also not matching Indian city - moderate penalty
-                        score *= 0.4
+                        score *= 0.05  # Very low score
                 else:
-                    # Location doesn't match at all (but not US vs India mismatch)
-                    score *= 0.5
+                    # Not US, but also not matching Indian city - moderate penalty
+                    score *= 0.4
+            else:
+                # Location doesn't match at all (but not US vs India mismatch)
+                score *= 0.5
         else:
             # No location specified, don't penalize
             score += 0.1
         
         return score
     
-    def _is_relevant(self, title: str, description: str, job_location: str, query: str, location: str) -> bool:
-        """Check if a job listing is relevant to the search query and location"""
-        title_lower = title.lower()
+    def _is_relevant(
+        self,
+        title: str,
+        description: str,
+        job_location: str,
+        query: str,
+        location: str,
+        profile: Optional[QueryProfile] = None,
+        title_lower: Optional[str] = None
+    ) -> bool:
+        """Check if a job listing is relevant to the search query and location
+        
+        Pass a profile from _query_profile when checking many jobs for the same search,
+        and title_lower when the caller has already lowercased the title.
+        """
+        if profile is None:
+            profile = self._query_profile(query, location)
+        return self._evaluate(title, description, job_location, profile, title_lower)[0]
+    
+    def _evaluate(
+        self,
+        title: str,
+        description: str,
+        job_location: str,
+        profile: QueryProfile,
+        title_lower: Optional[str] = None
+    ) -> Tuple[bool, float]:
+        """
+        Relevance check and relevance score of one job in a single pass.
+        
+        Args:
+            title, description, job_location: Job fields as scraped
+            profile: Search inputs from _query_profile
+            title_lower: The title already lowercased by the caller, if it has it
+        
+        Returns:
+            (is_relevant, score) - score is 0.0 for jobs rejected before scoring
+        """
+        if title_lower is None:
+            title_lower = title.lower()
         desc_lower = description.lower()
-        query_lower = query.lower()
+        query_lower = profile.query_lower
         
         # Check if it's an internship (be lenient - check title, description, or common patterns)
         is_internship = (
@@ -845,20 +1778,37 @@ class InternshipScraper:
         )
         
         # Special case: if title is just "Intern" or very generic, check description more carefully
-        is_generic_title = title_lower.strip() in ['intern', 'internship', 'job', 'position'] or len(title_lower.strip()) < 5
+        is_generic_title = title_lower.strip() in GENERIC_TITLES or len(title_lower.strip()) < 5
         
         if not is_internship:
-            return False  # Not an internship
+            return False, 0.0  # Not an internship
+        
+        job_loc_lower = job_location.lower() if job_location else ""
+        
+        # Searching an Indian city, US job, and nothing in the title matches the query: the location
+        # penalty keeps the score below every threshold (0.1), so skip scoring it
+        if (
+            profile.searching_india
+            and not any(term in title_lower for term in profile.query_terms)
+            and not (profile.is_software_query and (_ENGINEERING_ROLE_RE.search(title_lower) or _RELATED_TECH_RE.search(title_lower)))
+        ):
+            job_loc_lower_clean = job_loc_lower.replace(',', '').replace('.', '')
+            if _US_LOCATION_RE.search(job_loc_lower_clean) and not (
+                profile.location_variations_re is not None and profile.location_variations_re.search(job_loc_lower_clean)
+            ):
+                return False, 0.0
+        
+        # Use the scoring function for consistency (lowercased fields are shared with it)
+        score = self._score_lowered(title_lower, desc_lower, job_loc_lower, profile)
         
         # For generic titles like "Intern", be more lenient if description exists and contains relevant terms
         if is_generic_title and description and len(description) > 20:
             # Check if description contains query terms or internship-related terms
             desc_has_query = any(term in desc_lower for term in query_lower.split() if len(term) > 3)
-            desc_has_tech = any(term in desc_lower for term in ['software', 'developer', 'engineer', 'programming', 'code', 'technical', 'tech'])
+            desc_has_tech = _DESCRIPTION_TECH_RE.search(desc_lower) is not None
             if desc_has_query or desc_has_tech:
                 # Very lenient for generic titles with relevant descriptions
-                score = self._calculate_relevance_score(title, description, job_location, query, location)
-                return score >= 0.1  # Very low threshold
+                return score >= 0.1, score  # Very low threshold
         
         # Check if it's a general internship program/camp (more lenient matching)
         is_general_internship = (
@@ -868,22 +1818,18 @@ class InternshipScraper:
             'summer' in title_lower
         )
         
-        # Use the scoring function for consistency
-        score = self._calculate_relevance_score(title, description, job_location, query, location)
-        
         # Relevance threshold - be more lenient, especially for internships
-        loc_lower = location.lower() if location else ""
+        loc_lower = profile.loc_lower
         
         # Extract query terms for better matching
-        stop_words = {'intern', 'internship', 'the', 'a', 'an', 'and', 'or', 'in', 'at', 'for', 'of', 'to'}
-        query_terms = [term for term in query_lower.split() if term not in stop_words and len(term) > 2]
+        query_terms = profile.query_terms
         
         # Check if title contains any query terms
         title_has_query_terms = any(term in title_lower for term in query_terms) if query_terms else True
         
         # Also check for related tech roles (QA, Test, AI, etc. are relevant to software engineering)
-        is_software_query = any(term in query_lower for term in ['software', 'developer', 'engineer', 'programming'])
-        is_tech_role = any(keyword in title_lower for keyword in ['engineer', 'developer', 'programmer', 'test', 'qa', 'automation', 'ai', 'machine learning', 'data'])
+        is_software_query = profile.is_software_query
+        is_tech_role = _TECH_ROLE_RE.search(title_lower) is not None
         
         # If query is about software engineering and job is a tech role, consider it relevant
         if is_software_query and is_tech_role:
@@ -893,31 +1839,29 @@ class InternshipScraper:
         if is_general_internship:
             if loc_lower:
                 # For general programs, accept if location matches reasonably well
-                job_loc_lower = job_location.lower() if job_location else ""
-                location_keywords = ['bangalore', 'bengaluru', 'banglore', 'india', 'karnataka']
-                location_matches = any(keyword in job_loc_lower for keyword in location_keywords) if loc_lower and any(city in loc_lower for city in ['bangalore', 'bengaluru', 'banglore']) else True
+                location_matches = _BANGALORE_AREA_RE.search(job_loc_lower) is not None if profile.searching_bangalore else True
                 
                 if location_matches:
-                    return score >= 0.1  # Very lenient for general programs with location match
+                    return score >= 0.1, score  # Very lenient for general programs with location match
                 else:
-                    return score >= 0.15  # Still lenient even without location match
+                    return score >= 0.15, score  # Still lenient even without location match
             else:
-                return score >= 0.1  # Very lenient for general programs without location
+                return score >= 0.1, score  # Very lenient for general programs without location
         
         if loc_lower:
             # Location specified - be lenient if query matches or it's clearly an internship
             # For tech roles, be even more lenient
             if is_software_query and is_tech_role:
-                return score >= 0.15  # Very lenient for tech roles
+                return score >= 0.15, score  # Very lenient for tech roles
             elif title_has_query_terms or score > 0.2:
-                return score >= 0.2  # Lower threshold when query matches
+                return score >= 0.2, score  # Lower threshold when query matches
             else:
-                return score >= 0.25  # Slightly lower threshold for internships
+                return score >= 0.25, score  # Slightly lower threshold for internships
         else:
             # No location specified - be very lenient
             if is_software_query and is_tech_role:
-                return score >= 0.1  # Very lenient for tech roles without location
-            return score >= 0.15
+                return score >= 0.1, score  # Very lenient for tech roles without location
+            return score >= 0.15, score
     
     def scrape_linkedin(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
         """Scrape internships from LinkedIn (using search API simulation)"""
@@ -938,6 +1882,7 @@ class InternshipScraper:
     def scrape_glassdoor(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
         """Scrape internships from Glassdoor"""
         internships = []
+        scraped_at = datetime.now().isoformat()
         try:
             search_query = f"{query} intern internship"
             if location:
@@ -946,24 +1891,19 @@ class InternshipScraper:
             url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote_plus(search_query)}&jobType=internship"
             
             print(f"🌐 Scraping Glassdoor: {url}")
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=15)
             print(f"📊 Glassdoor response status: {response.status_code}")
             
             if response.status_code != 200:
                 print(f"⚠️  Glassdoor returned status {response.status_code}")
                 return internships
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Try multiple selectors for Glassdoor
-            job_cards = soup.find_all('li', class_='react-job-listing')
-            if not job_cards:
-                job_cards = soup.find_all('div', {'data-test': 'job-listing'})
-            if not job_cards:
-                job_cards = soup.find_all('li', {'data-test': 'job-listing'})
+            job_cards = _find_cards(soup, _glassdoor_card_tier, max_results)
             
             print(f"📋 Found {len(job_cards)} job cards on Glassdoor")
-            job_cards = job_cards[:max_results]
             
             for card in job_cards:
                 try:
@@ -973,9 +1913,9 @@ class InternshipScraper:
                     location_elem = card.find('span', class_='css-1buaf54') or card.find('span', {'data-test': 'job-location'})
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Company Not Specified"
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Location Not Specified"
+                        title = _element_text(title_elem)
+                        company = _element_text(company_elem) if company_elem else "Company Not Specified"
+                        location_text = _element_text(location_elem) if location_elem else location or "Location Not Specified"
                         
                         job_link = ""
                         if title_elem.get('href'):
@@ -993,11 +1933,11 @@ class InternshipScraper:
                                 'description': f"Internship opportunity at {company}",
                                 'source': 'Glassdoor',
                                 'url': job_link,
-                                'scraped_at': datetime.now().isoformat()
+                                'scraped_at': scraped_at
                             })
-                            print(f"  ✅ Found: {title} at {company}")
+                            logger.debug("✅ Found: %s at %s", title, company)
                 except Exception as e:
-                    print(f"  ⚠️  Error parsing Glassdoor job: {e}")
+                    logger.warning("⚠️  Error parsing Glassdoor job: %s", e)
                     continue
                     
         except Exception as e:
@@ -1009,30 +1949,26 @@ class InternshipScraper:
     def scrape_internships_com(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
         """Scrape from Internships.com"""
         internships = []
+        scraped_at = datetime.now().isoformat()
         try:
             url = f"https://www.internships.com/search?q={quote_plus(query)}"
             if location:
                 url += f"&location={quote_plus(location)}"
             
             print(f"🌐 Scraping Internships.com: {url}")
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=15)
             print(f"📊 Internships.com response status: {response.status_code}")
             
             if response.status_code != 200:
                 print(f"⚠️  Internships.com returned status {response.status_code}")
                 return internships
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Try multiple selectors
-            job_cards = soup.find_all('div', class_='internship')
-            if not job_cards:
-                job_cards = soup.find_all('div', {'data-internship-id': True})
-            if not job_cards:
-                job_cards = soup.find_all('article', class_='internship')
+            job_cards = _find_cards(soup, _internships_com_card_tier, max_results)
             
             print(f"📋 Found {len(job_cards)} job cards on Internships.com")
-            job_cards = job_cards[:max_results]
             
             for card in job_cards:
                 try:
@@ -1043,9 +1979,9 @@ class InternshipScraper:
                     link_elem = card.find('a', href=True)
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Company Not Specified"
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Location Not Specified"
+                        title = _element_text(title_elem)
+                        company = _element_text(company_elem) if company_elem else "Company Not Specified"
+                        location_text = _element_text(location_elem) if location_elem else location or "Location Not Specified"
                         
                         job_link = ""
                         if link_elem and link_elem.get('href'):
@@ -1063,11 +1999,11 @@ class InternshipScraper:
                                 'description': f"Internship opportunity at {company}",
                                 'source': 'Internships.com',
                                 'url': job_link,
-                                'scraped_at': datetime.now().isoformat()
+                                'scraped_at': scraped_at
                             })
-                            print(f"  ✅ Found: {title} at {company}")
+                            logger.debug("✅ Found: %s at %s", title, company)
                 except Exception as e:
-                    print(f"  ⚠️  Error parsing Internships.com job: {e}")
+                    logger.warning("⚠️  Error parsing Internships.com job: %s", e)
                     continue
                     
         except Exception as e:
@@ -1079,65 +2015,47 @@ class InternshipScraper:
     def scrape_skill_india(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
         """Scrape from Skill India Digital (skillindiadigital.gov.in)"""
         internships = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Skill India Digital is an Angular app, requires browser automation
             url = "https://www.skillindiadigital.gov.in/internship"
             print(f"🌐 Scraping Skill India Digital: {url}")
             
-            # Use Selenium for browser automation (with longer timeout for Angular apps)
+            # Use Selenium for browser automation (Angular app - the cards only exist after hydration)
             page_source = None
             if SELENIUM_AVAILABLE:
-                try:
-                    print("🚀 Using Selenium for Skill India Digital...")
-                    # Use longer timeout for Skill India Digital (Angular app takes time to load)
-                    page_source = self._scrape_with_selenium(
-                        url,
-                        wait_selector="mat-card, .internship-card, [class*='card'], app-root",
-                        timeout=60  # Increased timeout for Skill India Digital
-                    )
-                except Exception as e:
-                    print(f"⚠️  Selenium failed for Skill India: {e}")
-                    # Try one more time with even more lenient settings
-                    try:
-                        print("🔄 Retrying Skill India Digital with minimal wait...")
-                        page_source = self._scrape_with_selenium(
-                            url,
-                            wait_selector=None,  # Don't wait for specific selector
-                            timeout=45
-                        )
-                    except Exception as retry_e:
-                        print(f"⚠️  Retry also failed: {retry_e}")
+                print("🚀 Using Selenium for Skill India Digital...")
+                page_source = self._scrape_with_selenium(
+                    url,
+                    wait_selector="mat-card, .internship-card, [class*='card']",
+                    timeout=30
+                )
             
             if not page_source:
                 print("⚠️  Could not load Skill India Digital page (requires browser automation)")
                 return internships
             
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, HTML_PARSER)
             
             # Try multiple selectors for internship cards
-            # Angular Material cards or custom cards
-            job_cards = soup.find_all('mat-card')
-            if not job_cards:
-                job_cards = soup.find_all('div', class_=re.compile(r'card|internship', re.I))
-            if not job_cards:
-                job_cards = soup.find_all('article')
-            if not job_cards:
-                # Look for any element with internship-related classes
-                job_cards = soup.find_all('div', class_=lambda x: x and ('internship' in ' '.join(x).lower() or 'course' in ' '.join(x).lower()))
+            # Angular Material cards, custom cards, articles, then any internship-related div
+            job_cards = _find_cards(soup, _skill_india_card_tier, max_results)
             
             print(f"📋 Found {len(job_cards)} potential internship cards on Skill India Digital")
-            job_cards = job_cards[:max_results]
             
             for card in job_cards:
                 try:
+                    # Every candidate element below comes from this one walk of the card
+                    parts = _skill_india_card_parts(card)
+                    
                     # Try to find title - multiple selectors
                     title_elem = (
-                        card.find('h2') or
-                        card.find('h3') or
-                        card.find('h4') or
-                        card.find('mat-card-title') or
-                        card.find('div', class_=re.compile(r'title|heading', re.I)) or
-                        card.find('a', class_=re.compile(r'title', re.I))
+                        parts.get('h2') or
+                        parts.get('h3') or
+                        parts.get('h4') or
+                        parts.get('mat-card-title') or
+                        parts.get(('div', 'title')) or
+                        parts.get(('a', 'title'))
                     )
                     
                     if not title_elem:
@@ -1148,28 +2066,28 @@ class InternshipScraper:
                         else:
                             continue
                     else:
-                        title = title_elem.get_text(strip=True)
+                        title = _element_text(title_elem)
                     
                     if not title or len(title) < 5:
                         continue
                     
                     # Try to find provider/company
                     company_elem = (
-                        card.find('div', class_=re.compile(r'provider|company|organization', re.I)) or
-                        card.find('span', class_=re.compile(r'provider|company', re.I)) or
-                        card.find('mat-card-subtitle')
+                        parts.get(('div', 'company')) or
+                        parts.get(('span', 'company')) or
+                        parts.get('mat-card-subtitle')
                     )
-                    company = company_elem.get_text(strip=True) if company_elem else "Skill India Digital"
+                    company = _element_text(company_elem) if company_elem else "Skill India Digital"
                     
                     # Try to find location
                     location_elem = (
-                        card.find('div', class_=re.compile(r'location|place', re.I)) or
-                        card.find('span', class_=re.compile(r'location', re.I))
+                        parts.get(('div', 'location')) or
+                        parts.get(('span', 'location'))
                     )
-                    location_text = location_elem.get_text(strip=True) if location_elem else location or "India"
+                    location_text = _element_text(location_elem) if location_elem else location or "India"
                     
                     # Try to find link
-                    link_elem = card.find('a', href=True)
+                    link_elem = parts.get('link')
                     job_link = ""
                     if link_elem and link_elem.get('href'):
                         href = link_elem['href']
@@ -1182,15 +2100,11 @@ class InternshipScraper:
                     
                     # Try to find description
                     desc_elem = (
-                        card.find('p') or
-                        card.find('div', class_=re.compile(r'description|summary|content', re.I)) or
-                        card.find('mat-card-content')
+                        parts.get('p') or
+                        parts.get(('div', 'description')) or
+                        parts.get('mat-card-content')
                     )
-                    description = desc_elem.get_text(strip=True) if desc_elem else f"Internship opportunity: {title}"
-                    
-                    # Check if it's paid or free
-                    paid_elem = card.find(string=re.compile(r'paid|free', re.I))
-                    fee_info = paid_elem.strip() if paid_elem else ""
+                    description = _element_text(desc_elem) if desc_elem else f"Internship opportunity: {title}"
                     
                     internships.append({
                         'title': title,
@@ -1199,11 +2113,11 @@ class InternshipScraper:
                         'description': description[:500] if description else f"Internship opportunity: {title}",
                         'source': 'Skill India Digital',
                         'url': job_link,
-                        'scraped_at': datetime.now().isoformat()
+                        'scraped_at': scraped_at
                     })
-                    print(f"  ✅ Found: {title} at {company}")
+                    logger.debug("✅ Found: %s at %s", title, company)
                 except Exception as e:
-                    print(f"  ⚠️  Error parsing Skill India job: {e}")
+                    logger.warning("⚠️  Error parsing Skill India job: %s", e)
                     continue
                     
         except Exception as e:
@@ -1216,7 +2130,8 @@ class InternshipScraper:
     
     def scrape_all_sources(self, query: str, location: str = "", max_results_per_source: int = 10) -> List[Dict]:
         """Scrape from all available sources"""
-        all_internships = []
+        # Deduplicated as results arrive, keyed on title and company - the first listing per key wins
+        unique_internships = {}
         
         sources = [
             ('Indeed', self.scrape_indeed),
@@ -1226,25 +2141,23 @@ class InternshipScraper:
             ('Skill India Digital', self.scrape_skill_india),
         ]
         
-        for source_name, scraper_func in sources:
-            try:
-                internships = scraper_func(query, location, max_results_per_source)
-                all_internships.extend(internships)
-                print(f"Scraped {len(internships)} internships from {source_name}")
-            except Exception as e:
-                print(f"Error scraping {source_name}: {e}")
-                continue
-        
-        # Remove duplicates based on title and company
-        seen = set()
-        unique_internships = []
-        for internship in all_internships:
-            key = (internship['title'].lower(), internship['company'].lower())
-            if key not in seen:
-                seen.add(key)
-                unique_internships.append(internship)
+        # Every source is network- or browser-bound, so run them side by side and merge in source order
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [
+                (source_name, executor.submit(scraper_func, query, location, max_results_per_source))
+                for source_name, scraper_func in sources
+            ]
+            for source_name, future in futures:
+                try:
+                    internships = future.result()
+                    for internship in internships:
+                        unique_internships.setdefault((internship['title'].lower(), internship['company'].lower()), internship)
+                    print(f"Scraped {len(internships)} internships from {source_name}")
+                except Exception as e:
+                    print(f"Error scraping {source_name}: {e}")
+                    continue
         
-        return unique_internships
+        return list(unique_internships.values())
     
     def generate_sample_internships(self, query: str, location: str = "", count: int = 10) -> List[Dict]:
         """Generate sample internships when scraping fails (fallback)"""
@@ -1298,28 +2211,21 @@ class InternshipScraper:
                 f"Engineering Intern ({query})",
             ]
         
-        internships = []
-        for i in range(min(count, len(tech_companies))):
-            company_info = tech_companies[i]
-            company = company_info["name"]
-            title = title_templates[i % len(title_templates)]
-            
-            # Generate realistic descriptions
-            descriptions = [
-                f"Join {company} as a {title} and work on cutting-edge projects. Gain hands-on experience with industry-leading technologies and collaborate with world-class engineers.",
-                f"Exciting {title} opportunity at {company}. Work on real-world projects, receive mentorship from senior engineers, and contribute to products used by millions.",
-                f"{company} is seeking a {title} to join our team. You'll work on innovative projects, learn from experts, and make a real impact.",
-            ]
-            
-            internships.append({
+        scraped_at = datetime.now().isoformat()
+        sample_location = location or "Remote / Hybrid / On-site"
+        
+        # Companies in order, titles and descriptions rotating alongside them
+        samples = islice(zip(tech_companies, cycle(title_templates), cycle(SAMPLE_DESCRIPTIONS)), count)
+        return [
+            {
                 'title': title,
-                'company': company,
-                'location': location or "Remote / Hybrid / On-site",
-                'description': descriptions[i % len(descriptions)],
+                'company': company_info["name"],
+                'location': sample_location,
+                'description': description.format(company=company_info["name"], title=title),
                 'source': 'Sample',
                 'url': f"https://{company_info['domain']}/careers",
-                'scraped_at': datetime.now().isoformat()
-            })
-        
-        return internships
+                'scraped_at': scraped_at
+            }
+            for company_info, title, description in samples
+        ]
 
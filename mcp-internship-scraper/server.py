@@ -7,7 +7,10 @@ Provides tools to scrape internships from various job boards
 import asyncio
 import json
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypedDict
 from datetime import datetime
 import re
 
@@ -20,9 +23,220 @@ except ImportError:
     sys.exit(1)
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 from urllib.parse import quote_plus
 
+# Try to import aiohttp (concurrent fetching for scrape_all_sources_async)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+# Try to import uvloop (faster event loop for the fetch fan-out; not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+# Try to import orjson (faster encoding of tool responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Try to import cachetools (TTL cache for repeated searches)
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+    TTLCache = None
+
+# Prefer lxml's C tokenizer for BeautifulSoup; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Each parser only reads its source's job cards, so only those subtrees are built
+# (navigation, scripts and footers are skipped while parsing)
+INDEED_CARDS = SoupStrainer('div', class_='job_seen_beacon')
+LINKEDIN_CARDS = SoupStrainer('div', class_='base-card')
+GLASSDOOR_CARDS = SoupStrainer('li', class_='react-job-listing')
+INTERNSHIPS_COM_CARDS = SoupStrainer('div', class_='internship')
+
+# Max simultaneous page fetches on a temporary session in scrape_all_sources_async
+FETCH_CONCURRENCY = 8
+# Connection pool size for the long-lived session returned by get_session
+SESSION_MAX_CONNECTIONS = 100
+# In-flight requests allowed to any one job board, whatever session is used
+# (the connector queues the rest, so concurrent searches don't trip rate limits)
+MAX_REQUESTS_PER_HOST = 4
+# Parsed results per (source, search URL, max_results) - listings change slowly, but not that slowly
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 300
+# ETag / Last-Modified of pages whose results expired - re-checked with a conditional GET
+VALIDATOR_CACHE_TTL_SECONDS = 3600
+# Retries for the blocking requests session - transient server errors only, a 429 is not waited out
+HTTP_RETRY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    raise_on_status=False
+)
+
+
+class Internship(TypedDict):
+    """Shape of every scraped record (records stay plain dicts - they are serialized to JSON right away)"""
+    title: str
+    company: str
+    location: str
+    description: str
+    source: str
+    url: str
+    scraped_at: str
+
+
+# (tag name, attrs) passed to Tag.find / find_all
+Selector = Tuple[str, Dict[str, str]]
+
+
+class SourceSpec(NamedTuple):
+    """Where a job board's search page lives and where each field sits in its job cards"""
+    name: str
+    search_url: str                 # '{q}' is replaced by the quoted search query
+    strainer: SoupStrainer          # only these subtrees are built while parsing
+    card: Selector
+    title: Selector
+    company: Selector
+    location: Selector
+    summary: Optional[Selector] = None
+    link: Optional[Selector] = None  # None: the title element is the link itself
+    link_in_title: bool = False      # look for the link inside the title element rather than the card
+    link_base: str = ""              # prefixed to relative hrefs
+    company_required: bool = False   # skip cards without a company instead of saying "Not specified"
+    plain_query: bool = False        # search for the query as typed, without intern keywords or location
+
+
+# Source name -> SourceSpec, in the order sources are scraped and results merged
+SOURCE_SPECS: Dict[str, SourceSpec] = {spec.name: spec for spec in (
+    SourceSpec(
+        name='Indeed',
+        search_url='https://www.indeed.com/jobs?q={q}&jt=internship&start=0',
+        strainer=INDEED_CARDS,
+        card=('div', {'class': 'job_seen_beacon'}),
+        title=('h2', {'class': 'jobTitle'}),
+        company=('span', {'class': 'companyName'}),
+        location=('div', {'class': 'companyLocation'}),
+        summary=('div', {'class': 'job-snippet'}),
+        link=('a', {}),
+        link_in_title=True,
+        link_base='https://www.indeed.com',
+        company_required=True
+    ),
+    # LinkedIn has strict anti-scraping measures - in production, use the LinkedIn API
+    SourceSpec(
+        name='LinkedIn',
+        search_url='https://www.linkedin.com/jobs/search/?keywords={q}&f_JT=I&position=1&pageNum=0',
+        strainer=LINKEDIN_CARDS,
+        card=('div', {'class': 'base-card'}),
+        title=('h3', {'class': 'base-search-card__title'}),
+        company=('h4', {'class': 'base-search-card__subtitle'}),
+        location=('span', {'class': 'job-search-card__location'}),
+        link=('a', {'class': 'base-card__full-link'}),
+        company_required=True
+    ),
+    SourceSpec(
+        name='Glassdoor',
+        search_url='https://www.glassdoor.com/Job/jobs.htm?sc.keyword={q}&jobType=internship',
+        strainer=GLASSDOOR_CARDS,
+        card=('li', {'class': 'react-job-listing'}),
+        title=('a', {'data-test': 'job-link'}),
+        company=('div', {'class': 'd-flex'}),
+        location=('span', {'class': 'css-1buaf54'}),
+        link_base='https://www.glassdoor.com'
+    ),
+    SourceSpec(
+        name='Internships.com',
+        search_url='https://www.internships.com/search?q={q}',
+        strainer=INTERNSHIPS_COM_CARDS,
+        card=('div', {'class': 'internship'}),
+        title=('h3', {'class': 'title'}),
+        company=('div', {'class': 'company'}),
+        location=('div', {'class': 'location'}),
+        link=('a', {}),
+        plain_query=True
+    ),
+)}
+
+
+def dedupe_key(internship: Dict) -> Tuple[str, str]:
+    """Case- and whitespace-insensitive (title, company) key identifying the same posting across sources"""
+    return (
+        ' '.join(internship['title'].casefold().split()),
+        ' '.join(internship['company'].casefold().split())
+    )
+
+# "Apply via <source>" per source - there are only a handful of sources, so build each once
+_application_tips: Dict[str, str] = {}
+
+
+def to_backend_record(internship: Internship) -> Dict:
+    """Reshape a scraped record into the FastAPI backend's internship format"""
+    source = internship['source']
+    application_tips = _application_tips.get(source)
+    if application_tips is None:
+        application_tips = _application_tips.setdefault(source, f"Apply via {source}")
+    
+    # One dict literal per record (cheaper than copying a template and updating it);
+    # the empty skill/benefit fields share one immutable tuple instead of two new lists
+    return {
+        'title': internship['title'],
+        'company': internship['company'],
+        'description': internship.get('description', ''),
+        'location': internship['location'],
+        'type': 'Internship',
+        'duration': 'Not specified',
+        'requiredSkills': (),  # Could be extracted from description
+        'benefits': (),
+        'applicationTips': application_tips,
+        'matchScore': 75,  # Default score
+        'url': internship.get('url', ''),
+        'source': source,
+        'scraped_at': internship.get('scraped_at', '')
+    }
+
+
+def dumps(result: Any) -> str:
+    """Compact JSON for a tool response (no indentation - clients parse it, and it is much smaller)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result).decode()
+    return json.dumps(result)
+
+
+def _element_text(element) -> str:
+    """element.get_text(strip=True), without walking the subtree when it holds a single string"""
+    string = element.string
+    if type(string) is NavigableString:  # Not a Comment / CData etc, which get_text leaves out
+        return string.strip()
+    return element.get_text(strip=True)
+
+
+def run_async(coro):
+    """asyncio.run, on a uvloop event loop when uvloop is installed"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 # Initialize MCP Server
 server = Server("internship-scraper")
 
@@ -34,243 +248,388 @@ class InternshipScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # Keep-alive connection pool for the blocking path (reuses TCP/TLS connections across calls)
+        self.http = requests.Session()
+        self.http.headers.update(self.headers)
+        
+        # Long-lived aiohttp session, created by get_session inside the event loop that uses it
+        self._session = None
+        
+        # Recent results, shared by the sync (threaded) and async paths - None without cachetools
+        self._results = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS) if CACHETOOLS_AVAILABLE else None
+        # (conditional request headers, parsed results) per page, answered by a 304 once _results expires
+        self._validators = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=VALIDATOR_CACHE_TTL_SECONDS) if CACHETOOLS_AVAILABLE else None
+        self._results_lock = threading.Lock()
+        
+        # Source name -> where to search and how to read its job cards
+        self.sources = SOURCE_SPECS
+        
+        # One pooled connection per source thread in scrape_all_sources, plus retries
+        adapter = HTTPAdapter(
+            pool_connections=len(self.sources),
+            pool_maxsize=len(self.sources),
+            max_retries=HTTP_RETRY
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
     
-    def scrape_indeed(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
-        """Scrape internships from Indeed"""
-        internships = []
+    def _cached_results(self, key: Tuple[str, str, int]) -> Optional[List[Internship]]:
+        if self._results is None:
+            return None
+        with self._results_lock:
+            internships = self._results.get(key)
+        return list(internships) if internships is not None else None
+    
+    def _cache_results(self, key: Tuple[str, str, int], internships: List[Internship]):
+        # Empty pages are usually blocks or layout changes - worth retrying rather than remembering
+        if self._results is None or not internships:
+            return
+        with self._results_lock:
+            self._results[key] = list(internships)
+    
+    def _validated_results(self, key: Tuple[str, str, int]) -> Tuple[Optional[Dict[str, str]], Optional[List[Internship]]]:
+        """Conditional request headers for a page seen before, and the results parsed from it"""
+        if self._validators is None:
+            return None, None
+        with self._results_lock:
+            entry = self._validators.get(key)
+        if entry is None:
+            return None, None
+        return entry
+    
+    def _remember_validators(self, key: Tuple[str, str, int], response_headers, internships: List[Internship]):
+        if self._validators is None or not internships:
+            return
+        conditional_headers = {}
+        if response_headers.get('ETag'):
+            conditional_headers['If-None-Match'] = response_headers['ETag']
+        if response_headers.get('Last-Modified'):
+            conditional_headers['If-Modified-Since'] = response_headers['Last-Modified']
+        if conditional_headers:
+            with self._results_lock:
+                self._validators[key] = (conditional_headers, list(internships))
+    
+    def _scrape_source(self, source_name: str, query: str, location: str = "", max_results: int = 20) -> List[Internship]:
+        """Fetch one source's search page with requests and parse it"""
+        spec = self.sources[source_name]
         try:
-            # Indeed search URL
-            search_query = f"{query} intern internship"
-            if location:
-                search_query += f" {location}"
-            
-            url = f"https://www.indeed.com/jobs?q={quote_plus(search_query)}&jt=internship&start=0"
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
+            url = self._search_url(spec, query, location)
+            key = (source_name, url, max_results)
+            cached = self._cached_results(key)
+            if cached is not None:
+                return cached
+            
+            conditional_headers, validated = self._validated_results(key)
+            response = self.http.get(url, headers=conditional_headers, timeout=10)
+            if response.status_code == 304 and validated is not None:
+                # Page unchanged - reuse the earlier parse
+                self._cache_results(key, validated)
+                return list(validated)
             if response.status_code != 200:
-                return internships
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+                return []
             
-            # Find job listings (Indeed's structure)
-            job_cards = soup.find_all('div', class_='job_seen_beacon')[:max_results]
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h2', class_='jobTitle')
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    summary_elem = card.find('div', class_='job-snippet')
-                    
-                    if title_elem and company_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True)
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Not specified"
-                        summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                        
-                        # Get job link
-                        link_elem = title_elem.find('a')
-                        job_link = f"https://www.indeed.com{link_elem['href']}" if link_elem and link_elem.get('href') else ""
-                        
-                        internships.append({
-                            'title': title,
-                            'company': company,
-                            'location': location_text,
-                            'description': summary,
-                            'source': 'Indeed',
-                            'url': job_link,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                except Exception as e:
-                    print(f"Error parsing Indeed job: {e}")
-                    continue
-                    
+            internships = self._parse_cards(spec, response.content, location, max_results)
+            self._cache_results(key, internships)
+            self._remember_validators(key, response.headers, internships)
+            return internships
         except Exception as e:
-            print(f"Error scraping Indeed: {e}")
+            print(f"Error scraping {source_name}: {e}")
+            return []
+    
+    def get_session(self):
+        """
+        Shared aiohttp session for repeated async scrapes (None without aiohttp).
+        Must be called from inside the event loop that will use it; close it with aclose().
+        """
+        if not AIOHTTP_AVAILABLE:
+            return None
         
-        return internships
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(
+                    limit=SESSION_MAX_CONNECTIONS,
+                    limit_per_host=MAX_REQUESTS_PER_HOST,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+        return self._session
     
-    def scrape_linkedin(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
-        """Scrape internships from LinkedIn (using search API simulation)"""
-        internships = []
+    async def aclose(self):
+        """Close the shared aiohttp session and the requests connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.http.close()
+    
+    async def _scrape_source_async(
+        self,
+        session,
+        source_name: str,
+        query: str,
+        location: str = "",
+        max_results: int = 20
+    ) -> List[Internship]:
+        """Fetch one source's search page on a shared aiohttp session and parse it"""
+        spec = self.sources[source_name]
         try:
-            # LinkedIn requires authentication, so we'll use a simplified approach
-            # In production, use LinkedIn API or authenticated scraping
-            search_query = f"{query} intern internship"
-            if location:
-                search_query += f" {location}"
-            
-            # Note: LinkedIn has strict anti-scraping measures
-            # This is a placeholder - in production, use LinkedIn API
-            url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(search_query)}&f_JT=I&position=1&pageNum=0"
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code != 200:
-                return internships
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # LinkedIn job cards structure
-            job_cards = soup.find_all('div', class_='base-card')[:max_results]
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    
-                    if title_elem and company_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True)
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Not specified"
-                        job_link = link_elem['href'] if link_elem and link_elem.get('href') else ""
-                        
-                        internships.append({
-                            'title': title,
-                            'company': company,
-                            'location': location_text,
-                            'description': '',
-                            'source': 'LinkedIn',
-                            'url': job_link,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                except Exception as e:
-                    print(f"Error parsing LinkedIn job: {e}")
-                    continue
-                    
+            url = self._search_url(spec, query, location)
+            key = (source_name, url, max_results)
+            cached = self._cached_results(key)
+            if cached is not None:
+                return cached
+            
+            conditional_headers, validated = self._validated_results(key)
+            async with session.get(url, headers=conditional_headers) as response:
+                if response.status == 304 and validated is not None:
+                    # Page unchanged - reuse the earlier parse
+                    self._cache_results(key, validated)
+                    return list(validated)
+                if response.status != 200:
+                    return []
+                content = await response.read()
+                response_headers = response.headers
+            
+            # Parsing is CPU work - keep it off the event loop so other tool calls are still served
+            internships = await asyncio.to_thread(self._parse_cards, spec, content, location, max_results)
+            self._cache_results(key, internships)
+            self._remember_validators(key, response_headers, internships)
+            return internships
         except Exception as e:
-            print(f"Error scraping LinkedIn: {e}")
-        
-        return internships
+            print(f"Error scraping {source_name}: {e}")
+            return []
+    
+    async def scrape_source_async(
+        self,
+        source_name: str,
+        query: str,
+        location: str = "",
+        max_results: int = 20
+    ) -> List[Internship]:
+        """
+        Scrape one source without blocking the event loop: on the shared aiohttp session,
+        or the blocking requests path in a worker thread when aiohttp is not installed
+        """
+        session = self.get_session()
+        if session is None:
+            return await asyncio.to_thread(self._scrape_source, source_name, query, location, max_results)
+        return await self._scrape_source_async(session, source_name, query, location, max_results)
+    
+    def scrape_indeed(self, query: str, location: str = "", max_results: int = 20) -> List[Internship]:
+        """Scrape internships from Indeed"""
+        return self._scrape_source('Indeed', query, location, max_results)
     
-    def scrape_glassdoor(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
+    def scrape_linkedin(self, query: str, location: str = "", max_results: int = 20) -> List[Internship]:
+        """Scrape internships from LinkedIn (using search API simulation)"""
+        return self._scrape_source('LinkedIn', query, location, max_results)
+    
+    def scrape_glassdoor(self, query: str, location: str = "", max_results: int = 20) -> List[Internship]:
         """Scrape internships from Glassdoor"""
-        internships = []
-        try:
-            search_query = f"{query} intern internship"
-            if location:
-                search_query += f" {location}"
-            
-            url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote_plus(search_query)}&jobType=internship"
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code != 200:
-                return internships
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Glassdoor job listings
-            job_cards = soup.find_all('li', class_='react-job-listing')[:max_results]
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('a', {'data-test': 'job-link'})
-                    company_elem = card.find('div', class_='d-flex')
-                    location_elem = card.find('span', class_='css-1buaf54')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Not specified"
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Not specified"
-                        job_link = f"https://www.glassdoor.com{title_elem['href']}" if title_elem.get('href') else ""
-                        
-                        internships.append({
-                            'title': title,
-                            'company': company,
-                            'location': location_text,
-                            'description': '',
-                            'source': 'Glassdoor',
-                            'url': job_link,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                except Exception as e:
-                    print(f"Error parsing Glassdoor job: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Error scraping Glassdoor: {e}")
-        
-        return internships
+        return self._scrape_source('Glassdoor', query, location, max_results)
     
-    def scrape_internships_com(self, query: str, location: str = "", max_results: int = 20) -> List[Dict]:
+    def scrape_internships_com(self, query: str, location: str = "", max_results: int = 20) -> List[Internship]:
         """Scrape from Internships.com"""
+        return self._scrape_source('Internships.com', query, location, max_results)
+    
+    def _search_url(self, spec: SourceSpec, query: str, location: str = "") -> str:
+        if spec.plain_query:
+            return spec.search_url.format(q=quote_plus(query))
+        
+        search_query = f"{query} intern internship"
+        if location:
+            search_query += f" {location}"
+        
+        return spec.search_url.format(q=quote_plus(search_query))
+    
+    def _parse_cards(self, spec: SourceSpec, content: bytes, location: str = "", max_results: int = 20) -> List[Internship]:
+        """Read up to max_results job cards from a search page laid out as spec describes"""
         internships = []
-        try:
-            search_query = query.replace(' ', '-')
-            url = f"https://www.internships.com/search?q={quote_plus(query)}"
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code != 200:
-                return internships
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find internship listings
-            job_cards = soup.find_all('div', class_='internship')[:max_results]
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h3', class_='title')
-                    company_elem = card.find('div', class_='company')
-                    location_elem = card.find('div', class_='location')
-                    link_elem = card.find('a')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Not specified"
-                        location_text = location_elem.get_text(strip=True) if location_elem else location or "Not specified"
-                        job_link = link_elem['href'] if link_elem and link_elem.get('href') else ""
-                        
-                        internships.append({
-                            'title': title,
-                            'company': company,
-                            'location': location_text,
-                            'description': '',
-                            'source': 'Internships.com',
-                            'url': job_link,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                except Exception as e:
-                    print(f"Error parsing Internships.com job: {e}")
+        scraped_at = datetime.now().isoformat()
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=spec.strainer)
+        
+        job_cards = soup.find_all(*spec.card, limit=max_results)
+        
+        for card in job_cards:
+            try:
+                title_elem = card.find(*spec.title)
+                company_elem = card.find(*spec.company)
+                if not title_elem or (spec.company_required and not company_elem):
                     continue
-                    
-        except Exception as e:
-            print(f"Error scraping Internships.com: {e}")
+                
+                location_elem = card.find(*spec.location)
+                summary_elem = card.find(*spec.summary) if spec.summary else None
+                if spec.link is None:
+                    link_elem = title_elem
+                else:
+                    link_elem = (title_elem if spec.link_in_title else card).find(*spec.link)
+                href = link_elem.get('href') if link_elem else None
+                
+                internships.append({
+                    'title': _element_text(title_elem),
+                    'company': _element_text(company_elem) if company_elem else "Not specified",
+                    'location': _element_text(location_elem) if location_elem else location or "Not specified",
+                    'description': _element_text(summary_elem) if summary_elem else "",
+                    'source': spec.name,
+                    'url': f"{spec.link_base}{href}" if href else "",
+                    'scraped_at': scraped_at
+                })
+            except Exception as e:
+                print(f"Error parsing {spec.name} job: {e}")
+                continue
         
         return internships
     
-    def scrape_all_sources(self, query: str, location: str = "", max_results_per_source: int = 10) -> List[Dict]:
-        """Scrape from all available sources"""
-        all_internships = []
+    def scrape_all_sources(
+        self,
+        query: str,
+        location: str = "",
+        max_results_per_source: int = 10,
+        record_format: str = "raw"
+    ) -> List[Dict]:
+        """
+        Scrape from all available sources (in parallel threads - the work is all network I/O)
+        
+        Args:
+            query: Search query
+            location: Location filter
+            max_results_per_source: Maximum results per source
+            record_format: "raw" for scraped records, "backend" for the FastAPI backend's format
+        
+        Returns:
+            Deduplicated internships, in source order
+        """
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+            futures = {
+                executor.submit(self._scrape_source, source_name, query, location, max_results_per_source): source_name
+                for source_name in self.sources
+            }
+            for future in as_completed(futures):
+                source_name = futures[future]
+                results[source_name] = future.result()
+                print(f"Scraped {len(results[source_name])} internships from {source_name}")
+        
+        # Merge in source order so deduplication keeps the same listing every time
+        return self._dedupe(
+            chain.from_iterable(results[source_name] for source_name in self.sources),
+            record_format
+        )
+    
+    async def scrape_all_sources_async(
+        self,
+        query: str,
+        location: str = "",
+        max_results_per_source: int = 10,
+        sources: Optional[List[str]] = None,
+        session=None,
+        record_format: str = "raw"
+    ) -> List[Dict]:
+        """
+        Scrape all sources concurrently - total time is roughly the slowest source
+        instead of the sum of all of them
+        
+        Args:
+            query: Search query
+            location: Location filter
+            max_results_per_source: Maximum results per source
+            sources: Lowercase source names to use (e.g. ['indeed', 'linkedin']), all if empty
+            session: aiohttp.ClientSession to reuse; a temporary one is created if None
+            record_format: "raw" for scraped records, "backend" for the FastAPI backend's format
+        
+        Returns:
+            Deduplicated internships, in source order
+        """
+        results = {}
+        async for source_name, internships in self.iter_sources_async(
+            query, location, max_results_per_source, sources=sources, session=session
+        ):
+            results[source_name] = internships
+        
+        # Merge in source order so deduplication keeps the same listing every time
+        return self._dedupe(
+            chain.from_iterable(results.get(source_name, ()) for source_name in self.sources),
+            record_format
+        )
+    
+    async def iter_sources_async(
+        self,
+        query: str,
+        location: str = "",
+        max_results_per_source: int = 10,
+        sources: Optional[List[str]] = None,
+        session=None
+    ) -> AsyncIterator[Tuple[str, List[Internship]]]:
+        """
+        Scrape sources concurrently and yield each source's results as soon as it finishes
+        (fastest source first). Stopping iteration early cancels the remaining fetches.
         
-        sources = [
-            ('Indeed', self.scrape_indeed),
-            ('LinkedIn', self.scrape_linkedin),
-            ('Glassdoor', self.scrape_glassdoor),
-            ('Internships.com', self.scrape_internships_com),
+        Args:
+            query: Search query
+            location: Location filter
+            max_results_per_source: Maximum results per source
+            sources: Lowercase source names to use (e.g. ['indeed', 'linkedin']), all if empty
+            session: aiohttp.ClientSession to reuse; a temporary one is created if None
+        
+        Yields:
+            (source name, internships) tuples, not deduplicated
+        """
+        source_names = [
+            name for name in self.sources
+            if not sources or name.lower() in sources
         ]
         
-        for source_name, scraper_func in sources:
-            try:
-                internships = scraper_func(query, location, max_results_per_source)
-                all_internships.extend(internships)
-                print(f"Scraped {len(internships)} internships from {source_name}")
-            except Exception as e:
-                print(f"Error scraping {source_name}: {e}")
-                continue
+        owns_session = AIOHTTP_AVAILABLE and session is None
+        if owns_session:
+            session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(
+                    limit=FETCH_CONCURRENCY,
+                    limit_per_host=MAX_REQUESTS_PER_HOST,
+                    keepalive_timeout=10
+                )
+            )
         
-        # Remove duplicates based on title and company
-        seen = set()
-        unique_internships = []
-        for internship in all_internships:
-            key = (internship['title'].lower(), internship['company'].lower())
-            if key not in seen:
-                seen.add(key)
-                unique_internships.append(internship)
+        async def scrape(source_name: str) -> Tuple[str, List[Internship]]:
+            if AIOHTTP_AVAILABLE:
+                internships = await self._scrape_source_async(
+                    session, source_name, query, location, max_results_per_source
+                )
+            else:
+                # No aiohttp - still overlap the blocking requests calls in worker threads
+                internships = await asyncio.to_thread(
+                    self._scrape_source, source_name, query, location, max_results_per_source
+                )
+            return source_name, internships
         
-        return unique_internships
-
+        tasks = [asyncio.ensure_future(scrape(name)) for name in source_names]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                source_name, internships = await next_done
+                print(f"Scraped {len(internships)} internships from {source_name}")
+                yield source_name, internships
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_session:
+                await session.close()
+    
+    def _dedupe(self, internships: Iterable[Internship], record_format: str = "raw") -> List[Dict]:
+        """Remove duplicates based on title and company, reshaping the survivors in the same pass"""
+        to_record = to_backend_record if record_format == "backend" else None
+        # Keyed by dedupe_key - the first listing per key wins, and dicts keep insertion order
+        unique_internships = {}
+        for internship in internships:
+            key = dedupe_key(internship)
+            if key not in unique_internships:
+                unique_internships[key] = to_record(internship) if to_record else internship
+        
+        return list(unique_internships.values())
 
 # Initialize scraper
 scraper = InternshipScraper()
@@ -374,31 +733,13 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             if not query:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": "Query is required"}, indent=2)
+                    text=dumps({"error": "Query is required"})
                 )]
             
-            all_internships = []
-            
-            if not sources or "indeed" in sources:
-                all_internships.extend(scraper.scrape_indeed(query, location, max_results))
-            
-            if not sources or "linkedin" in sources:
-                all_internships.extend(scraper.scrape_linkedin(query, location, max_results))
-            
-            if not sources or "glassdoor" in sources:
-                all_internships.extend(scraper.scrape_glassdoor(query, location, max_results))
-            
-            if not sources or "internships.com" in sources:
-                all_internships.extend(scraper.scrape_internships_com(query, location, max_results))
-            
-            # Remove duplicates
-            seen = set()
-            unique_internships = []
-            for internship in all_internships:
-                key = (internship['title'].lower(), internship['company'].lower())
-                if key not in seen:
-                    seen.add(key)
-                    unique_internships.append(internship)
+            # All requested sources are fetched concurrently and deduplicated
+            unique_internships = await scraper.scrape_all_sources_async(
+                query, location, max_results, sources=sources, session=scraper.get_session()
+            )
             
             result = {
                 "success": True,
@@ -409,7 +750,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result, indent=2)
+                text=dumps(result)
             )]
         
         elif name == "scrape_indeed":
@@ -417,7 +758,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             location = arguments.get("location", "")
             max_results = arguments.get("max_results", 20)
             
-            internships = scraper.scrape_indeed(query, location, max_results)
+            internships = await scraper.scrape_source_async('Indeed', query, location, max_results)
             
             result = {
                 "success": True,
@@ -428,7 +769,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result, indent=2)
+                text=dumps(result)
             )]
         
         elif name == "scrape_linkedin":
@@ -436,7 +777,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             location = arguments.get("location", "")
             max_results = arguments.get("max_results", 20)
             
-            internships = scraper.scrape_linkedin(query, location, max_results)
+            internships = await scraper.scrape_source_async('LinkedIn', query, location, max_results)
             
             result = {
                 "success": True,
@@ -447,32 +788,34 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result, indent=2)
+                text=dumps(result)
             )]
         
         else:
             return [TextContent(
                 type="text",
-                text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2)
+                text=dumps({"error": f"Unknown tool: {name}"})
             )]
     
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=dumps({"error": str(e)})
         )]
 
 
 async def main():
     """Main entry point"""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
-
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        await scraper.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
 